@@ -0,0 +1,261 @@
+
+# batch_env.py
+# 자동 플레이 테스트와 봇 학습을 위해 여러 게임을 배열로 묶어 한 번에 진행하는 배치 환경을 정의하는 파일입니다.
+# 규칙은 solver.py와 같은 타일 단위 모델을 따릅니다. (이동 비용, 페르소나별 통과 규칙, 벽 부수기 쿨다운)
+# 이 모델은 Maze/Player의 픽셀 단위 이동을 그대로 재현하지 않으며, 움직이는 발판('H')은 빈 칸으로 보고 무시합니다.
+# 따라서 발판이 있는 레벨에서는 배치 환경의 진행이 실제 게임과 달라질 수 있습니다.
+# 실제 게임 규칙과 같은 결과가 필요하면 game_state.py의 GameState를 사용하세요.
+# 모든 게임의 상태(타일, 위치, 페르소나, 쿨다운)가 NumPy 배열에 있으므로 step() 한 번이 N개의 게임을 함께 진행합니다.
+#
+# 행동 번호:
+#   0 대기(1틱), 1~4 위/아래/왼쪽/오른쪽 이동, 5~7 카이론/에리다/모라로 전환, 8~11 위/아래/왼쪽/오른쪽 벽 부수기
+# 관찰: 게임별 (X 타일 좌표, Y 타일 좌표, 페르소나 번호, 남은 벽 부수기 쿨다운 틱)
+# 보상: 행동에 걸린 시간(틱)만큼 감점, 탈출구에 도착하면 EXIT_REWARD
+#
+# 실행 방법: python batch_env.py [게임 수] [스텝 수] [프로세스 수]  (무작위 행동으로 처리량 측정)
+
+import sys
+import time
+import multiprocessing
+import numpy as np
+from config import *
+from maze import level_to_tiles, TILE_EMPTY, TILE_WALL, TILE_TRANSPARENT, TILE_BREAKABLE, TILE_START, TILE_EXIT
+from solver import CHIRON, ERIDA, MORA, TICK_UNITS, MOVE_COST, BREAK_COOLDOWN_COST
+
+ACTION_WAIT = 0
+ACTION_MOVE = 1 # 1~4: 위, 아래, 왼쪽, 오른쪽
+ACTION_PERSONA = 5 # 5~7: 카이론, 에리다, 모라
+ACTION_BREAK = 8 # 8~11: 위, 아래, 왼쪽, 오른쪽
+ACTION_COUNT = 12
+EXIT_REWARD = 100.0 # 탈출구에 도착했을 때 받는 보상
+MAX_STEPS = 10000 # 한 게임의 최대 스텝 수 (넘으면 끝난 것으로 처리)
+
+
+class BatchEnv:
+    def __init__(self, levels, count, max_steps=MAX_STEPS):
+        """
+        배치 환경을 초기화합니다. 모든 레벨을 같은 크기로 맞춰(바깥은 벽) 하나의 배열에 쌓아 둡니다.
+        Args:
+            levels (list | LevelPack): 레벨 데이터 목록
+            count (int): 동시에 진행할 게임 수
+            max_steps (int): 한 게임의 최대 스텝 수
+        """
+        templates = [level_to_tiles(levels[i]) for i in range(len(levels))]
+        # 사방에 벽 한 줄을 더 두르면 이웃 타일을 볼 때 범위 검사가 필요 없습니다.
+        self.height = max(tiles.shape[0] for tiles in templates) + 2
+        self.width = max(tiles.shape[1] for tiles in templates) + 2
+        self.templates = np.full((len(templates), self.height * self.width), TILE_WALL, dtype=np.uint8)
+        self.starts = np.empty(len(templates), dtype=np.int64) # 레벨별 시작 위치 (1차원 인덱스)
+        self.goals = np.empty(len(templates), dtype=np.int64) # 레벨별 탈출구 위치 (1차원 인덱스)
+        for i, tiles in enumerate(templates):
+            padded = self.templates[i].reshape(self.height, self.width)
+            padded[1:tiles.shape[0] + 1, 1:tiles.shape[1] + 1] = tiles
+            self.starts[i] = np.flatnonzero(self.templates[i] == TILE_START)[0]
+            self.goals[i] = np.flatnonzero(self.templates[i] == TILE_EXIT)[0]
+        # 방향별 1차원 인덱스 변화량 (위, 아래, 왼쪽, 오른쪽)
+        self.offsets = np.array([-self.width, self.width, -1, 1], dtype=np.int64)
+        self.move_cost = np.array(MOVE_COST, dtype=np.int64)
+
+        self.count = count
+        self.max_steps = max_steps
+        self.rows = np.arange(count) # 게임 번호 (2차원 배열 인덱싱용)
+        self.tiles = np.empty((count, self.height * self.width), dtype=np.uint8) # 게임별 타일 (부서진 벽 반영)
+        self.level_ids = np.zeros(count, dtype=np.int64)
+        self.positions = np.zeros(count, dtype=np.int64) # 1차원 인덱스
+        self.personas = np.zeros(count, dtype=np.int64)
+        self.cooldowns = np.zeros(count, dtype=np.int64) # 남은 벽 부수기 쿨다운 (TICK_UNITS 단위)
+        self.steps = np.zeros(count, dtype=np.int64)
+        self.done = np.ones(count, dtype=bool)
+
+    def reset(self, level_ids, mask=None):
+        """
+        게임을 지정된 레벨의 처음 상태로 되돌립니다.
+        Args:
+            level_ids (int | numpy.ndarray): 게임별 레벨 인덱스 (count 길이, 정수 하나면 모든 게임에 적용)
+            mask (numpy.ndarray): 되돌릴 게임을 나타내는 bool 배열 (없으면 전체)
+        Returns:
+            numpy.ndarray: 전체 게임의 관찰 (count x 4)
+        """
+        level_ids = np.broadcast_to(np.asarray(level_ids, dtype=np.int64), (self.count,))
+        indices = slice(None) if mask is None else np.asarray(mask, dtype=bool)
+        level_ids = level_ids[indices]
+        self.level_ids[indices] = level_ids
+        self.tiles[indices] = self.templates[level_ids]
+        self.positions[indices] = self.starts[level_ids]
+        self.personas[indices] = CHIRON
+        self.cooldowns[indices] = 0
+        self.steps[indices] = 0
+        self.done[indices] = False
+        return self.observe()
+
+    def observe(self):
+        """
+        전체 게임의 관찰을 반환합니다.
+        Returns:
+            numpy.ndarray: (X, Y, 페르소나 번호, 남은 쿨다운 틱) int32 배열 (count x 4)
+        """
+        y, x = np.divmod(self.positions, self.width)
+        return np.stack((x - 1, y - 1, self.personas, -(-self.cooldowns // TICK_UNITS)), axis=1).astype(np.int32)
+
+    def step(self, actions):
+        """
+        모든 게임을 행동 하나씩 진행합니다. 이미 끝난 게임은 reset() 전까지 움직이지 않습니다.
+        Args:
+            actions (numpy.ndarray): 게임별 행동 번호 (count 길이의 정수 배열)
+        Returns:
+            tuple: (관찰 count x 4, 보상 float64 배열, 끝남 여부 bool 배열)
+        """
+        actions = np.where(self.done, -1, actions) # 끝난 게임은 어떤 행동도 하지 않음
+        rows, positions, personas = self.rows, self.positions, self.personas
+        cost = np.zeros(self.count, dtype=np.int64)
+
+        # 이동: 일반 벽과 부서지지 않은 벽은 막히고, 투명한 벽은 모라만 통과합니다. (막혀도 시간은 흐름)
+        moving = (actions >= ACTION_MOVE) & (actions < ACTION_PERSONA)
+        direction = np.clip(actions - ACTION_MOVE, 0, 3)
+        target = positions + self.offsets[direction]
+        code = self.tiles[rows, target]
+        passable = (code != TILE_WALL) & (code != TILE_BREAKABLE) & ((code != TILE_TRANSPARENT) | (personas == MORA))
+        np.copyto(positions, target, where=moving & passable)
+        cost = np.where(moving, self.move_cost[personas], cost)
+
+        # 페르소나 전환 (즉시 적용, 투명한 벽 안에서는 모라에서 다른 인격으로 바꿀 수 없음)
+        persona = actions - ACTION_PERSONA
+        switching = (persona >= 0) & (persona < 3)
+        switching &= (persona == MORA) | (self.tiles[rows, positions] != TILE_TRANSPARENT)
+        np.copyto(personas, persona, where=switching)
+
+        # 대기: 1틱
+        cost = np.where(actions == ACTION_WAIT, TICK_UNITS, cost)
+        np.maximum(self.cooldowns - cost, 0, out=self.cooldowns)
+
+        # 에리다 능력: 인접한 부술 수 있는 벽 부수기 (쿨다운 적용)
+        breaking = (actions >= ACTION_BREAK) & (personas == ERIDA) & (self.cooldowns == 0)
+        if breaking.any():
+            games = np.flatnonzero(breaking)
+            walls = positions[games] + self.offsets[actions[games] - ACTION_BREAK]
+            hit = self.tiles[games, walls] == TILE_BREAKABLE
+            self.tiles[games[hit], walls[hit]] = TILE_EMPTY
+            self.cooldowns[games[hit]] = BREAK_COOLDOWN_COST
+
+        # 보상과 종료 판정
+        active = actions >= 0
+        self.steps += active
+        arrived = active & (positions == self.goals[self.level_ids])
+        rewards = np.where(arrived, EXIT_REWARD, 0.0) - cost / TICK_UNITS
+        self.done |= arrived | (self.steps >= self.max_steps)
+        return self.observe(), rewards, self.done.copy()
+
+
+def _shard_worker(connection, levels, count, max_steps):
+    """
+    다른 프로세스에서 배치 환경 하나를 실행하며 명령을 처리합니다.
+    Args:
+        connection (multiprocessing.connection.Connection): 주 프로세스와 연결된 파이프
+        levels (list): 레벨 데이터 목록
+        count (int): 이 프로세스가 맡은 게임 수
+        max_steps (int): 한 게임의 최대 스텝 수
+    """
+    env = BatchEnv(levels, count, max_steps)
+    while True:
+        command, argument = connection.recv()
+        if command == "step":
+            connection.send(env.step(*argument))
+        elif command == "reset":
+            connection.send(env.reset(*argument))
+        else:
+            break
+    connection.close()
+
+
+class ShardedBatchEnv:
+    def __init__(self, levels, count, processes, max_steps=MAX_STEPS):
+        """
+        게임을 여러 프로세스에 나눠 진행하는 배치 환경을 초기화합니다. BatchEnv와 같은 방식으로 사용합니다.
+        Args:
+            levels (list | LevelPack): 레벨 데이터 목록 (프로세스로 보낼 수 있도록 타일 배열 목록으로 변환)
+            count (int): 전체 게임 수
+            processes (int): 사용할 프로세스 수
+            max_steps (int): 한 게임의 최대 스텝 수
+        """
+        levels = [level_to_tiles(levels[i]) for i in range(len(levels))]
+        self.count = count
+        self.bounds = np.linspace(0, count, processes + 1).astype(int) # 프로세스별 게임 범위
+        self.connections = []
+        self.workers = []
+        for start, end in zip(self.bounds[:-1], self.bounds[1:]):
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_shard_worker, args=(child, levels, int(end - start), max_steps),
+                                             daemon=True)
+            worker.start()
+            self.connections.append(parent)
+            self.workers.append(worker)
+
+    def _broadcast(self, command, *values):
+        """
+        게임 범위별로 나눈 인자(전체 게임 길이의 배열, None은 그대로 전달)를 각 프로세스에 보내고 결과를 모읍니다.
+        """
+        for connection, start, end in zip(self.connections, self.bounds[:-1], self.bounds[1:]):
+            connection.send((command, tuple(value[start:end] if value is not None else None for value in values)))
+        return [connection.recv() for connection in self.connections]
+
+    def reset(self, level_ids, mask=None):
+        """
+        게임을 지정된 레벨의 처음 상태로 되돌립니다.
+        Args:
+            level_ids (int | numpy.ndarray): 게임별 레벨 인덱스 (전체 게임 길이, 정수 하나면 모든 게임에 적용)
+            mask (numpy.ndarray): 되돌릴 게임을 나타내는 bool 배열 (없으면 전체)
+        Returns:
+            numpy.ndarray: 전체 게임의 관찰
+        """
+        level_ids = np.broadcast_to(np.asarray(level_ids, dtype=np.int64), (self.count,))
+        return np.concatenate(self._broadcast("reset", level_ids, mask))
+
+    def step(self, actions):
+        """
+        모든 게임을 행동 하나씩 진행합니다.
+        Args:
+            actions (numpy.ndarray): 게임별 행동 번호
+        Returns:
+            tuple: (관찰, 보상, 끝남 여부) 배열
+        """
+        results = self._broadcast("step", np.asarray(actions))
+        return tuple(np.concatenate(parts) for parts in zip(*results))
+
+    def close(self):
+        """
+        작업 프로세스를 종료합니다.
+        """
+        for connection in self.connections:
+            connection.send(("close", None))
+        for worker in self.workers:
+            worker.join()
+
+
+def main(argv):
+    """
+    무작위 행동으로 배치 환경의 처리량(초당 게임 스텝 수)을 측정합니다.
+    """
+    from levels import LEVELS
+    count = int(argv[1]) if len(argv) > 1 else 4096
+    steps = int(argv[2]) if len(argv) > 2 else 1000
+    processes = int(argv[3]) if len(argv) > 3 else 1
+    env = BatchEnv(LEVELS, count) if processes == 1 else ShardedBatchEnv(LEVELS, count, processes)
+    rng = np.random.default_rng(0)
+    level_ids = np.arange(count) % len(LEVELS)
+    env.reset(level_ids)
+    actions = rng.integers(0, ACTION_COUNT, size=(steps, count))
+    finished = 0
+    start = time.perf_counter()
+    for step_actions in actions:
+        _, _, done = env.step(step_actions)
+        if done.any():
+            finished += int(done.sum())
+            env.reset(level_ids, done) # 끝난 게임만 다시 시작
+    elapsed = time.perf_counter() - start
+    if processes != 1:
+        env.close()
+    print(f"{count * steps / elapsed:,.0f} agent-steps/s ({count} games x {steps} steps in {elapsed:.2f}s, {finished} finished)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,230 @@
+
+# benchmark.py
+# 게임의 주요 연산(미로 생성, 경로 탐색, 플레이어 이동, 벽 부수기, 미로 그리기, 한 프레임 전체)의
+# 실행 시간을 측정하는 벤치마크 파일입니다. SDL의 dummy 비디오 드라이버로 창 없이 실행됩니다.
+#
+# 실행 방법:
+#   python benchmark.py                              (결과 JSON을 표준 출력으로 출력)
+#   python benchmark.py --output baseline.json       (결과를 파일로 저장)
+#   python benchmark.py --compare baseline.json      (저장된 기준과 비교하여 느려진 항목이 있으면 종료 코드 1)
+#   python benchmark.py --quick                      (큰 합성 미로를 제외하고 빠르게 측정)
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # 창 없이 실행
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import numpy as np
+import pygame
+from config import *
+from levels import LEVELS
+from maze import Maze, TILE_BREAKABLE
+from pathfinder import HierarchicalPathfinder
+from player import Player
+from camera import Camera
+from game_state import GameState, Inputs
+from renderer import DirtyRectRenderer
+from hud import Hud, TextCache
+from generator import generate_tiles
+from telemetry import TelemetrySampler
+
+SYNTHETIC_SIZES = ((20, 15), (100, 100), (500, 500), (1000, 1000)) # 합성 미로 크기 (가로, 세로)
+QUICK_SIZES = ((20, 15), (100, 100))
+TIME_BUDGET = 0.2 # 항목별 최소 측정 시간 (초)
+MAX_SAMPLES = 2000 # 항목별 최대 측정 횟수
+DEFAULT_THRESHOLD = 0.25 # 기준보다 이 비율 이상 느려지면 성능 저하로 판단
+
+
+def measure(run, setup=None):
+    """
+    함수를 반복 실행하며 한 번 실행에 걸리는 시간을 측정합니다.
+    Args:
+        run (callable): 측정할 함수 (setup의 반환값을 인자로 받음)
+        setup (callable): 매 실행 전에 호출되는 준비 함수 (측정 시간에서 제외)
+    Returns:
+        dict: 측정 결과 (나노초 단위 중앙값/최솟값/평균과 실행 횟수)
+    """
+    samples = []
+    spent = 0.0
+    gc.collect()
+    gc.disable() # timeit과 같이 측정 중에는 가비지 컬렉션을 멈춤
+    try:
+        while len(samples) < MAX_SAMPLES and (spent < TIME_BUDGET or len(samples) < 3):
+            argument = setup() if setup is not None else None
+            start = time.perf_counter_ns()
+            run(argument)
+            elapsed = time.perf_counter_ns() - start
+            samples.append(elapsed)
+            spent += elapsed / 1e9
+    finally:
+        gc.enable()
+    return {
+        "median_ns": int(statistics.median(samples)),
+        "min_ns": min(samples),
+        "mean_ns": int(statistics.fmean(samples)),
+        "samples": len(samples),
+    }
+
+
+def benchmark_level(name, level, screen, results):
+    """
+    한 레벨에 대해 모든 항목을 측정하여 results에 추가합니다.
+    Args:
+        name (str): 결과 이름에 붙일 레벨 이름
+        level (list | numpy.ndarray): 레벨 데이터
+        screen (pygame.Surface): 그리기 대상 화면
+        results (dict): 결과를 저장할 딕셔너리
+    """
+    maze = Maze(level)
+    results[f"maze_init/{name}"] = measure(lambda _: Maze(level))
+    results[f"find_path/{name}"] = measure(lambda _: maze.find_path(maze.start_pos, maze.end_pos))
+    results[f"find_path_flat/{name}"] = measure(lambda _: maze.find_path_flat(maze.start_pos, maze.end_pos))
+    if maze.pathfinder is not None:
+        # 계층적 경로 탐색을 쓰는 큰 미로: 클러스터 그래프가 없는 상태의 첫 탐색과, 모든 클러스터 그래프를 미리 만드는 비용
+        results[f"find_path_cold/{name}"] = measure(lambda pathfinder: pathfinder.find_path(maze.start_pos, maze.end_pos),
+                                                    lambda: HierarchicalPathfinder(maze.hint_cost))
+        results[f"pathfinder_build/{name}"] = measure(lambda _: HierarchicalPathfinder(maze.hint_cost).build(maze.end_pos))
+
+    # 플레이어 이동: 오른쪽과 아래로 번갈아 움직이며 벽/발판 충돌 처리를 포함해 측정
+    player = Player(*maze.start_pos)
+    directions = [(1, 0)] * 20 + [(0, 1)] * 20 + [(-1, 0)] * 20 + [(0, -1)] * 20
+    step = iter(range(1 << 62))
+    results[f"player_move/{name}"] = measure(lambda _: player.move(*directions[next(step) % len(directions)], maze))
+
+    # 벽 부수기: 부술 수 있는 벽 옆에 플레이어를 세우고 그 벽을 바라보게 한 뒤 측정
+    walls = [(int(x), int(y)) for y, x in np.argwhere(maze.tiles == TILE_BREAKABLE)]
+    if walls:
+        target = [Maze(level)]
+        walls_left = list(walls)
+        breaker = Player(0, 0)
+
+        def place_breaker():
+            if not walls_left: # 모든 벽을 부쉈으면 새 미로로 다시 시작 (측정 시간에서 제외)
+                target[0] = Maze(level)
+                walls_left.extend(walls)
+            x, y = walls_left.pop()
+            breaker.rect.topleft = ((x - 1) * TILE_SIZE, y * TILE_SIZE)
+            breaker.last_dx, breaker.last_dy = 1, 0
+            return target[0]
+        results[f"break_wall/{name}"] = measure(breaker.break_wall, place_breaker)
+
+    # 미로 그리기: 플레이어 주변 뷰포트의 청크와 발판을 그림
+    camera = Camera()
+    camera.follow(player.rect, maze.tile_width * TILE_SIZE, maze.tile_height * TILE_SIZE)
+    results[f"maze_draw/{name}"] = measure(lambda _: maze.draw(screen, camera))
+
+    # 한 프레임 전체: 시뮬레이션 1틱 + 카메라 + 변경 영역 렌더링 + HUD
+    state = GameState([level])
+    inputs = Inputs()
+    renderer = DirtyRectRenderer(screen)
+    hud = Hud(TextCache())
+    frame_camera = Camera()
+
+    def draw_hud(surface):
+        hud.update(state.player.persona, state.hint_cooldown_timer, state.break_wall_cooldown_timer)
+        return hud.draw(surface)
+
+    def frame(_):
+        tick = state.tick
+        inputs.dx, inputs.dy = directions[tick % len(directions)]
+        state.step(inputs)
+        maze = state.maze
+        frame_camera.follow(state.player.rect, maze.tile_width * TILE_SIZE, maze.tile_height * TILE_SIZE)
+        renderer.render(maze, state.player, state.visible_hint(), draw_hud, frame_camera)
+    results[f"full_frame/{name}"] = measure(frame)
+
+    # 텔레메트리 샘플링: 시뮬레이션 1틱을 진행한 뒤(측정 시간에서 제외) 그 틱의 상태를 확인
+    sampler = TelemetrySampler(os.devnull, state)
+
+    def step_state():
+        inputs.dx, inputs.dy = directions[state.tick % len(directions)]
+        state.step(inputs)
+        return state
+    results[f"telemetry_sample/{name}"] = measure(sampler.sample, step_state)
+    sampler.close()
+
+
+def run_benchmarks(sizes):
+    """
+    기본 레벨과 합성 미로에 대해 벤치마크를 실행합니다.
+    Args:
+        sizes (tuple): 합성 미로 크기 목록
+    Returns:
+        dict: 환경 정보와 측정 결과
+    """
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = {}
+    for index, level in enumerate(LEVELS):
+        benchmark_level(f"level{index + 1}", level, screen, results)
+    for width, height in sizes:
+        benchmark_level(f"synthetic_{width}x{height}", generate_tiles(width, height, seed=0), screen, results)
+    pygame.quit()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    현재 결과를 기준 결과와 비교하여 느려진 항목을 찾습니다.
+    Args:
+        current (dict): 현재 벤치마크 결과
+        baseline (dict): 기준 벤치마크 결과
+        threshold (float): 허용 비율 (0.25면 25%까지 느려져도 허용)
+    Returns:
+        list: (항목 이름, 기준 중앙값, 현재 중앙값, 비율) 튜플 리스트
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or base["median_ns"] == 0 or base["min_ns"] == 0:
+            continue
+        ratio = result["median_ns"] / base["median_ns"]
+        # 중앙값과 최솟값이 모두 느려졌을 때만 성능 저하로 판단하여 일시적인 잡음을 걸러냅니다.
+        if ratio > 1.0 + threshold and result["min_ns"] > base["min_ns"] * (1.0 + threshold):
+            regressions.append((name, base["median_ns"], result["median_ns"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Persona Maze benchmarks")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용하는 느려짐 비율")
+    parser.add_argument("--quick", action="store_true", help="큰 합성 미로를 제외")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(QUICK_SIZES if args.quick else SYNTHETIC_SIZES)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for name, base, now, ratio in regressions:
+            print(f"REGRESSION {name}: {base / 1e3:.1f}us -> {now / 1e3:.1f}us ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
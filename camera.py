@@ -0,0 +1,54 @@
+
+# camera.py
+# 화면보다 큰 미로에서 플레이어를 따라가는 카메라(뷰포트)를 정의하는 파일입니다.
+# 미로의 모든 요소는 월드 좌표(픽셀)로 저장되고, 화면에 그릴 때만 카메라 위치만큼 이동합니다.
+
+import pygame
+from config import *
+
+class Camera:
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """
+        카메라를 초기화합니다.
+        Args:
+            width (int): 뷰포트 너비 (픽셀)
+            height (int): 뷰포트 높이 (픽셀)
+        """
+        self.rect = pygame.Rect(0, 0, width, height) # 월드 좌표계에서 화면에 보이는 영역
+
+    def follow(self, target, world_width, world_height):
+        """
+        대상이 화면 중앙에 오도록 카메라를 옮기되, 월드 밖은 보이지 않도록 범위를 제한합니다.
+        Args:
+            target (pygame.Rect): 따라갈 대상 영역 (월드 좌표)
+            world_width (int): 월드 너비 (픽셀)
+            world_height (int): 월드 높이 (픽셀)
+        Returns:
+            bool: 카메라 위치가 바뀌었으면 True
+        """
+        x = min(max(target.centerx - self.rect.width // 2, 0), max(world_width - self.rect.width, 0))
+        y = min(max(target.centery - self.rect.height // 2, 0), max(world_height - self.rect.height, 0))
+        if (x, y) == self.rect.topleft:
+            return False
+        self.rect.topleft = (x, y)
+        return True
+
+    def apply(self, rect):
+        """
+        월드 좌표 Rect를 화면 좌표 Rect로 변환합니다.
+        Args:
+            rect (pygame.Rect): 월드 좌표 영역
+        Returns:
+            pygame.Rect: 화면 좌표 영역 (새 객체)
+        """
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, rect):
+        """
+        화면 좌표 Rect를 월드 좌표 Rect로 변환합니다.
+        Args:
+            rect (pygame.Rect): 화면 좌표 영역
+        Returns:
+            pygame.Rect: 월드 좌표 영역 (새 객체)
+        """
+        return rect.move(self.rect.x, self.rect.y)
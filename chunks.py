@@ -0,0 +1,125 @@
+
+# chunks.py
+# 미로를 CHUNK_TILES x CHUNK_TILES 타일 크기의 청크로 나누어 관리하는 파일입니다.
+# 각 청크는 Maze.tiles의 일부를 가리키는 뷰와, 처음 보일 때 만들어지는 정적 레이어 Surface를 가집니다.
+# 뷰포트와 겹치는 청크만 그리고, 카메라에서 멀어진 청크의 Surface는 캐시에서 제거합니다.
+
+import pygame
+from collections import OrderedDict
+from config import *
+
+def chunk_range(world_rect, margin=0):
+    """
+    월드 좌표 영역과 겹치는 청크 좌표 범위를 계산합니다.
+    Args:
+        world_rect (pygame.Rect): 월드 좌표 영역 (픽셀)
+        margin (int): 사방으로 더 포함할 청크 수
+    Returns:
+        tuple: (왼쪽, 위, 오른쪽, 아래) 청크 좌표 (오른쪽/아래 포함)
+    """
+    chunk_pixels = CHUNK_TILES * TILE_SIZE
+    return (world_rect.left // chunk_pixels - margin,
+            world_rect.top // chunk_pixels - margin,
+            (world_rect.right - 1) // chunk_pixels + margin,
+            (world_rect.bottom - 1) // chunk_pixels + margin)
+
+
+class ChunkedLayer:
+    def __init__(self, maze, palette, max_cached=CHUNK_CACHE_SIZE):
+        """
+        청크 단위 정적 레이어를 초기화합니다. Surface는 청크가 처음 보일 때 만들어집니다.
+        Args:
+            maze (Maze): 타일 배열을 가진 미로 객체
+            palette (numpy.ndarray): 타일 코드 -> RGB 색상 팔레트 (256 x 3)
+            max_cached (int): 캐시에 보관할 청크 Surface 최대 개수
+        """
+        self.maze = maze
+        self.palette = palette
+        self.max_cached = max_cached
+        self.chunks_x = -(-maze.tile_width // CHUNK_TILES) # 가로 청크 개수
+        self.chunks_y = -(-maze.tile_height // CHUNK_TILES) # 세로 청크 개수
+        self.surfaces = OrderedDict() # (청크 X, 청크 Y) -> 렌더링된 Surface (LRU 순서)
+
+    def chunk_tiles(self, cx, cy):
+        """
+        청크에 해당하는 타일 배열 뷰를 반환합니다. (복사하지 않음)
+        Args:
+            cx (int): 청크 X 좌표
+            cy (int): 청크 Y 좌표
+        Returns:
+            numpy.ndarray: 청크 영역의 타일 배열 뷰
+        """
+        return self.maze.tiles[cy * CHUNK_TILES:(cy + 1) * CHUNK_TILES,
+                               cx * CHUNK_TILES:(cx + 1) * CHUNK_TILES]
+
+    def get_surface(self, cx, cy):
+        """
+        청크의 정적 레이어 Surface를 반환합니다. 캐시에 없으면 타일 배열에서 새로 그립니다.
+        Args:
+            cx (int): 청크 X 좌표
+            cy (int): 청크 Y 좌표
+        Returns:
+            pygame.Surface: 청크 Surface
+        """
+        key = (cx, cy)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        # 타일 배열에 팔레트를 적용해 타일당 1픽셀 이미지를 만든 뒤 타일 크기로 확대합니다.
+        tiles = self.chunk_tiles(cx, cy)
+        colors = self.palette[tiles].transpose(1, 0, 2) # surfarray는 (가로, 세로) 순서
+        surface = pygame.transform.scale(pygame.surfarray.make_surface(colors),
+                                         (tiles.shape[1] * TILE_SIZE, tiles.shape[0] * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() # 화면 픽셀 형식으로 변환하여 blit 속도 향상
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_cached:
+            self.surfaces.popitem(last=False) # 가장 오래 쓰지 않은 청크 제거
+        return surface
+
+    def invalidate_tile(self, x, y):
+        """
+        캐시된 청크 Surface에서 한 타일만 현재 타일 배열에 맞게 다시 그립니다.
+        Args:
+            x (int): X 타일 좌표
+            y (int): Y 타일 좌표
+        """
+        surface = self.surfaces.get((x // CHUNK_TILES, y // CHUNK_TILES))
+        if surface is None:
+            return # 캐시에 없는 청크는 다음에 보일 때 새로 그려집니다.
+        local = ((x % CHUNK_TILES) * TILE_SIZE, (y % CHUNK_TILES) * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        surface.fill(self.palette[self.maze.tiles[y, x]], local)
+
+    def draw(self, screen, camera, area=None):
+        """
+        뷰포트와 겹치는 청크만 화면에 그립니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+            camera (Camera): 현재 카메라
+            area (pygame.Rect): 다시 그릴 화면 영역 (없으면 뷰포트 전체)
+        """
+        world_area = camera.rect if area is None else camera.to_world(area)
+        left, top, right, bottom = chunk_range(world_area)
+        chunk_pixels = CHUNK_TILES * TILE_SIZE
+        previous_clip = screen.get_clip()
+        if area is not None:
+            screen.set_clip(area) # 지정된 영역 밖은 건드리지 않음
+        for cy in range(max(top, 0), min(bottom, self.chunks_y - 1) + 1):
+            for cx in range(max(left, 0), min(right, self.chunks_x - 1) + 1):
+                screen.blit(self.get_surface(cx, cy),
+                            (cx * chunk_pixels - camera.rect.x, cy * chunk_pixels - camera.rect.y))
+        screen.set_clip(previous_clip)
+
+    def evict_far(self, camera, margin=CHUNK_EVICT_MARGIN):
+        """
+        카메라에서 margin 청크보다 멀리 떨어진 청크 Surface를 캐시에서 제거합니다.
+        Args:
+            camera (Camera): 현재 카메라
+            margin (int): 뷰포트 주변에 남겨 둘 청크 수
+        """
+        left, top, right, bottom = chunk_range(camera.rect, margin)
+        for key in [key for key in self.surfaces
+                    if not (left <= key[0] <= right and top <= key[1] <= bottom)]:
+            del self.surfaces[key]
@@ -5,11 +5,64 @@
 SCREEN_WIDTH = 800  # 게임 화면의 너비
 SCREEN_HEIGHT = 600 # 게임 화면의 높이
 
+# 렌더링 설정
+DIRTY_RECT_RENDERING = True # True: 정적 미로 레이어를 캐시하고 바뀐 영역만 화면에 반영, False: 매 프레임 전체 화면 갱신
+
+# 청크 및 카메라 설정
+CHUNK_TILES = 16            # 청크 한 변의 타일 수 (16타일 x 50픽셀 = 800픽셀)
+CHUNK_CACHE_SIZE = 16       # 캐시에 보관할 청크 Surface 최대 개수
+CHUNK_EVICT_MARGIN = 1      # 뷰포트 주변에 Surface를 남겨 둘 청크 수 (더 먼 청크는 캐시에서 제거)
+PLATFORM_ACTIVE_CHUNKS = 2  # 플레이어 주변 몇 청크까지 움직이는 발판을 업데이트할지
+PLATFORM_SPAN_CACHE_SIZE = 256 # 청크 범위별 발판 인덱스 구간을 캐시할 최대 개수
+
+# 경로 탐색 설정
+HINT_BREAKABLE_COST = 4     # 카이론의 힌트에서 부서지지 않은 벽(B) 한 칸에 들어가는 비용 (빈 타일은 1, 에리다로 바꿔 벽을 부수는 수고)
+HPA_CLUSTER_TILES = 16      # 계층적 경로 탐색에서 클러스터 한 변의 타일 수
+HPA_MIN_TILES = 4 * HPA_CLUSTER_TILES * HPA_CLUSTER_TILES # 타일 수가 이보다 많은 미로만 계층적 경로 탐색 사용 (클러스터 2x2 이하는 A*가 더 빠름)
+
+# 레벨 팩 설정
+LEVEL_PACK_PATH = None # levelpack.py로 만든 레벨 팩 파일 경로 (None이면 levels.py의 LEVELS 사용)
+
+# 입력 기록 설정
+RECORDING_PATH = None # 플레이 중 틱별 입력을 기록할 파일 경로 (None이면 기록하지 않음, replay.py로 재생)
+
+# 텔레메트리 설정
+TELEMETRY_DIR = None           # 세션별 플레이 기록(타일 위치, 페르소나 전환, 능력 사용)을 저장할 폴더 (None이면 기록하지 않음, telemetry.py로 분석)
+TELEMETRY_FLUSH_EVENTS = 4096  # 이만큼 이벤트가 쌓이면 파일에 씀
+TELEMETRY_STALL_SECONDS = 10   # 탈출구까지의 거리가 이 시간 동안 줄지 않으면 정체로 봄 (초)
+TELEMETRY_HEATMAP_SIZE = 1024  # 히트맵 이미지 긴 변의 최대 픽셀 수
+TELEMETRY_HEAT_OPACITY = 0.85  # 가장 큰 값의 타일에서 히트맵 색상이 미로 색상을 덮는 비율
+
+# 되감기 설정
+REWIND_SECONDS = 30          # 되감을 수 있는 최대 시간 (초, 이만큼의 틱을 링 버퍼에 기록)
+REWIND_SPEED = 2             # R 키를 누르고 있는 동안 시뮬레이션 1틱마다 되돌리는 틱 수
+REWIND_PLATFORM_POOL = 49152 # 발판 되돌리기 기록을 저장할 최대 발판 수 (발판이 많아 가득 차면 되감을 수 있는 시간이 줄어듦)
+
+# 관전 서버 설정
+SPECTATOR_HOST = "127.0.0.1" # 관전 서버가 접속을 받을 주소 (로컬 접속만 허용)
+SPECTATOR_PORT = None        # 관전 서버 포트 (None이면 서버를 열지 않음, spectator.py로 관전)
+SPECTATOR_MAX_CLIENTS = 512  # 동시에 접속할 수 있는 최대 관전자 수
+SPECTATOR_MAX_BUFFER = 64 * 1024 # 관전자별로 보내지 못하고 쌓아 둘 수 있는 최대 바이트 수 (넘으면 키프레임으로 다시 동기화)
+
+# 레벨 검증 설정
+VALIDATE_LEVELS_ON_STARTUP = True # 게임 시작 시 모든 레벨을 풀 수 있는지 solver.py로 검증 (첫 화면 이후 백그라운드에서 실행)
+
+# 시작 및 화면 전환 설정
+STARTUP_BUDGET = 1.0        # 실행 후 첫 화면까지 허용하는 시간 (초, 넘으면 경고 출력)
+LEVEL_TRANSITION_TIME = 1.0 # 다음 레벨로 넘어갈 때 레벨 번호를 보여주는 시간 (초)
+WIN_SCREEN_TIME = 3.0       # 승리 화면을 보여주는 시간 (초)
+
 # 미로 설정
 TILE_SIZE = 50      # 미로 타일 하나의 크기 (픽셀)2050
 MAZE_WIDTH = SCREEN_WIDTH // TILE_SIZE  # 미로의 가로 타일 개수
 MAZE_HEIGHT = SCREEN_HEIGHT // TILE_SIZE # 미로의 세로 타일 개수
 
+# 움직이는 발판 설정
+PLATFORM_WIDTH = TILE_SIZE * 2      # 발판 너비 (픽셀)
+PLATFORM_HEIGHT = TILE_SIZE // 2    # 발판 높이 (픽셀)
+PLATFORM_RANGE = TILE_SIZE * 5      # 발판이 시작 위치에서 오른쪽으로 움직이는 범위 (픽셀)
+PLATFORM_SPEED = 2                  # 발판의 이동 속도 (픽셀/틱)
+
 # 색상 정의 (RGB 값)
 WHITE = (255, 255, 255) # 흰색
 BLACK = (0, 0, 0)       # 검은색 (벽 색상)
@@ -34,12 +87,36 @@ CHIRON_COLOR = BLUE     # 카이론 (이성) 색상: 파란색 계열
 ERIDA_COLOR = RED       # 에리다 (감정) 색상: 빨간색 계열
 MORA_COLOR = (128, 128, 128) # 모라 (관조) 색상: 회색 계열 (기존 보라색에서 변경)
 
-# 능력 쿨다운 설정 (프레임 단위, 60프레임 = 1초)
+# 시뮬레이션 설정
+SIMULATION_RATE = 60    # 초당 시뮬레이션 틱 수 (고정 시간 간격, 렌더링 속도와 무관)
+MAX_FPS = 60            # 최대 렌더링 프레임 속도
+MAX_FRAME_TIME = 0.25   # 한 프레임에 따라잡을 최대 시뮬레이션 시간 (초, 멈춤 후 급가속 방지)
+IDLE_PACING = True      # True: 화면에 바뀐 것이 없으면 그리기를 건너뛰고, 완전히 멈춰 있으면 이벤트가 올 때까지 대기
+IDLE_WAIT_TIMEOUT = 500 # 완전히 멈춰 있을 때 이벤트를 기다리는 최대 시간 (밀리초, 백그라운드 작업 확인 주기)
+SLOW_MOTION_TIME_SCALE = 20 / 60 # 모라 슬로우 모션 시 시뮬레이션 시간 배율
+
+# 능력 쿨다운 설정 (틱 단위, 60틱 = 1초)
 HINT_COOLDOWN = 300     # 힌트 능력 쿨다운 (5초)
 BREAK_WALL_COOLDOWN = 180 # 벽 부수기 능력 쿨다운 (3초)
+HINT_DURATION = 300     # 힌트 경로 표시 시간 (5초)
 
 # UI 색상 설정
 UI_TEXT_COLOR = WHITE   # UI 텍스트 색상
 UI_BACKGROUND_COLOR = (50, 50, 50) # UI 배경 색상 (어두운 회색)
 
+# HUD 설정
+HUD_FONT_SIZE = 24          # HUD 글자 크기
+WIN_FONT_SIZE = 74          # 승리 화면 글자 크기
+HUD_TEXT_CACHE_SIZE = 64    # 캐시에 보관할 렌더링된 텍스트 Surface 최대 개수
+
+# 프레임 프로파일러 설정
+PROFILER_HISTORY = 600      # 백분위 계산에 사용할 최근 프레임 수 (링 버퍼 크기)
+PROFILER_REFRESH = 30       # 오버레이 통계를 다시 계산하는 간격 (프레임)
+PROFILER_FONT_SIZE = 18     # 오버레이 글자 크기
+PROFILE_CSV_PATH = "frame_profile.csv" # F4 키 또는 종료 시 프레임별 측정값을 저장할 파일
+ALLOCATION_REPORT_PATH = "allocations.txt" # F5 키로 메모리 할당 추적을 끌 때(또는 종료 시) 호출 위치별 보고서를 저장할 파일
+
+# 가비지 컬렉션 설정
+GC_FREEZE = True # 시작 직후와 레벨 전환 화면에서 가비지 컬렉션을 실행하고 남은 객체를 이후 컬렉션 대상에서 제외 (플레이 중 멈춤 방지)
+
 PLAYER_COLOR = RED      # (현재 사용되지 않음, 페르소나별 색상 사용)
@@ -0,0 +1,179 @@
+
+# game_state.py
+# 화면 출력과 분리된 게임 시뮬레이션 코어를 정의하는 파일입니다.
+# GameState.step(inputs)는 고정된 시간 간격(1틱 = 1/SIMULATION_RATE초)만큼 게임을 진행하며,
+# 디스플레이 없이도 실행할 수 있어 자동 플레이 테스트에 사용할 수 있습니다.
+
+import pygame
+from config import *
+from player import Player
+from maze import Maze
+from profiler import NULL_PROFILER
+
+class Inputs:
+    def __init__(self):
+        """
+        한 틱 동안 시뮬레이션에 전달되는 입력을 초기화합니다.
+        이동과 S 키는 누르고 있는 상태이고, 나머지는 해당 틱에 한 번만 적용되는 입력입니다.
+        """
+        self.dx = 0 # X축 이동 방향 (-1, 0, 1)
+        self.dy = 0 # Y축 이동 방향 (-1, 0, 1)
+        self.slow = False # S 키를 누르고 있는지 여부 (모라의 슬로우 모션)
+        self.persona = None # 이번 틱에 전환할 페르소나 (없으면 None)
+        self.hint = False # 이번 틱에 H 키가 눌렸는지 여부
+        self.break_wall = False # 이번 틱에 B 키가 눌렸는지 여부
+
+    def clear_actions(self):
+        """
+        한 번만 적용되는 입력(페르소나 전환, 힌트, 벽 부수기)을 비웁니다.
+        """
+        self.persona = None
+        self.hint = False
+        self.break_wall = False
+
+
+class GameState:
+    def __init__(self, levels, level_index=0, preloader=None):
+        """
+        게임 상태를 초기화하고 첫 레벨을 불러옵니다.
+        Args:
+            levels (list | LevelPack): 레벨 데이터 목록
+            level_index (int): 시작할 레벨의 인덱스
+            preloader (LevelPreloader): 다음 레벨을 미리 만들어 두는 프리로더 (없으면 레벨 전환 시 바로 생성)
+        """
+        self.levels = levels
+        self.preloader = preloader
+        self.level_index = level_index # 현재 플레이 중인 레벨 인덱스
+        self.maze = None # 현재 미로 객체
+        self.player = None # 현재 플레이어 객체
+        self.hint_path = None # 카이론의 힌트 경로
+        self.hint_timer = 0 # 힌트 표시 시간 타이머 (틱)
+        self.slow_motion = False # 모라의 슬로우 모션 활성화 여부
+        self.hint_cooldown_timer = 0 # 힌트 능력 쿨다운 타이머 (틱)
+        self.break_wall_cooldown_timer = 0 # 벽 부수기 능력 쿨다운 타이머 (틱)
+        self.used_hint = False # 마지막 틱에 힌트 능력을 사용했는지 여부 (텔레메트리용)
+        self.used_break_wall = False # 마지막 틱에 벽 부수기 능력을 사용했는지 여부 (텔레메트리용)
+        self.tick = 0 # 지금까지 진행된 시뮬레이션 틱 수
+        self.won = False # 모든 레벨을 완료했는지 여부
+        self.previous_player_pos = (0, 0) # 직전 틱의 플레이어 위치 (렌더링 보간용)
+        self.exit_rect = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE) # 현재 미로 탈출구의 월드 영역 (레벨을 불러올 때 갱신)
+        self.interpolated_rect = pygame.Rect(0, 0, 0, 0) # interpolated_player_rect()가 매 프레임 갱신하여 돌려주는 Rect
+        self.profiler = NULL_PROFILER # 단계별 시간을 측정하는 프로파일러 (기본값: 측정하지 않음)
+        self.load_level(level_index)
+
+    def load_level(self, level_index):
+        """
+        지정된 인덱스의 레벨을 불러와 미로와 플레이어를 초기화합니다.
+        Args:
+            level_index (int): 불러올 레벨의 인덱스
+        """
+        self.level_index = level_index
+        if self.preloader is not None:
+            self.maze = self.preloader.get(level_index) # 미리 만들어 둔 미로 사용
+            self.preloader.preload(level_index + 1) # 플레이하는 동안 다음 레벨을 백그라운드에서 준비
+        else:
+            self.maze = Maze(self.levels[level_index]) # 새로운 미로 객체 생성
+        self.player = Player(self.maze.start_pos[0], self.maze.start_pos[1]) # 플레이어 시작 위치에 초기화
+        self.previous_player_pos = self.player.rect.topleft
+        self.exit_rect.topleft = (self.maze.end_pos[0] * TILE_SIZE, self.maze.end_pos[1] * TILE_SIZE)
+
+    def time_scale(self, slow_pressed):
+        """
+        시뮬레이션 시간 배율을 반환합니다. 모라가 S 키를 누르고 있으면 시간이 느리게 흐릅니다.
+        Args:
+            slow_pressed (bool): S 키를 누르고 있는지 여부
+        Returns:
+            float: 실제 시간 대비 시뮬레이션 시간 배율
+        """
+        if self.player.persona == PERSONA_MORA and slow_pressed:
+            return SLOW_MOTION_TIME_SCALE
+        return 1.0
+
+    def visible_hint(self):
+        """
+        현재 화면에 표시해야 하는 힌트 경로를 반환합니다.
+        Returns:
+            list: 힌트 타이머가 남아 있으면 힌트 경로, 아니면 None
+        """
+        return self.hint_path if self.hint_timer > 0 else None
+
+    def step(self, inputs):
+        """
+        고정된 시간 간격 1틱만큼 게임을 진행합니다.
+        Args:
+            inputs (Inputs): 이번 틱의 입력
+        """
+        if self.won:
+            return
+        player = self.player
+        maze = self.maze
+        profiler = self.profiler
+        self.previous_player_pos = player.rect.topleft
+        self.used_hint = self.used_break_wall = False
+
+        # 페르소나 전환
+        if inputs.persona is not None:
+            player.set_persona(inputs.persona)
+        # 카이론 능력: 힌트 표시 (쿨다운 적용)
+        if inputs.hint and player.persona == PERSONA_CHIRON and self.hint_cooldown_timer == 0:
+            # 플레이어의 현재 타일에서 탈출구까지의 경로 (미리 계산된 거리장을 따라 이동)
+            path = maze.hint_path((player.rect.centerx // TILE_SIZE, player.rect.centery // TILE_SIZE))
+            # 경로가 없으면(일반 벽으로 탈출구와 막힌 위치) 보여 줄 것이 없으므로 능력을 쓰지 않은 것으로 둡니다.
+            if path is not None:
+                self.hint_path = path
+                self.hint_timer = HINT_DURATION # 힌트 표시 시간 설정
+                self.hint_cooldown_timer = HINT_COOLDOWN # 쿨다운 시작
+                self.used_hint = True
+        # 에리다 능력: 벽 부수기 (쿨다운 적용)
+        if inputs.break_wall and player.persona == PERSONA_ERIDA and self.break_wall_cooldown_timer == 0:
+            player.break_wall(maze) # 벽 부수기
+            self.break_wall_cooldown_timer = BREAK_WALL_COOLDOWN # 쿨다운 시작
+            self.used_break_wall = True
+        profiler.mark("abilities")
+
+        # 모라 능력: 슬로우 모션 (S 키를 누르고 있는 동안 활성화)
+        self.slow_motion = player.persona == PERSONA_MORA and inputs.slow
+
+        # 쿨다운 타이머 감소
+        if self.hint_cooldown_timer > 0:
+            self.hint_cooldown_timer -= 1
+        if self.break_wall_cooldown_timer > 0:
+            self.break_wall_cooldown_timer -= 1
+        profiler.mark("cooldowns")
+
+        # 플레이어 주변 청크의 움직이는 발판만 업데이트
+        maze.update_platforms(player.rect)
+        profiler.mark("platforms")
+        # 플레이어 이동 및 충돌 처리
+        player.move(inputs.dx, inputs.dy, maze)
+        profiler.mark("move")
+
+        # 힌트 타이머 감소
+        if self.hint_timer > 0:
+            self.hint_timer -= 1
+        self.tick += 1
+
+        # 레벨 완료 조건 확인
+        if player.rect.colliderect(self.exit_rect):
+            if self.level_index + 1 < len(self.levels): # 모든 레벨을 완료하지 않았다면
+                self.load_level(self.level_index + 1) # 다음 레벨 불러오기
+            else:
+                self.won = True # 게임 승리
+        profiler.mark("exit")
+
+    def interpolated_player_rect(self, alpha):
+        """
+        직전 틱과 현재 틱 사이의 플레이어 위치를 보간한 Rect를 반환합니다.
+        매 프레임 호출되므로 새 Rect를 만들지 않고 같은 Rect를 갱신하여 돌려줍니다. (다음 호출 전까지만 유효)
+        Args:
+            alpha (float): 보간 비율 (0: 직전 틱, 1: 현재 틱)
+        Returns:
+            pygame.Rect: 화면에 그릴 플레이어 영역
+        """
+        rect = self.player.rect
+        prev_x, prev_y = self.previous_player_pos
+        interpolated = self.interpolated_rect
+        interpolated.update(round(prev_x + (rect.x - prev_x) * alpha),
+                            round(prev_y + (rect.y - prev_y) * alpha),
+                            rect.width, rect.height)
+        return interpolated
@@ -0,0 +1,125 @@
+
+# hud.py
+# 화면에 표시되는 UI(현재 인격, 능력 쿨다운 등)를 그리는 파일입니다.
+# 폰트는 한 번만 불러오고, 렌더링된 텍스트 Surface는 LRU 캐시에 보관하여
+# 표시 값이 바뀔 때만 글자를 다시 렌더링합니다.
+
+import pygame
+from collections import OrderedDict
+from config import *
+
+# 페르소나별 HUD 표시 문구와 색상
+PERSONA_LABELS = {
+    PERSONA_CHIRON: ("현재 인격: 카이론 (1)", CHIRON_COLOR),
+    PERSONA_ERIDA: ("현재 인격: 에리다 (2)", ERIDA_COLOR),
+    PERSONA_MORA: ("현재 인격: 모라 (3)", MORA_COLOR),
+}
+
+class TextCache:
+    def __init__(self, max_entries=HUD_TEXT_CACHE_SIZE):
+        """
+        폰트와 렌더링된 텍스트 Surface 캐시를 초기화합니다.
+        Args:
+            max_entries (int): 보관할 텍스트 Surface의 최대 개수 (넘으면 가장 오래 쓰지 않은 항목부터 제거)
+        """
+        self.max_entries = max_entries
+        self.fonts = {} # 크기별 Font 객체 (한 번만 생성)
+        self.surfaces = OrderedDict() # (text, color, size) -> 렌더링된 Surface (LRU 순서)
+
+    def get_font(self, size):
+        """
+        지정된 크기의 기본 폰트를 반환합니다. 처음 요청될 때만 생성합니다.
+        Args:
+            size (int): 폰트 크기
+        Returns:
+            pygame.font.Font: 폰트 객체
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def preload(self, sizes, texts=()):
+        """
+        폰트와 텍스트 Surface를 미리 만들어 둡니다. 시작할 때 백그라운드 스레드에서 호출합니다.
+        Args:
+            sizes (iterable): 미리 불러올 폰트 크기 목록
+            texts (iterable): 미리 렌더링할 (text, color, size) 튜플 목록
+        """
+        for size in sizes:
+            self.get_font(size)
+        for text, color, size in texts:
+            self.render(text, color, size)
+
+    def render(self, text, color, size):
+        """
+        텍스트를 렌더링한 Surface를 반환합니다. 같은 (text, color, size)는 캐시에서 재사용합니다.
+        Args:
+            text (str): 표시할 문자열
+            color (tuple): 글자 색상 (RGB)
+            size (int): 폰트 크기
+        Returns:
+            pygame.Surface: 렌더링된 텍스트 Surface
+        """
+        key = (text, color, size)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key) # 최근 사용 항목으로 갱신
+            return surface
+
+        surface = self.get_font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False) # 가장 오래 쓰지 않은 항목 제거
+        return surface
+
+
+class Hud:
+    def __init__(self, text_cache):
+        """
+        HUD를 초기화합니다.
+        Args:
+            text_cache (TextCache): 폰트와 텍스트 Surface를 공유하는 캐시
+        """
+        self.text_cache = text_cache
+        self.values = None # 마지막으로 렌더링한 표시 값 (persona, 힌트 쿨다운 초, 벽 부수기 쿨다운 초)
+        self.lines = [] # 표시 값에 대응하는 (Surface, 위치) 리스트
+        self.rects = [] # 각 줄이 그려지는 화면 영역 (표시 값이 바뀔 때만 다시 계산)
+
+    def update(self, persona, hint_cooldown_timer, break_wall_cooldown_timer):
+        """
+        표시 값을 갱신합니다. 화면에 보이는 값이 실제로 바뀐 경우에만 텍스트를 다시 준비합니다.
+        Args:
+            persona (str): 현재 페르소나
+            hint_cooldown_timer (int): 힌트 능력 쿨다운 타이머 (프레임)
+            break_wall_cooldown_timer (int): 벽 부수기 능력 쿨다운 타이머 (프레임)
+        Returns:
+            bool: 표시 내용이 바뀌었으면 True
+        """
+        # 쿨다운 시간을 초 단위로 변환하여 표시 (60프레임 = 1초)
+        values = (persona, hint_cooldown_timer // 60, break_wall_cooldown_timer // 60)
+        if values == self.values:
+            return False
+        self.values = values
+
+        persona_text, persona_color = PERSONA_LABELS.get(persona, ("", WHITE))
+        cache = self.text_cache
+        self.lines = [
+            (cache.render(persona_text, persona_color, HUD_FONT_SIZE), (10, 10)), # 현재 인격 표시
+            (cache.render(f"힌트 쿨다운: {values[1]}초", UI_TEXT_COLOR, HUD_FONT_SIZE), (10, 40)), # 힌트 쿨다운 표시
+            (cache.render(f"벽 부수기 쿨다운: {values[2]}초", UI_TEXT_COLOR, HUD_FONT_SIZE), (10, 70)), # 벽 부수기 쿨다운 표시
+        ]
+        self.rects = [pygame.Rect(position, surface.get_size()) for surface, position in self.lines]
+        return True
+
+    def draw(self, screen):
+        """
+        준비된 HUD 텍스트를 화면에 그립니다. 매 프레임 호출되므로 blit 결과 Rect를 만들지 않고 미리 계산한 영역을 돌려줍니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+        Returns:
+            list: HUD가 그려진 영역의 pygame.Rect 리스트 (수정하면 안 됨)
+        """
+        screen.blits(self.lines, False)
+        return self.rects
@@ -0,0 +1,244 @@
+
+# levelpack.py
+# 많은 레벨을 하나의 바이너리 파일(레벨 팩)에 저장하고, 필요한 레벨만 지연 해독하는 파일입니다.
+# 또한 현재 레벨을 플레이하는 동안 다음 레벨의 Maze를 백그라운드 스레드에서 미리 만들어 둡니다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더   : 매직 b"PMLP", 버전(u16), 예약(u16), 레벨 수(u32), 인덱스 위치(u64)
+#   데이터 : 레벨별 인코딩된 타일 데이터
+#   인덱스 : 레벨별 (데이터 위치 u64, 데이터 길이 u32, 가로 u16, 세로 u16, 인코딩 u8, 패딩 3바이트)
+# 인코딩:
+#   ENCODING_RLE    : (반복 횟수 u16, 타일 코드 u8) 쌍의 나열
+#   ENCODING_PACKED : 타일을 SYMBOLS의 번호(4비트)로 바꿔 한 바이트에 두 타일씩 저장
+#
+# 실행 방법:
+#   python levelpack.py levels OUT            (levels.py의 LEVELS를 팩으로 저장)
+#   python levelpack.py generate OUT 개수 가로 세로 [시드]  (generator.py로 생성한 레벨을 팩으로 저장)
+
+import mmap
+import struct
+import sys
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from maze import Maze, level_to_tiles
+
+MAGIC = b"PMLP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("length", "<u4"), ("width", "<u2"), ("height", "<u2"),
+                        ("encoding", "u1"), ("pad", "u1", 3)])
+ENCODING_RLE = 1
+ENCODING_PACKED = 2
+RUN_DTYPE = np.dtype([("count", "<u2"), ("code", "u1")])
+MAX_RUN = 0xFFFF
+
+# 4비트 압축에서 사용하는 타일 문자 목록 (번호 = 목록 내 위치)
+SYMBOLS = np.frombuffer(b" XTBHPE", dtype=np.uint8)
+SYMBOL_INDEX = np.full(256, 255, dtype=np.uint8)
+SYMBOL_INDEX[SYMBOLS] = np.arange(len(SYMBOLS), dtype=np.uint8)
+
+
+def encode_rle(tiles):
+    """
+    타일 배열을 (반복 횟수, 타일 코드) 쌍으로 인코딩합니다.
+    Args:
+        tiles (numpy.ndarray): uint8 타일 배열
+    Returns:
+        bytes: 인코딩된 데이터
+    """
+    flat = tiles.ravel()
+    starts = np.concatenate(([0], np.flatnonzero(flat[1:] != flat[:-1]) + 1))
+    lengths = np.diff(np.append(starts, flat.size))
+    codes = flat[starts]
+    # MAX_RUN보다 긴 구간은 여러 쌍으로 나눕니다.
+    pieces = -(-lengths // MAX_RUN)
+    runs = np.empty(int(pieces.sum()), dtype=RUN_DTYPE)
+    runs["code"] = np.repeat(codes, pieces)
+    counts = np.full(len(runs), MAX_RUN, dtype=np.int64)
+    last = np.cumsum(pieces) - 1 # 각 구간의 마지막 쌍 위치
+    counts[last] = lengths - (pieces - 1) * MAX_RUN
+    runs["count"] = counts
+    return runs.tobytes()
+
+
+def decode_rle(data, width, height):
+    """
+    RLE 데이터를 타일 배열로 해독합니다.
+    """
+    runs = np.frombuffer(data, dtype=RUN_DTYPE)
+    return np.repeat(runs["code"], runs["count"]).reshape(height, width)
+
+
+def encode_packed(tiles):
+    """
+    타일 배열을 한 바이트에 두 타일씩(4비트) 압축합니다. SYMBOLS에 없는 타일이 있으면 None을 반환합니다.
+    """
+    symbols = SYMBOL_INDEX[tiles.ravel()]
+    if (symbols == 255).any():
+        return None
+    if symbols.size % 2:
+        symbols = np.append(symbols, 0)
+    return ((symbols[0::2] << 4) | symbols[1::2]).astype(np.uint8).tobytes()
+
+
+def decode_packed(data, width, height):
+    """
+    4비트 압축 데이터를 타일 배열로 해독합니다.
+    """
+    packed = np.frombuffer(data, dtype=np.uint8)
+    symbols = np.empty(packed.size * 2, dtype=np.uint8)
+    symbols[0::2] = packed >> 4
+    symbols[1::2] = packed & 0x0F
+    return SYMBOLS[symbols[:width * height]].reshape(height, width)
+
+
+def write_pack(path, levels):
+    """
+    레벨 목록을 레벨 팩 파일로 저장합니다. 레벨마다 더 작은 인코딩을 선택합니다.
+    레벨을 하나씩 인코딩해 바로 기록하므로, 제너레이터를 넘기면 많은 레벨도 적은 메모리로 저장할 수 있습니다.
+    Args:
+        path (str): 저장할 파일 경로
+        levels (iterable): 레벨 데이터(문자열 리스트 또는 uint8 타일 배열)의 나열
+    Returns:
+        int: 저장한 레벨 수
+    """
+    entries = []
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0)) # 자리만 잡아 두고 마지막에 다시 기록
+        for level in levels:
+            tiles = level_to_tiles(level)
+            candidates = [(ENCODING_RLE, encode_rle(tiles))]
+            packed = encode_packed(tiles)
+            if packed is not None:
+                candidates.append((ENCODING_PACKED, packed))
+            encoding, data = min(candidates, key=lambda item: len(item[1]))
+            entries.append((f.tell(), len(data), tiles.shape[1], tiles.shape[0], encoding))
+            f.write(data)
+
+        index = np.zeros(len(entries), dtype=INDEX_DTYPE)
+        for i, (offset, length, width, height, encoding) in enumerate(entries):
+            index[i] = (offset, length, width, height, encoding, (0, 0, 0))
+        index_offset = f.tell()
+        f.write(index.tobytes())
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), index_offset))
+    return len(entries)
+
+
+class LevelPack:
+    def __init__(self, path):
+        """
+        레벨 팩 파일을 메모리 매핑으로 엽니다. 헤더와 인덱스만 읽으므로 레벨 수와 관계없이 바로 열립니다.
+        Args:
+            path (str): 레벨 팩 파일 경로
+        """
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, index_offset = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a level pack (version {VERSION})")
+        # 인덱스도 복사하지 않고 매핑된 메모리를 그대로 가리킵니다.
+        self.index = np.frombuffer(self.data, dtype=INDEX_DTYPE, count=count, offset=index_offset)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, level_index):
+        """
+        요청한 레벨 하나만 해독하여 uint8 타일 배열로 반환합니다. (Maze에 바로 넘길 수 있음)
+        Args:
+            level_index (int): 레벨 인덱스
+        Returns:
+            numpy.ndarray: (세로, 가로) 크기의 uint8 타일 배열
+        """
+        if not -len(self) <= level_index < len(self):
+            raise IndexError(level_index)
+        entry = self.index[level_index]
+        start = int(entry["offset"])
+        data = self.data[start:start + int(entry["length"])]
+        width, height = int(entry["width"]), int(entry["height"])
+        if entry["encoding"] == ENCODING_RLE:
+            return decode_rle(data, width, height)
+        return decode_packed(data, width, height)
+
+    def close(self):
+        """
+        메모리 매핑과 파일을 닫습니다.
+        """
+        self.index = None
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LevelPreloader:
+    def __init__(self, levels):
+        """
+        다음 레벨의 Maze를 백그라운드 스레드에서 미리 만드는 프리로더를 초기화합니다.
+        Args:
+            levels (list | LevelPack): 레벨 데이터 목록
+        """
+        self.levels = levels
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preload")
+        self.pending = {} # 레벨 인덱스 -> 미로 생성 Future
+
+    def preload(self, level_index):
+        """
+        지정된 레벨의 Maze를 백그라운드에서 만들기 시작합니다. 범위를 벗어나면 무시합니다.
+        Args:
+            level_index (int): 미리 만들 레벨 인덱스
+        """
+        if 0 <= level_index < len(self.levels) and level_index not in self.pending:
+            self.pending[level_index] = self.executor.submit(lambda: Maze(self.levels[level_index]))
+
+    def get(self, level_index):
+        """
+        지정된 레벨의 Maze를 반환합니다. 미리 만들어 둔 것이 있으면 그대로 사용하고, 없으면 바로 만듭니다.
+        Args:
+            level_index (int): 레벨 인덱스
+        Returns:
+            Maze: 새로 만든 미로 객체
+        """
+        future = self.pending.pop(level_index, None)
+        # 더 이상 필요 없는 다른 레벨의 예약은 취소합니다.
+        for stale in self.pending.values():
+            stale.cancel()
+        self.pending.clear()
+        if future is not None:
+            return future.result()
+        return Maze(self.levels[level_index])
+
+    def shutdown(self):
+        """
+        백그라운드 스레드를 종료합니다.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv):
+    """
+    명령행에서 레벨 팩을 만듭니다.
+    """
+    if len(argv) >= 3 and argv[1] == "levels":
+        from levels import LEVELS
+        count = write_pack(argv[2], LEVELS)
+    elif len(argv) >= 6 and argv[1] == "generate":
+        from generator import generate_tiles
+        total, width, height = int(argv[3]), int(argv[4]), int(argv[5])
+        seeds = np.random.SeedSequence(int(argv[6]) if len(argv) > 6 else 0).spawn(total)
+        count = write_pack(argv[2], (generate_tiles(width, height, seed) for seed in seeds))
+    else:
+        print("usage: python levelpack.py levels OUT")
+        print("       python levelpack.py generate OUT COUNT WIDTH HEIGHT [SEED]")
+        return 1
+    print(f"wrote {count} levels to {argv[2]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
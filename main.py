@@ -2,163 +2,329 @@
 # main.py
 # 게임의 메인 루프를 포함하며, Pygame 초기화, 이벤트 처리, 화면 업데이트,
 # 그리고 게임 상태(레벨 진행, 승리 등)를 관리하는 파일입니다.
+# 게임 로직은 game_state.py의 GameState가 고정된 시간 간격으로 진행하고,
+# 이 파일은 입력 수집과 렌더링만 담당합니다.
 
+import gc
+import time
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from config import *
-from player import Player
-from maze import Maze
 from levels import LEVELS
+from renderer import DirtyRectRenderer
+from hud import Hud, TextCache
+from camera import Camera
+from game_state import GameState, Inputs
+from solver import validate_levels
+from levelpack import LevelPack, LevelPreloader
+from profiler import NULL_PROFILER, FrameProfiler, ProfilerOverlay, AllocationProfiler
+from replay import InputRecorder
+from rewind import RewindBuffer
+from spectator import SpectatorServer
+from telemetry import TelemetrySampler, session_path
 
 def main():
     """
     게임의 메인 함수입니다. Pygame을 초기화하고 게임 루프를 실행합니다.
     """
-    pygame.init() # Pygame 모듈 초기화
+    launch_time = time.perf_counter() # 첫 화면까지 걸린 시간 측정 기준
+    # 레벨 팩이 지정되어 있으면 팩에서, 아니면 levels.py에서 레벨을 가져옵니다.
+    levels = LevelPack(LEVEL_PACK_PATH) if LEVEL_PACK_PATH else LEVELS
+
+    # 사용하는 서브시스템(화면, 폰트)만 초기화합니다. (pygame.init()은 오디오, 조이스틱 등도 모두 초기화)
+    pygame.display.init()
+    pygame.font.init()
+
+    # 첫 레벨의 미로와 폰트를 백그라운드 스레드에서 준비하는 동안 창을 엽니다.
+    preloader = LevelPreloader(levels) # 다음 레벨의 미로를 백그라운드에서 미리 생성
+    preloader.preload(0)
+    text_cache = TextCache() # 폰트와 렌더링된 텍스트를 재사용하는 캐시
+    startup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup") # 시작 시 자원 준비용 스레드
+    fonts_ready = startup.submit(text_cache.preload, (HUD_FONT_SIZE, WIN_FONT_SIZE, PROFILER_FONT_SIZE),
+                                 [("YOU WIN!", GREEN, WIN_FONT_SIZE)])
+
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) # 게임 화면 설정
     pygame.display.set_caption("Persona Maze") # 창 제목 설정
     clock = pygame.time.Clock() # 게임 프레임 속도 제어를 위한 Clock 객체 생성
+    renderer = DirtyRectRenderer(screen) if DIRTY_RECT_RENDERING else None # 변경 영역만 갱신하는 렌더러
+    camera = Camera() # 플레이어를 따라가는 뷰포트
 
-    current_level_index = 0 # 현재 플레이 중인 레벨 인덱스
-    maze = None # 현재 미로 객체
-    player = None # 현재 플레이어 객체
+    fonts_ready.result() # 폰트 준비가 끝난 뒤에만 메인 스레드에서 텍스트 캐시를 사용
+    hud = Hud(text_cache) # 인격 및 쿨다운 표시 UI
+    state = GameState(levels, preloader=preloader) # 화면과 분리된 게임 시뮬레이션 상태 (미리 만든 첫 번째 미로 사용)
+    inputs = Inputs() # 다음 시뮬레이션 틱에 전달할 입력
+    recorder = InputRecorder(state) if RECORDING_PATH else None # 틱별 입력 기록기 (replay.py로 재생)
+    rewind = RewindBuffer(state) # 최근 REWIND_SECONDS초의 틱별 상태 기록 (R 키로 되감기)
+    telemetry = TelemetrySampler(session_path(TELEMETRY_DIR), state) if TELEMETRY_DIR else None # 타일 위치와 능력 사용 기록 (telemetry.py로 분석)
+    spectators = SpectatorServer().start() if SPECTATOR_PORT is not None else None # 관전자에게 상태를 보내는 서버
+    frame_profiler = FrameProfiler() # 단계별 프레임 시간 측정기 (F3 키로 켜고 끔)
+    profiler_overlay = ProfilerOverlay(frame_profiler, text_cache) # 측정 통계 오버레이
+    allocation_profiler = None # 단계별 메모리 할당 추적기 (F5 키로 켤 때마다 새로 만듦, 진단용)
+    profiler = NULL_PROFILER # 현재 사용 중인 프로파일러 (꺼져 있으면 아무 일도 하지 않음)
+    tick_time = 1.0 / SIMULATION_RATE # 시뮬레이션 1틱의 길이 (초)
+    accumulator = 0.0 # 아직 시뮬레이션하지 않은 누적 시간 (초)
+    first_frame_time = None # 실행 후 첫 화면이 표시될 때까지 걸린 시간 (초)
+    validation = None # 백그라운드 레벨 검증 작업
+    shown_level = state.level_index # 화면에 표시 중인 레벨 (바뀌면 전환 화면 표시)
+    message_until = None # 전환/승리 화면을 보여주는 동안 끝나는 시각 (게임 진행 중이면 None)
+    hint_rect = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE) # 전체 화면 갱신 모드에서 힌트 타일을 그릴 때 재사용하는 Rect
+    drawn_frame = None # 마지막으로 그린 프레임의 (플레이어 위치, 카메라 위치, 힌트 경로, 미로)
+    idle = False # 완전히 멈춰 있어 다음 프레임에 이벤트를 기다려도 되는지 여부
 
-    hint_path = None # 카이론의 힌트 경로
-    hint_timer = 0 # 힌트 표시 시간 타이머
-    slow_motion = False # 모라의 슬로우 모션 활성화 여부
-    hint_cooldown_timer = 0 # 힌트 능력 쿨다운 타이머
-    break_wall_cooldown_timer = 0 # 벽 부수기 능력 쿨다운 타이머
+    def show_message(text, color):
+        """
+        화면 중앙에 큰 글씨로 메시지를 표시합니다. (레벨 전환 및 승리 화면)
+        Args:
+            text (str): 표시할 메시지
+            color (tuple): 글자 색상 (RGB)
+        """
+        screen.fill(BLACK) # 화면을 검은색으로 채움
+        message = text_cache.render(text, color, WIN_FONT_SIZE) # 메시지 렌더링 (큰 폰트)
+        screen.blit(message, message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))) # 화면 중앙에 그리기
+        pygame.display.flip() # 화면 업데이트
 
-    def load_level(level_index):
+    def use_profiler(new_profiler):
         """
-        지정된 인덱스의 레벨을 불러와 미로와 플레이어를 초기화합니다.
+        게임 상태와 렌더러가 사용할 프로파일러를 바꿉니다. 메모리 할당 추적을 끄면 보고서를 저장합니다.
         Args:
-            level_index (int): 불러올 레벨의 인덱스
+            new_profiler: 새로 사용할 프로파일러 (NULL_PROFILER면 측정하지 않음)
         """
-        nonlocal maze, player # 외부 스코프의 maze, player 변수를 사용
-        maze = Maze(LEVELS[level_index]) # 새로운 미로 객체 생성
-        player = Player(maze.start_pos[0], maze.start_pos[1]) # 플레이어 시작 위치에 초기화
+        nonlocal profiler
+        if profiler is allocation_profiler and new_profiler is not profiler:
+            allocation_profiler.stop()
+            allocation_profiler.export_report(ALLOCATION_REPORT_PATH)
+            print(f"Allocations: {allocation_profiler.per_frame():.2f} blocks/frame (report saved to {ALLOCATION_REPORT_PATH})")
+        profiler = new_profiler
+        state.profiler = profiler
+        if renderer is not None:
+            renderer.profiler = profiler
+            renderer.invalidate() # 오버레이가 있던 자리를 지우기 위해 전체를 다시 그림
+        profiler.begin_frame()
 
-    load_level(current_level_index) # 첫 번째 레벨 불러오기
+    def collect_garbage():
+        """
+        가비지 컬렉션을 한 번 실행하고, 남은 객체(레벨 데이터, 폰트 등)를 이후 컬렉션의 검사 대상에서 제외합니다.
+        플레이 중의 컬렉션이 오래 사는 객체를 다시 검사하느라 멈추지 않도록, 화면이 멈춰 있는 시점에 호출합니다.
+        """
+        if GC_FREEZE:
+            gc.unfreeze() # 이전 레벨의 객체도 이번 컬렉션에서 정리
+            gc.collect()
+            gc.freeze()
+
+    def draw_hud(screen):
+        """
+        현재 인격과 능력 쿨다운을 화면 좌측 상단에 그립니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+        Returns:
+            list: HUD가 그려진 영역의 pygame.Rect 리스트
+        """
+        rects = hud.draw(screen) # 표시 값은 그리기 전에 hud.update()로 갱신됨 (HUD가 보관하는 리스트이므로 수정하지 않음)
+        profiler.mark("hud")
+        if profiler is frame_profiler: # 프레임 시간을 측정 중이면 측정 통계도 함께 표시
+            rects = rects + profiler_overlay.draw(screen)
+            profiler.mark("overlay")
+        return rects
 
     running = True # 게임 루프 실행 여부 플래그
     while running:
+        profiler.begin_frame()
+        if idle:
+            # 완전히 멈춰 있으면 이벤트가 올 때까지 CPU를 쓰지 않고 기다립니다. (이벤트가 오면 바로 깨어남)
+            event = pygame.event.wait(IDLE_WAIT_TIMEOUT)
+            events = [event] if event.type != pygame.NOEVENT else []
+            events.extend(pygame.event.get())
+        else:
+            events = pygame.event.get()
         # 이벤트 처리 루프
-        for event in pygame.event.get():
+        # 한 번만 적용되는 입력은 다음 틱이 실행될 때까지 inputs에 보관됩니다.
+        for event in events:
             if event.type == pygame.QUIT: # 창 닫기 버튼 클릭 시
                 running = False # 게임 종료
             if event.type == pygame.KEYDOWN: # 키보드 눌림 이벤트
                 # 페르소나 전환
                 if event.key == pygame.K_1:
-                    player.set_persona(PERSONA_CHIRON)
+                    inputs.persona = PERSONA_CHIRON
                 elif event.key == pygame.K_2:
-                    player.set_persona(PERSONA_ERIDA)
+                    inputs.persona = PERSONA_ERIDA
                 elif event.key == pygame.K_3:
-                    player.set_persona(PERSONA_MORA)
+                    inputs.persona = PERSONA_MORA
                 # 카이론 능력: 힌트 표시 (쿨다운 적용)
-                elif event.key == pygame.K_h and player.persona == PERSONA_CHIRON:
-                    if hint_cooldown_timer == 0:
-                        hint_path = maze.find_path(maze.start_pos, maze.end_pos) # 최적 경로 계산
-                        hint_timer = 300 # 힌트 표시 시간 설정 (5초)
-                        hint_cooldown_timer = HINT_COOLDOWN # 쿨다운 시작
+                elif event.key == pygame.K_h:
+                    inputs.hint = True
                 # 에리다 능력: 벽 부수기 (쿨다운 적용)
-                elif event.key == pygame.K_b and player.persona == PERSONA_ERIDA:
-                    if break_wall_cooldown_timer == 0:
-                        player.break_wall(maze) # 벽 부수기
-                        break_wall_cooldown_timer = BREAK_WALL_COOLDOWN # 쿨다운 시작
+                elif event.key == pygame.K_b:
+                    inputs.break_wall = True
+                # 프레임 프로파일러 켜기/끄기 (오버레이 표시)
+                elif event.key == pygame.K_F3:
+                    use_profiler(frame_profiler if profiler is not frame_profiler else NULL_PROFILER)
+                # 최근 프레임별 측정값을 CSV로 저장
+                elif event.key == pygame.K_F4 and frame_profiler.frames > 0:
+                    frame_profiler.export_csv(PROFILE_CSV_PATH)
+                # 메모리 할당 추적 켜기/끄기 (끌 때 호출 위치별 보고서 저장)
+                elif event.key == pygame.K_F5:
+                    if profiler is allocation_profiler:
+                        use_profiler(NULL_PROFILER)
+                    else:
+                        allocation_profiler = AllocationProfiler()
+                        allocation_profiler.start()
+                        use_profiler(allocation_profiler)
 
         # 키 입력 상태 확인 (연속적인 이동 처리)
         keys = pygame.key.get_pressed()
-        dx, dy = 0, 0
+        inputs.dx, inputs.dy = 0, 0
         if keys[pygame.K_LEFT]:
-            dx = -1
+            inputs.dx = -1
         if keys[pygame.K_RIGHT]:
-            dx = 1
+            inputs.dx = 1
         if keys[pygame.K_UP]:
-            dy = -1
+            inputs.dy = -1
         if keys[pygame.K_DOWN]:
-            dy = 1
-        
-        # 모라 능력: 슬로우 모션 (S 키를 누르고 있는 동안 활성화)
-        if player.persona == PERSONA_MORA and keys[pygame.K_s]:
-            slow_motion = True
+            inputs.dy = 1
+        inputs.slow = keys[pygame.K_s] # 모라 능력: 슬로우 모션 (S 키를 누르고 있는 동안 활성화)
+        rewinding = keys[pygame.K_r] # R 키를 누르고 있는 동안 되감기
+        profiler.mark("events")
+
+        # 게임 프레임 속도 제어 (렌더링 속도는 시뮬레이션 속도와 독립적)
+        if idle:
+            # 기다린 시간은 시뮬레이션하지 않고(멈춰 있었으므로 바뀔 것이 없음), 깨어난 입력은 지연 없이 바로 1틱 진행합니다.
+            clock.tick()
+            frame_time = tick_time / state.time_scale(inputs.slow)
+            idle = False
         else:
-            slow_motion = False
-        
-        # 쿨다운 타이머 감소
-        if hint_cooldown_timer > 0:
-            hint_cooldown_timer -= 1
-        if break_wall_cooldown_timer > 0:
-            break_wall_cooldown_timer -= 1
-
-        # 움직이는 발판 업데이트
-        maze.moving_platforms.update()
-        # 플레이어 이동 및 충돌 처리
-        player.move(dx, dy, maze.walls, maze.transparent_walls, maze.moving_platforms)
-
-        # 레벨 완료 조건 확인
-        if player.rect.colliderect(pygame.Rect(maze.end_pos[0] * TILE_SIZE, maze.end_pos[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
-            current_level_index += 1 # 다음 레벨로 이동
-            if current_level_index < len(LEVELS): # 모든 레벨을 완료하지 않았다면
-                load_level(current_level_index) # 다음 레벨 불러오기
+            frame_time = min(clock.tick(MAX_FPS) / 1000.0, MAX_FRAME_TIME)
+        profiler.mark("wait")
+
+        # 백그라운드 레벨 검증이 끝났으면 결과를 확인합니다.
+        if validation is not None and validation.done():
+            for index, solution in enumerate(validation.result()):
+                if solution is None:
+                    raise SystemExit(f"Level {index + 1} cannot be solved")
+            validation = None
+
+        # 전환/승리 화면은 게임을 멈춘 채 이벤트 처리만 계속하다가 시간이 지나면 끝납니다.
+        if message_until is not None:
+            inputs.clear_actions() # 화면이 표시되는 동안 눌린 능력 키는 무시
+            if time.perf_counter() < message_until:
+                profiler.end_frame()
+                continue
+            message_until = None
+            if state.won:
+                break # 승리 화면이 끝나면 게임 종료
+            if renderer is not None:
+                renderer.invalidate() # 게임 화면 전체를 다시 그림
+
+        # 고정 시간 간격 시뮬레이션: 슬로우 모션은 시뮬레이션 시간 배율로만 적용됩니다.
+        accumulator += frame_time * state.time_scale(inputs.slow)
+        stepped = False
+        if rewinding:
+            # 되감는 동안에는 시뮬레이션을 멈추고, 흐른 틱 수의 REWIND_SPEED배만큼 기록을 거꾸로 적용합니다.
+            inputs.clear_actions()
+            ticks = int(accumulator / tick_time)
+            accumulator -= ticks * tick_time
+            if ticks and rewind.rewind(state, ticks * REWIND_SPEED):
+                if recorder is not None:
+                    recorder.rewind(state) # 되돌린 틱의 입력은 기록에서도 지움
+                stepped = True
+        while not rewinding and accumulator >= tick_time and not state.won and state.level_index == shown_level:
+            state.step(inputs)
+            rewind.record(state)
+            if telemetry is not None:
+                telemetry.sample(state)
+            if recorder is not None:
+                recorder.record(inputs)
+            inputs.clear_actions()
+            accumulator -= tick_time
+            stepped = True
+
+        if spectators is not None and stepped:
+            spectators.publish(state) # 이번 프레임의 마지막 틱 상태만 넘기고 직렬화와 전송은 서버 스레드에서 처리
+
+        if state.won or state.level_index != shown_level:
+            # 게임 승리 또는 다음 레벨 전환 화면 (루프를 멈추지 않고 일정 시간 동안 표시)
+            accumulator = 0.0
+            if state.won:
+                show_message("YOU WIN!", GREEN)
+                message_until = time.perf_counter() + WIN_SCREEN_TIME
             else:
-                # 게임 승리 화면
-                screen.fill(BLACK) # 화면을 검은색으로 채움
-                win_font = pygame.font.Font(None, 74) # 큰 폰트 설정
-                win_text = win_font.render("YOU WIN!", True, GREEN) # 승리 메시지 렌더링
-                win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)) # 화면 중앙에 위치
-                screen.blit(win_text, win_rect) # 화면에 메시지 그리기
-                pygame.display.flip() # 화면 업데이트
-                pygame.time.wait(3000) # 3초 동안 승리 화면 보여주기
-                running = False # 게임 종료
+                shown_level = state.level_index
+                show_message(f"LEVEL {shown_level + 1}", WHITE)
+                message_until = time.perf_counter() + LEVEL_TRANSITION_TIME
+                collect_garbage() # 이전 레벨의 미로를 전환 화면이 보이는 동안 정리
+            profiler.end_frame()
+            continue
 
-        # 화면 그리기
-        screen.fill(WHITE) # 배경을 흰색으로 채움
-        maze.draw(screen) # 미로 그리기
-        # 카이론 힌트 경로 그리기 (힌트가 활성화되어 있고 타이머가 남아있을 경우)
-        if hint_path and hint_timer > 0:
-            for pos in hint_path:
-                pygame.draw.rect(screen, HINT_COLOR, (pos[0] * TILE_SIZE, pos[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-            hint_timer -= 1 # 힌트 타이머 감소
-        player.draw(screen) # 플레이어 그리기
-
-        # UI 그리기
-        font = pygame.font.Font(None, 24) # UI 폰트 설정
-
-        # 현재 인격 표시
-        persona_text = ""
-        persona_color = WHITE
-        if player.persona == PERSONA_CHIRON:
-            persona_text = "현재 인격: 카이론 (1)"
-            persona_color = CHIRON_COLOR
-        elif player.persona == PERSONA_ERIDA:
-            persona_text = "현재 인격: 에리다 (2)"
-            persona_color = ERIDA_COLOR
-        elif player.persona == PERSONA_MORA:
-            persona_text = "현재 인격: 모라 (3)"
-            persona_color = MORA_COLOR
-        
-        persona_display = font.render(persona_text, True, persona_color) # 인격 텍스트 렌더링
-        screen.blit(persona_display, (10, 10)) # 화면에 인격 텍스트 표시
-
-        # 능력 쿨다운 표시
-        # 쿨다운 시간을 초 단위로 변환하여 표시 (60프레임 = 1초)
-        hint_cooldown_text = f"힌트 쿨다운: {hint_cooldown_timer // 60}초"
-        break_wall_cooldown_text = f"벽 부수기 쿨다운: {break_wall_cooldown_timer // 60}초"
-
-        hint_display = font.render(hint_cooldown_text, True, UI_TEXT_COLOR) # 힌트 쿨다운 텍스트 렌더링
-        break_wall_display = font.render(break_wall_cooldown_text, True, UI_TEXT_COLOR) # 벽 부수기 쿨다운 텍스트 렌더링
-
-        screen.blit(hint_display, (10, 40)) # 힌트 쿨다운 표시
-        screen.blit(break_wall_display, (10, 70)) # 벽 부수기 쿨다운 표시
-
-        pygame.display.flip() # 화면 전체 업데이트
-
-        # 게임 프레임 속도 제어
-        if slow_motion: # 슬로우 모션 활성화 시
-            clock.tick(20) # 20 FPS로 느리게
+        # 화면 그리기 (직전 틱과 현재 틱 사이를 보간)
+        alpha = accumulator / tick_time
+        player_rect = state.interpolated_player_rect(alpha)
+        maze = state.maze
+        camera.follow(player_rect, maze.tile_width * TILE_SIZE, maze.tile_height * TILE_SIZE) # 카메라가 플레이어를 따라감
+        visible_hint = state.visible_hint() # 타이머가 남아 있는 동안만 힌트 표시
+        hud_changed = hud.update(state.player.persona, state.hint_cooldown_timer, state.break_wall_cooldown_timer) # 표시 값이 바뀐 경우에만 텍스트를 다시 준비
+        profiler.mark("camera")
+
+        # 화면에 보이는 것이 하나도 바뀌지 않았으면 그리기와 화면 갱신을 건너뜁니다.
+        frame = (player_rect.topleft, camera.rect.topleft, visible_hint, maze)
+        changed = (not IDLE_PACING or drawn_frame is None or hud_changed
+                   or frame[:2] != drawn_frame[:2] or frame[2] is not drawn_frame[2] or frame[3] is not drawn_frame[3]
+                   or maze.dirty_tiles or maze.platforms.moving(camera.rect) # 부서진 벽, 보이는 곳에서 움직이는 발판
+                   or profiler is not NULL_PROFILER or (renderer is not None and renderer.full_redraw))
+        if IDLE_PACING and not changed:
+            # 누르고 있는 키, 진행 중인 타이머, 주변에서 움직이는 발판이 없으면 다음 프레임은 이벤트를 기다립니다.
+            idle = (inputs.dx == 0 and inputs.dy == 0 and not inputs.slow and not rewinding
+                    and state.hint_timer == 0 and state.hint_cooldown_timer == 0
+                    and state.break_wall_cooldown_timer == 0 and not maze.platforms.moving(state.player.rect, PLATFORM_ACTIVE_CHUNKS))
+            profiler.end_frame()
+            continue
+        drawn_frame = frame
+        if renderer is not None:
+            # 캐시된 정적 레이어 위에 움직이는 요소만 합성하고 바뀐 영역만 화면에 반영
+            renderer.render(maze, state.player, visible_hint, draw_hud, camera, player_rect, alpha)
         else:
-            clock.tick(60) # 60 FPS로 정상 속도
+            screen.fill(WHITE) # 배경을 흰색으로 채움
+            maze.chunks.draw(screen, camera) # 뷰포트에 보이는 청크의 벽 그리기
+            maze.chunks.evict_far(camera) # 카메라에서 멀어진 청크는 캐시에서 제거
+            profiler.mark("static")
+            # 카이론 힌트 경로 그리기 (힌트가 활성화되어 있고 타이머가 남아있을 경우)
+            if visible_hint:
+                for x, y in visible_hint:
+                    hint_rect.topleft = (x * TILE_SIZE, y * TILE_SIZE) # 타일마다 새 Rect를 만들지 않고 재사용
+                    if camera.rect.colliderect(hint_rect): # 화면에 보이는 타일만 그림
+                        hint_rect.move_ip(-camera.rect.x, -camera.rect.y)
+                        pygame.draw.rect(screen, HINT_COLOR, hint_rect)
+            profiler.mark("hint")
+            maze.draw_dynamic(screen, camera, alpha) # 움직이는 발판 그리기
+            state.player.draw(screen, camera.apply(player_rect)) # 플레이어 그리기
+            profiler.mark("sprites")
+            draw_hud(screen) # UI 그리기
+            pygame.display.flip() # 화면 전체 업데이트
+            profiler.mark("flip")
+        profiler.end_frame()
+
+        if first_frame_time is None:
+            # 첫 화면이 표시된 시점까지의 시간을 기록하고, 레벨 검증은 그 뒤에 백그라운드에서 시작합니다.
+            first_frame_time = time.perf_counter() - launch_time
+            print(f"Time to first frame: {first_frame_time * 1000:.1f} ms")
+            if first_frame_time > STARTUP_BUDGET:
+                print(f"Warning: first frame exceeded the startup budget of {STARTUP_BUDGET * 1000:.0f} ms")
+            if VALIDATE_LEVELS_ON_STARTUP and levels is LEVELS: # 팩은 만들 때 검증하므로 levels.py만 검사
+                validation = startup.submit(validate_levels, LEVELS)
+            collect_garbage() # 시작하면서 만든 객체를 정리하고 이후 컬렉션 대상에서 제외
 
+    if recorder is not None:
+        recorder.save(RECORDING_PATH, state) # 기록한 입력과 마지막 상태 저장
+    if telemetry is not None:
+        telemetry.close() # 남은 이벤트 저장
+    if spectators is not None:
+        spectators.stop() # 관전자 연결 종료
+    if profiler is allocation_profiler:
+        use_profiler(NULL_PROFILER) # 추적 중이면 할당 보고서 저장
+    if frame_profiler.frames > 0:
+        frame_profiler.export_csv(PROFILE_CSV_PATH) # 프로파일링한 적이 있으면 측정값 저장
+    startup.shutdown(wait=False, cancel_futures=True)
+    preloader.shutdown() # 백그라운드 스레드 종료
+    if levels is not LEVELS:
+        levels.close() # 레벨 팩 닫기
     pygame.quit() # Pygame 종료
 
 if __name__ == "__main__":
@@ -4,138 +4,482 @@
 # 미로를 화면에 그리는 역할을 담당하는 파일입니다.
 
 import pygame
+import numpy as np
 from config import *
 import heapq # A* 알고리즘을 위한 우선순위 큐 구현
+from collections import deque # 거리장 갱신 범위를 찾기 위한 큐
+from chunks import ChunkedLayer
+from platforms import PlatformSystem
+from pathfinder import HierarchicalPathfinder
 
-# 움직이는 발판 클래스
-class MovingPlatform(pygame.sprite.Sprite):
-    def __init__(self, x, y):
+# 타일 종류 코드 (레벨 데이터의 문자를 그대로 uint8 값으로 저장)
+TILE_EMPTY = ord(' ')       # 빈 공간
+TILE_WALL = ord('X')        # 일반 벽
+TILE_TRANSPARENT = ord('T') # 투명한 벽 (모라만 통과 가능)
+TILE_BREAKABLE = ord('B')   # 부술 수 있는 벽 (에리다가 파괴하면 빈 공간이 됨)
+TILE_PLATFORM = ord('H')    # 움직이는 발판 시작 위치
+TILE_START = ord('P')       # 플레이어 시작 위치
+TILE_EXIT = ord('E')        # 미로 탈출구
+
+# 정적 레이어에 그려지는 타일 종류별 색상 (타일 코드 -> RGB 팔레트)
+TILE_PALETTE = np.zeros((256, 3), dtype=np.uint8)
+TILE_PALETTE[:] = WHITE
+TILE_PALETTE[TILE_WALL] = WALL_COLOR          # 일반 벽
+TILE_PALETTE[TILE_TRANSPARENT] = (128, 128, 128) # 투명한 벽 (회색)
+TILE_PALETTE[TILE_BREAKABLE] = (139, 69, 19)  # 부술 수 있는 벽 (갈색)
+
+def level_to_tiles(level_data):
+    """
+    레벨 데이터를 2차원 uint8 타일 배열로 변환합니다.
+    Args:
+        level_data (list | numpy.ndarray): 2D 문자열 배열 형태의 레벨 데이터 또는 타일 배열
+    Returns:
+        numpy.ndarray: (세로, 가로) 크기의 uint8 타일 배열 (새로 할당된 복사본)
+    """
+    if isinstance(level_data, np.ndarray):
+        return np.array(level_data, dtype=np.uint8) # 원본이 바뀌지 않도록 복사
+    width = len(level_data[0])
+    data = "".join(level_data).encode("ascii")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(level_data), width).copy()
+
+# 미로 클래스
+class Maze:
+    def __init__(self, level_data):
         """
-        움직이는 발판을 초기화합니다.
+        미로를 초기화합니다. 주어진 레벨 데이터에 따라 미로를 구성합니다.
         Args:
-            x (int): 발판의 초기 X 좌표 (픽셀)
-            y (int): 발판의 초기 Y 좌표 (픽셀)
+            level_data (list | numpy.ndarray): 2D 문자열 배열 형태의 미로 레벨 데이터 또는 uint8 타일 배열
         """
-        super().__init__()
-        self.image = pygame.Surface((TILE_SIZE * 2, TILE_SIZE // 2)) # 발판 이미지 생성
-        self.image.fill(BLUE) # 발판 색상 설정
-        self.rect = self.image.get_rect(topleft=(x, y)) # 발판의 위치와 크기 설정
-        self.start_x = x # 발판의 시작 X 좌표
-        self.end_x = x + TILE_SIZE * 5 # 발판의 이동 끝 X 좌표 (5타일 오른쪽)
-        self.speed = 2 # 발판의 이동 속도
+        # 미로 전체를 하나의 2차원 uint8 타일 배열로 저장합니다. (tiles[y, x])
+        # 생성, 경로 탐색, 충돌 처리, 렌더링이 모두 이 배열을 읽습니다.
+        self.tiles = level_to_tiles(level_data)
+        self.tile_height, self.tile_width = self.tiles.shape # 미로의 세로/가로 타일 개수
+        self.chunks = ChunkedLayer(self, TILE_PALETTE) # 청크 단위로 캐시되는 정적 레이어
+        self.dirty_tiles = [] # 정적 레이어에서 바뀐 타일 영역 (월드 좌표, 화면에 다시 반영해야 할 Rect)
+        self.broken_walls = [] # 지금까지 부서진 벽의 (x, y) 타일 좌표 (부순 순서)
+
+        # 페르소나별 통과 가능 여부 마스크 (충돌 인덱스 역할)
+        # 카이론과 에리다는 같은 마스크를 공유하고, 모라는 투명한 벽도 통과할 수 있습니다.
+        # 부술 수 있는 벽(B)은 모든 페르소나에게 부서지기 전까지 막혀 있습니다. 처음 버전에서는 그려지기만 하고
+        # 충돌하지 않아 에리다의 능력이 쓸모없었으므로 바꾼 규칙이며, 풀이기(solver.py), 생성기(generator.py),
+        # 배치 환경(batch_env.py)이 모두 이 규칙을 따릅니다. 힌트와 경로 탐색은 벽을 부술 수 있으므로 비용을 더해 지나갑니다.
+        solid = (self.tiles == TILE_WALL) | (self.tiles == TILE_BREAKABLE)
+        base_walkable = ~(solid | (self.tiles == TILE_TRANSPARENT))
+        mora_walkable = ~solid
+        self.walkable = {
+            PERSONA_CHIRON: base_walkable,
+            PERSONA_ERIDA: base_walkable,
+            PERSONA_MORA: mora_walkable,
+        }
+        self.walkable_masks = (base_walkable, mora_walkable) # 서로 다른 마스크 목록 (갱신용)
+
+        # 레벨 데이터에서 특수 타일의 위치를 찾습니다.
+        self.start_pos = self._find_tile(TILE_START) # 플레이어 시작 위치 (타일 좌표)
+        self.end_pos = self._find_tile(TILE_EXIT) # 미로 탈출구 위치 (타일 좌표)
+        # 움직이는 발판 (모든 발판의 위치, 이동 범위, 속도를 배열로 관리)
+        self.platforms = PlatformSystem(np.argwhere(self.tiles == TILE_PLATFORM)[:, ::-1])
 
-    def update(self):
+        # 카이론의 힌트에서 각 타일에 들어가는 비용 (0이면 지나갈 수 없음)
+        # 일반 벽(X)만 막혀 있습니다. 투명한 벽(T)은 모라로 바꾸면, 부술 수 있는 벽(B)은 에리다가 부수면 지나갈 수 있으므로 열려 있고,
+        # 부서지지 않은 벽은 HINT_BREAKABLE_COST만큼 비싸서 힌트는 많이 돌아가야 할 때만 벽을 지나갑니다.
+        self.hint_cost = np.ones(self.tiles.shape, dtype=np.uint8)
+        self.hint_cost[self.tiles == TILE_WALL] = 0
+        self.hint_cost[self.tiles == TILE_BREAKABLE] = HINT_BREAKABLE_COST
+        # 탈출구까지의 비용 거리장 (카이론의 힌트에 사용, 레벨마다 한 번 계산하고 벽이 바뀌면 주변만 갱신)
+        self.distance_field = self._build_distance_field()
+        # 계층적 경로 탐색기 (큰 미로에서 처음 find_path를 호출할 때 만듦, 힌트는 거리장을 쓰므로 레벨을 불러올 때는 비용이 없음)
+        self.pathfinder = None
+
+    def _find_tile(self, code):
         """
-        매 프레임마다 발판의 위치를 업데이트하고, 이동 범위를 벗어나면 방향을 바꿉니다.
+        지정된 종류의 첫 번째 타일 좌표를 찾습니다.
+        Args:
+            code (int): 찾을 타일 코드
+        Returns:
+            tuple: (x, y) 타일 좌표 (없으면 None)
         """
-        self.rect.x += self.speed
-        # 발판이 이동 범위를 벗어나면 방향을 반전시킵니다.
-        if self.rect.left < self.start_x or self.rect.right > self.end_x:
-            self.speed *= -1
+        found = np.argwhere(self.tiles == code)
+        if len(found) == 0:
+            return None
+        return (int(found[0][1]), int(found[0][0]))
 
+    @property
+    def grid(self):
+        """
+        타일 배열을 2D 문자열 배열 형태로 변환하여 반환합니다. (디버깅 및 호환용)
+        Returns:
+            list: 행별 문자열 리스트
+        """
+        return [row.tobytes().decode("ascii") for row in self.tiles]
 
-# 미로 클래스
-class Maze:
-    def __init__(self, level_data):
+    def blocking_edge(self, rect, persona, dx, dy):
         """
-        미로를 초기화합니다. 주어진 레벨 데이터에 따라 미로를 구성합니다.
+        주어진 Rect와 겹치는 타일 중 해당 페르소나가 통과할 수 없는 타일에서, 이동 방향으로 가장 먼저 닿는 경계를 찾습니다.
+        전체 벽을 순회하지 않고 Rect가 걸쳐 있는 몇 개의 타일만 통과 가능 마스크에서 확인하므로,
+        레벨 크기와 관계없이 일정한 비용으로 동작하며 충돌 Rect나 리스트를 만들지 않습니다.
         Args:
-            level_data (list): 2D 문자열 배열 형태의 미로 레벨 데이터
-        """
-        self.grid = level_data # 미로의 2D 배열 데이터
-        self.tile_width = len(self.grid[0]) # 미로의 가로 타일 개수
-        self.tile_height = len(self.grid) # 미로의 세로 타일 개수
-        self.walls = [] # 일반 벽 Rect 객체 리스트
-        self.transparent_walls = [] # 투명한 벽 Rect 객체 리스트 (모라 통과 가능)
-        self.breakable_walls = [] # 부술 수 있는 벽 Rect 객체 리스트 (에리다 파괴 가능)
-        self.moving_platforms = pygame.sprite.Group() # 움직이는 발판 Sprite 그룹
-        self.start_pos = None # 플레이어 시작 위치 (타일 좌표)
-        self.end_pos = None # 미로 탈출구 위치 (타일 좌표)
-
-        # 레벨 데이터를 파싱하여 미로 요소들을 초기화합니다.
-        for y, row in enumerate(self.grid):
-            for x, char in enumerate(row):
-                if char == 'X': # 일반 벽
-                    self.walls.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-                elif char == 'T': # 투명한 벽
-                    self.transparent_walls.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-                elif char == 'B': # 부술 수 있는 벽
-                    self.breakable_walls.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-                elif char == 'H': # 움직이는 발판
-                    self.moving_platforms.add(MovingPlatform(x * TILE_SIZE, y * TILE_SIZE))
-                elif char == 'P': # 플레이어 시작 위치
-                    self.start_pos = (x, y)
-                elif char == 'E': # 미로 탈출구
-                    self.end_pos = (x, y)
-
-    def draw(self, screen):
-        """
-        미로의 모든 요소를 화면에 그립니다.
+            rect (pygame.Rect): 충돌을 검사할 영역 (픽셀 좌표)
+            persona (str): 충돌 규칙을 결정하는 페르소나
+            dx (int): X축 이동 방향 (한 축만 지정, 0이 아니면 X축 경계를 찾음)
+            dy (int): Y축 이동 방향
+        Returns:
+            int: 오른쪽/왼쪽/아래/위로 이동 중이면 가장 가까운 고체 타일의 왼쪽/오른쪽/위/아래 경계 (픽셀, 겹치는 고체 타일이 없으면 None)
+        """
+        walkable = self.walkable[persona]
+        # Rect가 걸쳐 있는 타일 범위를 미로 범위 안으로 제한합니다.
+        left = max(rect.left // TILE_SIZE, 0)
+        right = min((rect.right - 1) // TILE_SIZE, self.tile_width - 1)
+        top = max(rect.top // TILE_SIZE, 0)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, self.tile_height - 1)
+
+        # 이동 방향에서 가까운 열(행)부터 확인하여 처음 만난 고체 타일의 경계를 반환합니다.
+        if dx:
+            columns = range(left, right + 1) if dx > 0 else range(right, left - 1, -1)
+            for x in columns:
+                for y in range(top, bottom + 1):
+                    if not walkable[y, x]:
+                        return x * TILE_SIZE if dx > 0 else (x + 1) * TILE_SIZE
+        elif dy:
+            rows = range(top, bottom + 1) if dy > 0 else range(bottom, top - 1, -1)
+            for y in rows:
+                for x in range(left, right + 1):
+                    if not walkable[y, x]:
+                        return y * TILE_SIZE if dy > 0 else (y + 1) * TILE_SIZE
+        return None
+
+    def break_wall_at(self, x, y):
+        """
+        지정된 타일의 부술 수 있는 벽을 제거하고, 타일 배열과 통과 가능 마스크를 갱신합니다.
+        Args:
+            x (int): 부술 벽의 X 타일 좌표
+            y (int): 부술 벽의 Y 타일 좌표
+        Returns:
+            bool: 벽을 부쉈으면 True, 해당 위치에 부술 수 있는 벽이 없으면 False
+        """
+        if not (0 <= x < self.tile_width and 0 <= y < self.tile_height):
+            return False
+        if self.tiles[y, x] != TILE_BREAKABLE:
+            return False
+
+        # 타일을 빈 공간으로 바꾸고, 모든 페르소나가 통과할 수 있도록 마스크를 제자리에서 갱신합니다.
+        self.tiles[y, x] = TILE_EMPTY
+        for walkable in self.walkable_masks:
+            walkable[y, x] = True
+        self.broken_walls.append((x, y))
+        self.hint_cost[y, x] = 1
+        self._update_pathfinder(x, y)
+
+        # 부서진 타일을 거쳐 가는 비용이 줄었으므로, 탈출구까지의 거리장을 그 주변만 다시 계산합니다.
+        self._repair_distance_field(x, y)
+        # 캐시된 정적 레이어에서 해당 타일만 다시 그립니다.
+        self.invalidate_tile(x, y)
+        return True
+
+    def restore_wall_at(self, x, y):
+        """
+        부서진 벽을 다시 세웁니다. (되감기용) 미로를 새로 만들지 않고 타일 배열, 통과 가능 마스크, 거리장만 갱신합니다.
+        Args:
+            x (int): 다시 세울 벽의 X 타일 좌표
+            y (int): 다시 세울 벽의 Y 타일 좌표
+        Returns:
+            bool: 벽을 다시 세웠으면 True, 해당 위치에 부서진 벽이 없으면 False
+        """
+        if (x, y) not in self.broken_walls:
+            return False
+        self.broken_walls.remove((x, y))
+        self.tiles[y, x] = TILE_BREAKABLE
+        for walkable in self.walkable_masks:
+            walkable[y, x] = False
+        self.hint_cost[y, x] = HINT_BREAKABLE_COST
+        self._update_pathfinder(x, y)
+
+        # 타일 비용이 늘면 거리는 늘어나기만 하므로, 이 타일을 거쳐 가던 타일의 거리만 다시 계산합니다.
+        self._close_distance_field(x, y, 1)
+        self.invalidate_tile(x, y)
+        return True
+
+    def _update_pathfinder(self, x, y):
+        """
+        바뀐 타일을 경로 탐색기에 알립니다. 힌트 비용이 바뀌었으면 그 타일의 클러스터만 다시 만들어집니다.
+        Args:
+            x (int): 바뀐 X 타일 좌표
+            y (int): 바뀐 Y 타일 좌표
+        """
+        if self.pathfinder is not None:
+            self.pathfinder.set_cost(x, y, self.hint_cost[y, x])
+
+    def _build_distance_field(self):
+        """
+        탈출구에서 시작하는 다익스트라 탐색으로 모든 타일에서 탈출구까지의 최소 힌트 비용을 계산합니다.
+        타일 비용이 HINT_BREAKABLE_COST 이하의 작은 정수이므로 힙 대신 거리별 버킷을 돌려 쓰며(다이얼 알고리즘),
+        너비 우선 탐색과 비슷한 속도로 동작합니다.
+        Returns:
+            numpy.ndarray: (세로, 가로) 크기의 int32 비용 배열 (도달할 수 없는 타일은 -1)
+        """
+        width, height = self.tile_width, self.tile_height
+        distance = [-1] * (width * height)
+        if self.end_pos is not None:
+            cost = self.hint_cost.ravel().tolist()
+            goal = self.end_pos[1] * width + self.end_pos[0]
+            distance[goal] = 0
+            # 거리 % 버킷 수 -> 그 거리로 정해진 타일 (한 번에 늘어나는 거리는 버킷 수보다 작으므로 겹치지 않음)
+            buckets = [[] for _ in range(HINT_BREAKABLE_COST + 1)]
+            buckets[0].append(goal)
+            current, pending = 0, 1
+            while pending:
+                bucket = buckets[current % len(buckets)]
+                for tile in bucket:
+                    if distance[tile] != current:
+                        continue # 나중에 더 짧은 거리로 다시 들어간 타일
+                    cx, cy = tile % width, tile // width
+                    # 이웃에서 이 타일로 들어오는 비용을 더한 값이 이웃의 거리 후보입니다.
+                    next_distance = current + cost[tile]
+                    for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                        if 0 <= nx < width and 0 <= ny < height:
+                            neighbor = ny * width + nx
+                            if cost[neighbor] and (distance[neighbor] < 0 or next_distance < distance[neighbor]):
+                                distance[neighbor] = next_distance
+                                buckets[next_distance % len(buckets)].append(neighbor)
+                                pending += 1
+                pending -= len(bucket)
+                bucket.clear()
+                current += 1
+        return np.array(distance, dtype=np.int32).reshape(height, width)
+
+    def _repair_distance_field(self, x, y):
+        """
+        비용이 줄어든 타일 주변의 거리장만 갱신합니다.
+        타일에 들어가는 비용이 줄면 거리는 줄어들기만 하므로, 이 타일을 거쳐 가며 거리가 짧아지는 타일만 다시 탐색합니다.
+        Args:
+            x (int): 비용이 줄어든 X 타일 좌표
+            y (int): 비용이 줄어든 Y 타일 좌표
+        """
+        distance = self.distance_field
+        cost = self.hint_cost
+        width, height = self.tile_width, self.tile_height
+        if distance[y, x] < 0:
+            return # 탈출구와 연결되지 않은 영역
+
+        # 타일 자신의 거리는 그대로이고, 이 타일로 들어오는 이웃부터 개선되는 타일만 전파합니다.
+        heap = [(int(distance[y, x]), x, y)]
+        while heap:
+            d, cx, cy = heapq.heappop(heap)
+            if d > distance[cy, cx]:
+                continue # 이미 더 짧은 거리로 처리된 타일
+            next_distance = d + int(cost[cy, cx])
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                if 0 <= nx < width and 0 <= ny < height and cost[ny, nx]:
+                    nd = distance[ny, nx]
+                    if nd < 0 or next_distance < nd:
+                        distance[ny, nx] = next_distance
+                        heapq.heappush(heap, (next_distance, nx, ny))
+
+    def _close_distance_field(self, x, y, old_cost):
+        """
+        비용이 늘어난 타일의 영향을 받는 부분만 거리장을 다시 계산합니다.
+        이 타일에 들어가며 거리가 정해진 타일(이전 비용만큼 거리가 늘어나는 이웃)과 그 뒤로 이어진 타일만 이 타일을 거쳐 탈출구로 가므로,
+        그 타일들의 거리를 지우고 영향받지 않은 이웃의 거리에서부터 다시 채웁니다.
+        Args:
+            x (int): 비용이 늘어난 X 타일 좌표
+            y (int): 비용이 늘어난 Y 타일 좌표
+            old_cost (int): 늘어나기 전의 타일 비용
+        """
+        distance = self.distance_field
+        cost = self.hint_cost
+        width, height = self.tile_width, self.tile_height
+        if distance[y, x] < 0:
+            return # 탈출구와 연결되지 않은 타일이었으므로 바뀌는 거리가 없음
+
+        # 이 타일을 거쳐 가던 타일을 모읍니다. (그 타일을 거쳐 가는 이웃이 가졌을 거리를 함께 넣어 두고 거리장에는 -2로 표시)
+        affected = []
+        queue = deque([(x, y, int(distance[y, x]) + old_cost)])
+        while queue:
+            cx, cy, through = queue.popleft()
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                if 0 <= nx < width and 0 <= ny < height and distance[ny, nx] == through:
+                    distance[ny, nx] = -2
+                    affected.append((nx, ny))
+                    queue.append((nx, ny, through + int(cost[ny, nx])))
+
+        # 영향받지 않은 이웃에서 이어지는 가장 작은 비용으로 시작하여 다익스트라 방식으로 다시 채웁니다.
+        heap = []
+        for cx, cy in affected:
+            distance[cy, cx] = -1
+            best = -1
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                if 0 <= nx < width and 0 <= ny < height and distance[ny, nx] >= 0:
+                    d = int(distance[ny, nx]) + int(cost[ny, nx])
+                    if best < 0 or d < best:
+                        best = d
+            if best >= 0:
+                heapq.heappush(heap, (best, cx, cy))
+        while heap:
+            d, cx, cy = heapq.heappop(heap)
+            if 0 <= distance[cy, cx] <= d:
+                continue # 이미 더 짧은 거리로 채워진 타일
+            distance[cy, cx] = d
+            next_distance = d + int(cost[cy, cx])
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                if 0 <= nx < width and 0 <= ny < height and cost[ny, nx]:
+                    nd = distance[ny, nx]
+                    if nd < 0 or next_distance < nd:
+                        heapq.heappush(heap, (next_distance, nx, ny))
+
+    def hint_path(self, start_node):
+        """
+        거리장을 따라 내려가며 지정된 타일에서 탈출구까지의 경로를 만듭니다.
+        부서지지 않은 벽(B)을 지나야 하는 경로도 만들어지고, 일반 벽(X)으로 탈출구와 막힌 위치에만 경로가 없습니다.
+        Args:
+            start_node (tuple): 시작 지점의 (x, y) 타일 좌표 (보통 플레이어의 현재 타일)
+        Returns:
+            list: 탈출구까지의 타일 좌표 리스트 (없으면 None)
+        """
+        x, y = start_node
+        if not (0 <= x < self.tile_width and 0 <= y < self.tile_height):
+            return None
+        distance = self.distance_field
+        if distance[y, x] < 0:
+            return None
+
+        cost = self.hint_cost
+        path = [(x, y)]
+        current = distance[y, x]
+        while current > 0:
+            # 들어가는 비용만큼 거리가 정확히 줄어드는 이웃으로 한 칸 이동합니다.
+            for nx, ny in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)):
+                if (0 <= nx < self.tile_width and 0 <= ny < self.tile_height and cost[ny, nx]
+                        and distance[ny, nx] == current - cost[ny, nx]):
+                    x, y = nx, ny
+                    break
+            else:
+                break # 거리장이 어긋난 경우 (일어나지 않아야 함)
+            current = distance[y, x]
+            path.append((x, y))
+        return path
+
+    def invalidate_tile(self, x, y):
+        """
+        정적 레이어에서 한 타일만 현재 타일 배열에 맞게 다시 그리고, 변경 영역으로 기록합니다.
+        Args:
+            x (int): 다시 그릴 X 타일 좌표
+            y (int): 다시 그릴 Y 타일 좌표
+        """
+        self.chunks.invalidate_tile(x, y)
+        self.dirty_tiles.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+
+    def pop_dirty_tiles(self):
+        """
+        마지막 호출 이후 정적 레이어에서 바뀐 타일 영역을 반환하고 목록을 비웁니다.
+        Returns:
+            list: 바뀐 타일의 pygame.Rect 리스트 (월드 좌표)
+        """
+        dirty = self.dirty_tiles
+        if dirty: # 바뀐 타일이 없는 프레임에는 새 리스트를 만들지 않음
+            self.dirty_tiles = []
+        return dirty
+
+    def update_platforms(self, rect):
+        """
+        기준 영역 주변(PLATFORM_ACTIVE_CHUNKS 청크 이내)의 움직이는 발판만 업데이트합니다.
+        멀리 떨어진 발판은 멈춰 있다가 플레이어가 다가오면 다시 움직입니다.
+        Args:
+            rect (pygame.Rect): 기준 영역 (보통 플레이어의 월드 좌표 Rect)
+        """
+        self.platforms.update(rect)
+
+    def draw(self, screen, camera):
+        """
+        미로의 모든 요소 중 뷰포트에 보이는 부분을 화면에 그립니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+            camera (Camera): 현재 카메라
+        """
+        # 벽은 뷰포트와 겹치는 청크의 캐시된 Surface만 복사합니다.
+        self.chunks.draw(screen, camera)
+        self.draw_dynamic(screen, camera)
+
+    def draw_dynamic(self, screen, camera, alpha=1.0):
+        """
+        매 프레임 위치가 바뀌는 미로 요소(움직이는 발판) 중 뷰포트 근처의 것만 화면에 그립니다.
         Args:
             screen (pygame.Surface): 게임 화면 Surface 객체
+            camera (Camera): 현재 카메라
+            alpha (float): 직전 틱과 현재 틱 사이의 보간 비율 (1이면 현재 위치)
+        Returns:
+            list: 발판이 그려진 화면 영역의 pygame.Rect 리스트
         """
-        # 일반 벽 그리기
-        for wall in self.walls:
-            pygame.draw.rect(screen, WALL_COLOR, wall)
-        # 투명한 벽 그리기 (회색)
-        for wall in self.transparent_walls:
-            pygame.draw.rect(screen, (128, 128, 128), wall) # Gray for transparent walls
-        # 부술 수 있는 벽 그리기 (갈색)
-        for wall in self.breakable_walls:
-            pygame.draw.rect(screen, (139, 69, 19), wall) # Brown for breakable walls
-        # 움직이는 발판 그리기
-        self.moving_platforms.draw(screen)
+        return self.platforms.draw(screen, camera, alpha)
 
     def find_path(self, start_node, end_node):
         """
-        A* 알고리즘을 사용하여 시작 노드에서 끝 노드까지의 최단 경로를 찾습니다.
+        시작 노드에서 끝 노드까지의 경로를 찾습니다. 일반 벽(X)만 통과 불가로 보고, 타일마다 힌트 비용(hint_cost)을 더합니다.
+        큰 미로는 계층적 경로 탐색(HPA*)으로 경로가 지나가는 클러스터만 타일 단위로 탐색하고,
+        타일 수가 HPA_MIN_TILES 이하인 미로(기본 레벨 포함)는 나눌 이점이 없으므로 find_path_flat으로 최소 비용 경로를 찾습니다.
         Args:
             start_node (tuple): 시작 지점의 (x, y) 타일 좌표
             end_node (tuple): 끝 지점의 (x, y) 타일 좌표
         Returns:
-            list: 최단 경로를 구성하는 타일 좌표 리스트 (없으면 None)
+            list: 경로를 구성하는 타일 좌표 리스트 (없으면 None)
+        """
+        if self.tile_width * self.tile_height <= HPA_MIN_TILES:
+            return self.find_path_flat(start_node, end_node)
+        if self.pathfinder is None:
+            # 클러스터 그래프는 탐색이 그 클러스터에 처음 닿을 때 만들어집니다.
+            self.pathfinder = HierarchicalPathfinder(self.hint_cost)
+        return self.pathfinder.find_path(start_node, end_node)
+
+    def find_path_flat(self, start_node, end_node):
         """
+        A* 알고리즘을 사용하여 시작 노드에서 끝 노드까지의 최소 비용 경로를 타일 단위로 찾습니다. (작은 미로 및 비교용)
+        이웃 타일로 갈 때마다 그 타일의 힌트 비용을 더합니다. (비용이 1 이상이므로 맨해튼 거리 휴리스틱을 그대로 씀)
+        Args:
+            start_node (tuple): 시작 지점의 (x, y) 타일 좌표
+            end_node (tuple): 끝 지점의 (x, y) 타일 좌표
+        Returns:
+            list: 최소 비용 경로를 구성하는 타일 좌표 리스트 (없으면 None)
+        """
+        width = self.tile_width
+        # 타일에 들어가는 1차원 힌트 비용 목록을 만듭니다. (0이면 일반 벽(X)이라 통과 불가)
+        cost = self.hint_cost.ravel().tolist()
+        start = start_node[1] * width + start_node[0] # 1차원 인덱스 (y * width + x)
+        goal = end_node[1] * width + end_node[0]
+
         open_set = []
-        heapq.heappush(open_set, (0, start_node)) # (f_score, node) 형태로 우선순위 큐에 추가
+        heapq.heappush(open_set, (0, start)) # (f_score, node) 형태로 우선순위 큐에 추가
         came_from = {} # 경로 재구성을 위한 이전 노드 저장
-        # 각 노드의 g_score (시작점에서 현재 노드까지의 실제 비용)
-        g_score = { (x,y): float('inf') for y, row in enumerate(self.grid) for x, char in enumerate(row) }
-        g_score[start_node] = 0
-        # 각 노드의 f_score (g_score + 휴리스틱 비용)
-        f_score = { (x,y): float('inf') for y, row in enumerate(self.grid) for x, char in enumerate(row) }
-        f_score[start_node] = self.heuristic(start_node, end_node)
+        # 각 노드의 g_score (시작점에서 현재 노드까지의 실제 비용), 방문하지 않은 노드는 키가 없음
+        g_score = {start: 0}
 
         while open_set:
             _, current = heapq.heappop(open_set) # f_score가 가장 낮은 노드 추출
 
             # 목표 지점에 도달했으면 경로 재구성
-            if current == end_node:
+            if current == goal:
                 path = []
                 while current in came_from:
-                    path.append(current)
+                    path.append((current % width, current // width))
                     current = came_from[current]
                 path.append(start_node)
                 return path[::-1] # 경로를 역순으로 반환
 
-            # 현재 노드의 이웃 탐색
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]: # 상하좌우 이동
-                neighbor = (current[0] + dx, current[1] + dy)
-                
-                # 이웃 노드가 미로 범위 내에 있는지 확인
-                if 0 <= neighbor[0] < self.tile_width and 0 <= neighbor[1] < self.tile_height:
-                    # 이웃 노드가 벽(X)이면 통과 불가
-                    if self.grid[neighbor[1]][neighbor[0]] == 'X':
-                        continue
-
-                    # 새로운 g_score 계산
-                    tentative_g_score = g_score[current] + 1
-                    
-                    # 새로운 g_score가 더 좋으면 업데이트
-                    if tentative_g_score < g_score[neighbor]:
-                        came_from[neighbor] = current
-                        g_score[neighbor] = tentative_g_score
-                        f_score[neighbor] = g_score[neighbor] + self.heuristic(neighbor, end_node)
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
+            cx, cy = current % width, current // width
+            current_g_score = g_score[current]
+            # 현재 노드의 이웃 탐색 (상하좌우 이동)
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                # 이웃 노드가 미로 범위 내에 있고 벽이 아닌지 확인
+                if not (0 <= nx < width and 0 <= ny < self.tile_height):
+                    continue
+                neighbor = ny * width + nx
+                if not cost[neighbor]:
+                    continue
+
+                # 새로운 g_score가 더 좋으면 업데이트
+                tentative_g_score = current_g_score + cost[neighbor]
+                if tentative_g_score < g_score.get(neighbor, tentative_g_score + 1):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    f_score = tentative_g_score + self.heuristic((nx, ny), end_node)
+                    heapq.heappush(open_set, (f_score, neighbor))
         return None # 경로를 찾지 못함
 
     def heuristic(self, a, b):
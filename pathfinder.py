@@ -0,0 +1,424 @@
+
+# pathfinder.py
+# 큰 미로에서 경로를 빠르게 찾기 위한 계층적 경로 탐색(HPA*)을 정의하는 파일입니다.
+# 미로를 HPA_CLUSTER_TILES x HPA_CLUSTER_TILES 타일 크기의 클러스터로 나누고,
+# 이웃한 클러스터 사이의 출입구(transition) 타일과 같은 클러스터 안의 출입구끼리의 비용을 추상 그래프로 만듭니다.
+# 비용은 경로가 지나가는 타일마다 그 타일에 들어가는 비용(Maze.hint_cost)의 합이므로, 방향에 따라 간선 비용이 다를 수 있습니다.
+# 경로는 먼저 추상 그래프에서 찾고, 경로가 지나가는 클러스터 안에서만 타일 단위 경로로 다듬습니다.
+# 클러스터 그래프는 탐색이 그 클러스터에 처음 닿을 때 만들고, 타일이 바뀌면 그 클러스터만 다음 탐색에서 다시 만듭니다.
+
+import heapq
+import numpy as np
+from config import *
+
+
+class HierarchicalPathfinder:
+    def __init__(self, cost, cluster_size=HPA_CLUSTER_TILES):
+        """
+        계층적 경로 탐색기를 초기화합니다. 클러스터 그래프는 build()로 미리 만들거나, 탐색이 그 클러스터에 처음 닿을 때 만들어집니다.
+        Args:
+            cost (numpy.ndarray): (세로, 가로) 크기의 타일에 들어가는 비용 배열 (0이면 통과 불가, 복사하여 보관)
+            cluster_size (int): 클러스터 한 변의 타일 수
+        """
+        self.cost = np.array(cost, dtype=np.uint8)
+        self.passable = self.cost > 0 # 통과 가능 여부 (출입구와 이웃 목록을 찾을 때 사용)
+        self.height, self.width = self.passable.shape
+        self.cluster_size = cluster_size
+        self.clusters_x = -(-self.width // cluster_size) # 가로 클러스터 수
+        self.clusters_y = -(-self.height // cluster_size) # 세로 클러스터 수
+        # (클러스터 X, 클러스터 Y, 방향) -> 그 경계를 건너는 (안쪽 타일, 바깥쪽 타일) 리스트
+        # 방향 0은 오른쪽 이웃 클러스터와의 경계, 1은 아래쪽 이웃 클러스터와의 경계입니다.
+        self.transitions = {}
+        # (클러스터 X, 클러스터 Y) -> {출입구 타일: [(이웃 타일, 비용), ...]} (클러스터 안 비용 + 경계를 건너는 간선)
+        self.graphs = {}
+        self.last_goal = None # 마지막으로 찾은 끝점 타일
+        self.goal_distances = None # last_goal까지의 추상 비용 {출입구 타일: 비용} (build() 또는 같은 끝점으로 다시 찾을 때 만듦)
+
+    def build(self, goal=None):
+        """
+        모든 클러스터의 추상 그래프를 미리 만듭니다. 첫 탐색도 그래프를 만드는 비용 없이 진행해야 할 때 호출합니다. (benchmark.py에서 전체 비용 측정)
+        Args:
+            goal (tuple): 자주 찾을 끝점의 (x, y) 타일 좌표 (주면 모든 출입구에서 이 끝점까지의 추상 비용도 미리 계산)
+        """
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._graph((cx, cy))
+        if goal is not None and self.passable[goal[1], goal[0]]:
+            tile = goal[1] * self.width + goal[0]
+            self.last_goal = tile
+            self.goal_distances = self._distances_to(tile, self._goal_edges(tile))
+
+    def _cluster_of(self, tile):
+        """
+        타일이 속한 클러스터 좌표를 반환합니다.
+        Args:
+            tile (int): 1차원 타일 인덱스 (y * 가로 + x)
+        Returns:
+            tuple: (클러스터 X, 클러스터 Y)
+        """
+        return (tile % self.width // self.cluster_size, tile // self.width // self.cluster_size)
+
+    def _bounds(self, cluster):
+        """
+        클러스터가 차지하는 타일 범위를 반환합니다.
+        Returns:
+            tuple: (왼쪽, 위, 오른쪽, 아래) 타일 좌표 (오른쪽/아래 제외)
+        """
+        cx, cy = cluster
+        size = self.cluster_size
+        return cx * size, cy * size, min((cx + 1) * size, self.width), min((cy + 1) * size, self.height)
+
+    def _border(self, cx, cy, direction):
+        """
+        클러스터와 오른쪽(방향 0) 또는 아래쪽(방향 1) 이웃 사이의 출입구를 찾습니다.
+        경계 양쪽이 모두 열린 타일이 이어지는 구간마다 가운데 한 쌍을 출입구로 씁니다.
+        Returns:
+            list: (이 클러스터 쪽 타일, 이웃 클러스터 쪽 타일) 1차원 인덱스 쌍 리스트
+        """
+        key = (cx, cy, direction)
+        found = self.transitions.get(key)
+        if found is not None:
+            return found
+        left, top, right, bottom = self._bounds((cx, cy))
+        width = self.width
+        found = []
+        if direction == 0 and right < width:
+            inside = self.passable[top:bottom, right - 1] & self.passable[top:bottom, right]
+            for start, end in _runs(inside):
+                y = top + (start + end - 1) // 2
+                found.append((y * width + right - 1, y * width + right))
+        elif direction == 1 and bottom < self.height:
+            inside = self.passable[bottom - 1, left:right] & self.passable[bottom, left:right]
+            for start, end in _runs(inside):
+                x = left + (start + end - 1) // 2
+                found.append(((bottom - 1) * width + x, bottom * width + x))
+        self.transitions[key] = found
+        return found
+
+    def _graph(self, cluster):
+        """
+        클러스터의 추상 그래프(출입구 사이의 비용과 경계를 건너는 간선)를 반환합니다. 처음 호출될 때 만듭니다.
+        Args:
+            cluster (tuple): (클러스터 X, 클러스터 Y)
+        Returns:
+            dict: {출입구 타일: [(이웃 타일, 비용), ...]}
+        """
+        graph = self.graphs.get(cluster)
+        if graph is not None:
+            return graph
+        cx, cy = cluster
+        graph = {}
+        # 네 경계의 출입구 중 이 클러스터 쪽 타일과 경계 건너편 타일을 모읍니다.
+        crossings = []
+        if cx + 1 < self.clusters_x:
+            crossings.extend(self._border(cx, cy, 0))
+        if cy + 1 < self.clusters_y:
+            crossings.extend(self._border(cx, cy, 1))
+        if cx > 0:
+            crossings.extend((inner, outer) for outer, inner in self._border(cx - 1, cy, 0))
+        if cy > 0:
+            crossings.extend((inner, outer) for outer, inner in self._border(cx, cy - 1, 1))
+        cost = self.cost.ravel()
+        for inner, outer in crossings:
+            graph.setdefault(inner, []).append((outer, int(cost[outer]))) # 경계를 건너 바깥쪽 타일에 들어가는 비용
+
+        # 출입구마다 클러스터 안에서 다익스트라 탐색을 하여 다른 출입구까지의 비용을 구합니다.
+        # 반대 방향의 비용은 시작 타일 대신 도착 타일의 비용이 빠지므로 (비용 - 도착 타일 비용 + 시작 타일 비용)입니다.
+        nodes = list(graph)
+        adjacency = self._adjacency(cluster) if len(nodes) > 1 else None
+        for index, node in enumerate(nodes[:-1]):
+            distance = self._local_distances(cluster, node, nodes[index + 1:], adjacency)
+            for other, path_cost in distance.items():
+                graph[node].append((other, path_cost))
+                graph[other].append((node, path_cost - int(cost[other]) + int(cost[node])))
+        self.graphs[cluster] = graph
+        return graph
+
+    def _adjacency(self, cluster):
+        """
+        클러스터 안에서 열린 타일끼리의 이웃 목록을 만듭니다. (같은 클러스터에서 여러 번 탐색할 때 재사용)
+        Args:
+            cluster (tuple): (클러스터 X, 클러스터 Y)
+        Returns:
+            list: 지역 인덱스별 이웃 지역 인덱스 리스트
+        """
+        left, top, right, bottom = self._bounds(cluster)
+        local_width = right - left
+        passable = self.passable[top:bottom, left:right]
+        index = np.arange(passable.size).reshape(passable.shape)
+        horizontal = index[:, :-1][passable[:, :-1] & passable[:, 1:]]
+        vertical = index[:-1][passable[:-1] & passable[1:]]
+        adjacency = [[] for _ in range(passable.size)]
+        for a, b in zip(np.concatenate((horizontal, vertical)).tolist(),
+                        np.concatenate((horizontal + 1, vertical + local_width)).tolist()):
+            adjacency[a].append(b)
+            adjacency[b].append(a)
+        return adjacency
+
+    def _search(self, cluster, source, adjacency=None):
+        """
+        클러스터 안에서만 움직이는 다익스트라 탐색을 합니다. (타일에 들어가는 비용의 합이 거리)
+        Args:
+            cluster (tuple): 탐색할 클러스터
+            source (int): 시작 타일 (1차원 인덱스)
+            adjacency (list): 미리 만든 클러스터의 이웃 목록 (없으면 새로 만듦)
+        Returns:
+            tuple: (지역 거리 리스트, 지역 부모 리스트, 클러스터 범위)
+        """
+        bounds = self._bounds(cluster)
+        if adjacency is None:
+            adjacency = self._adjacency(cluster)
+        left, top, right, bottom = bounds
+        cost = self.cost[top:bottom, left:right].ravel().tolist()
+        start = self._local_index(bounds, source)
+        distance = [-1] * len(adjacency)
+        parent = [-1] * len(adjacency)
+        distance[start] = 0
+        heap = [(0, start)]
+        while heap:
+            d, current = heapq.heappop(heap)
+            if d > distance[current]:
+                continue # 이미 더 짧은 거리로 처리된 타일
+            for neighbor in adjacency[current]:
+                next_distance = d + cost[neighbor]
+                if distance[neighbor] < 0 or next_distance < distance[neighbor]:
+                    distance[neighbor] = next_distance
+                    parent[neighbor] = current
+                    heapq.heappush(heap, (next_distance, neighbor))
+        return distance, parent, bounds
+
+    def _local_index(self, bounds, tile):
+        """
+        1차원 타일 인덱스를 클러스터 안의 지역 인덱스로 바꿉니다.
+        """
+        left, top, right, _ = bounds
+        return (tile // self.width - top) * (right - left) + tile % self.width - left
+
+    def _local_distances(self, cluster, source, targets, adjacency=None):
+        """
+        클러스터 안에서 source에서 각 목표 타일까지의 비용을 구합니다.
+        Returns:
+            dict: {목표 타일: 비용} (클러스터 안에서 도달할 수 없는 목표는 제외)
+        """
+        distance, _, bounds = self._search(cluster, source, adjacency)
+        found = {}
+        for target in targets:
+            d = distance[self._local_index(bounds, target)]
+            if d >= 0:
+                found[target] = d
+        return found
+
+    def _local_path(self, cluster, source, target):
+        """
+        클러스터 안에서 source에서 target까지의 타일 경로를 만듭니다. (source 제외, target 포함)
+        Returns:
+            list: 1차원 타일 인덱스 리스트
+        """
+        _, parent, bounds = self._search(cluster, source)
+        left, top, right, _ = bounds
+        local_width = right - left
+        current = self._local_index(bounds, target)
+        start = self._local_index(bounds, source)
+        path = []
+        while current != start:
+            path.append((current // local_width + top) * self.width + current % local_width + left)
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def set_cost(self, x, y, cost):
+        """
+        타일에 들어가는 비용을 바꾸고, 바뀌었으면 그 타일의 클러스터 그래프만 버립니다.
+        클러스터 경계에 있는 타일이면 그 경계의 출입구와 경계 건너편 클러스터 그래프도 함께 버립니다.
+        Args:
+            x (int): X 타일 좌표
+            y (int): Y 타일 좌표
+            cost (int): 새 비용 (0이면 통과 불가)
+        Returns:
+            bool: 비용이 바뀌었으면 True
+        """
+        if self.cost[y, x] == cost:
+            return False
+        self.cost[y, x] = cost
+        self.passable[y, x] = cost > 0
+        self.goal_distances = None # 추상 비용이 바뀔 수 있으므로 다시 계산
+        size = self.cluster_size
+        cx, cy = x // size, y // size
+        self.graphs.pop((cx, cy), None)
+        # 경계에 닿은 타일이면 그 경계를 공유하는 이웃 클러스터도 출입구가 바뀝니다.
+        if x % size == size - 1:
+            self.transitions.pop((cx, cy, 0), None)
+            self.graphs.pop((cx + 1, cy), None)
+        if x % size == 0 and cx > 0:
+            self.transitions.pop((cx - 1, cy, 0), None)
+            self.graphs.pop((cx - 1, cy), None)
+        if y % size == size - 1:
+            self.transitions.pop((cx, cy, 1), None)
+            self.graphs.pop((cx, cy + 1), None)
+        if y % size == 0 and cy > 0:
+            self.transitions.pop((cx, cy - 1, 1), None)
+            self.graphs.pop((cx, cy - 1), None)
+        return True
+
+    def find_path(self, start_node, end_node):
+        """
+        추상 그래프에서 경로를 찾은 뒤, 경로가 지나가는 클러스터 안에서만 타일 경로로 다듬습니다.
+        같은 끝점으로 다시 찾으면 모든 출입구에서 끝점까지의 추상 비용을 한 번 계산해 두고,
+        이후에는 탐색 없이 비용이 줄어드는 간선만 따라갑니다. (같은 끝점을 반복해서 찾는 경우)
+        찾은 경로는 최소 비용 경로에 가깝지만 항상 최소는 아닙니다. (클러스터 경계의 열린 구간마다 출입구를 하나씩만 두기 때문)
+        Args:
+            start_node (tuple): 시작 지점의 (x, y) 타일 좌표
+            end_node (tuple): 끝 지점의 (x, y) 타일 좌표
+        Returns:
+            list: 경로를 구성하는 타일 좌표 리스트 (없으면 None)
+        """
+        width = self.width
+        start = start_node[1] * width + start_node[0]
+        goal = end_node[1] * width + end_node[0]
+        if not self.passable[end_node[1], end_node[0]]:
+            return None
+        if start == goal:
+            return [start_node]
+
+        # 시작점과 끝점을 임시 노드로 추상 그래프에 연결합니다.
+        start_cluster = self._cluster_of(start)
+        start_graph = self._graph(start_cluster)
+        start_edges = list(start_graph.get(start, ()))
+        start_targets = [node for node in start_graph if node != start]
+        if start_cluster == self._cluster_of(goal):
+            start_targets.append(goal)
+        start_edges.extend(self._local_distances(start_cluster, start, start_targets).items())
+        goal_edges = self._goal_edges(goal)
+
+        if goal != self.last_goal:
+            self.last_goal, self.goal_distances = goal, None
+        elif self.goal_distances is None:
+            self.goal_distances = self._distances_to(goal, goal_edges)
+        if self.goal_distances is not None:
+            abstract = self._descend(start, goal, start_edges, goal_edges)
+        else:
+            abstract = self._astar(start, goal, start_edges, goal_edges)
+        if abstract is None:
+            return None
+
+        # 추상 경로를 타일 경로로 다듬습니다. 경계를 건너는 간선은 이웃한 두 타일이므로 그대로 잇습니다.
+        path = [start]
+        for source, target in zip(abstract, abstract[1:]):
+            if abs(source - target) in (1, width) and self._cluster_of(source) != self._cluster_of(target):
+                path.append(target)
+            else:
+                path.extend(self._local_path(self._cluster_of(source), source, target))
+        return [(tile % width, tile // width) for tile in path]
+
+    def _goal_edges(self, goal):
+        """
+        같은 클러스터의 출입구에서 끝점까지의 비용을 구합니다.
+        끝점에서 출발하는 탐색으로 구한 비용을 출입구에서 끝점으로 가는 방향으로 바꿉니다.
+        Returns:
+            dict: {출입구 타일: 끝점까지의 비용}
+        """
+        goal_cluster = self._cluster_of(goal)
+        goal_graph = self._graph(goal_cluster)
+        cost = self.cost.ravel()
+        goal_edges = {node: path_cost - int(cost[node]) + int(cost[goal]) for node, path_cost in
+                      self._local_distances(goal_cluster, goal, [node for node in goal_graph if node != goal]).items()}
+        if goal in goal_graph:
+            goal_edges[goal] = 0
+        return goal_edges
+
+    def _astar(self, start, goal, start_edges, goal_edges):
+        """
+        추상 그래프에서 맨해튼 거리 휴리스틱으로 A* 탐색을 합니다.
+        Returns:
+            list: 시작점에서 끝점까지의 추상 경로 (출입구 타일 리스트, 없으면 None)
+        """
+        width = self.width
+        gx, gy = goal % width, goal // width
+        g_score = {start: 0}
+        came_from = {}
+        open_set = [(abs(start % width - gx) + abs(start // width - gy), 0, start)]
+        while open_set:
+            _, g, current = heapq.heappop(open_set)
+            if current == goal:
+                break
+            if g > g_score[current]:
+                continue # 이미 더 짧은 거리로 처리된 노드
+            edges = start_edges if current == start else self._graph(self._cluster_of(current)).get(current, ())
+            goal_cost = goal_edges.get(current)
+            if goal_cost is not None and current != goal:
+                edges = list(edges) + [(goal, goal_cost)]
+            for neighbor, cost in edges:
+                tentative = g + cost
+                if tentative < g_score.get(neighbor, tentative + 1):
+                    g_score[neighbor] = tentative
+                    came_from[neighbor] = current
+                    heapq.heappush(open_set, (tentative + abs(neighbor % width - gx) + abs(neighbor // width - gy), tentative, neighbor))
+        else:
+            return None # 추상 그래프에서 끝점에 도달하지 못함
+        abstract = [goal]
+        while abstract[-1] != start:
+            abstract.append(came_from[abstract[-1]])
+        abstract.reverse()
+        return abstract
+
+    def _distances_to(self, goal, goal_edges):
+        """
+        끝점에서 시작하는 다익스트라 탐색으로 모든 출입구에서 끝점까지의 추상 비용을 구합니다.
+        간선은 양방향으로 모두 있으므로, 꺼낸 노드의 간선을 거꾸로 (비용 - 이웃 타일 비용 + 꺼낸 타일 비용) 건너갑니다.
+        Returns:
+            dict: {출입구 타일: 끝점까지의 비용} (끝점 자신은 0)
+        """
+        cost = self.cost.ravel()
+        distance = {goal: 0}
+        open_set = [(edge_cost, node) for node, edge_cost in goal_edges.items()]
+        heapq.heapify(open_set)
+        for edge_cost, node in open_set:
+            distance[node] = min(distance.get(node, edge_cost), edge_cost)
+        while open_set:
+            d, current = heapq.heappop(open_set)
+            if d > distance[current]:
+                continue
+            current_cost = int(cost[current])
+            for neighbor, edge_cost in self._graph(self._cluster_of(current)).get(current, ()):
+                tentative = d + edge_cost - int(cost[neighbor]) + current_cost
+                if tentative < distance.get(neighbor, tentative + 1):
+                    distance[neighbor] = tentative
+                    heapq.heappush(open_set, (tentative, neighbor))
+        return distance
+
+    def _descend(self, start, goal, start_edges, goal_edges):
+        """
+        미리 구한 끝점까지의 추상 비용을 따라 비용이 가장 많이 줄어드는 간선만 골라 추상 경로를 만듭니다.
+        Returns:
+            list: 시작점에서 끝점까지의 추상 경로 (출입구 타일 리스트, 없으면 None)
+        """
+        distance = self.goal_distances
+        abstract = [start]
+        current, edges = start, start_edges
+        while current != goal:
+            best, best_cost = None, -1
+            goal_cost = goal_edges.get(current)
+            if goal_cost is not None and current != goal:
+                best, best_cost = goal, goal_cost
+            for neighbor, cost in edges:
+                remaining = distance.get(neighbor)
+                if remaining is not None and (best is None or cost + remaining < best_cost):
+                    best, best_cost = neighbor, cost + remaining
+            if best is None:
+                return None # 끝점과 연결되지 않은 위치
+            abstract.append(best)
+            current = best
+            edges = self._graph(self._cluster_of(current)).get(current, ())
+        return abstract
+
+
+def _runs(mask):
+    """
+    bool 배열에서 True가 이어지는 구간을 찾습니다.
+    Args:
+        mask (numpy.ndarray): 1차원 bool 배열
+    Returns:
+        list: (시작, 끝) 인덱스 튜플 리스트 (끝 제외)
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
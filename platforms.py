@@ -0,0 +1,241 @@
+
+# platforms.py
+# 레벨의 모든 움직이는 발판을 NumPy 배열(위치, 이동 범위, 속도)로 관리하는 파일입니다.
+# 발판 업데이트는 한 번의 배열 연산으로 처리하고, 플레이어와 발판의 충돌은
+# 한 틱 동안의 상대 이동을 따라 검사하는 스윕 AABB 방식으로 계산하여 빠르게 움직여도 통과하지 않습니다.
+
+import numpy as np
+import pygame
+from config import *
+from chunks import chunk_range
+
+class PlatformSystem:
+    def __init__(self, tile_positions):
+        """
+        발판 배열을 초기화합니다. 발판은 출발 청크 순서로 정렬하여 청크별로 연속된 구간에 저장합니다.
+        Args:
+            tile_positions (numpy.ndarray): 발판 시작 위치의 (x, y) 타일 좌표 배열 (N x 2)
+        """
+        tile_positions = np.asarray(tile_positions, dtype=np.int64).reshape(-1, 2)
+        chunk_x = tile_positions[:, 0] // CHUNK_TILES
+        chunk_y = tile_positions[:, 1] // CHUNK_TILES
+        order = np.lexsort((chunk_x, chunk_y))
+        tile_positions, chunk_x, chunk_y = tile_positions[order], chunk_x[order], chunk_y[order]
+
+        self.x = (tile_positions[:, 0] * TILE_SIZE).astype(np.int32) # 현재 X 좌표 (픽셀)
+        self.y = (tile_positions[:, 1] * TILE_SIZE).astype(np.int32) # Y 좌표 (픽셀, 발판은 가로로만 움직임)
+        self.previous_x = self.x.copy() # 직전 틱의 X 좌표 (렌더링 보간 및 스윕 충돌용)
+        self.start_x = self.x.copy() # 이동 범위 왼쪽 끝
+        self.end_x = self.x + PLATFORM_RANGE # 이동 범위 오른쪽 끝
+        self.speed = np.full(len(self.x), PLATFORM_SPEED, dtype=np.int32) # 이동 속도 (부호가 방향)
+        self.updated = [] # 마지막 update()에서 움직인 발판의 (시작, 끝) 인덱스 구간 리스트 (되감기 기록용)
+        self.all_spans = [(0, len(self.x))] if len(self.x) else [] # 모든 발판의 인덱스 구간
+        # 청크 범위 -> (인덱스 구간 리스트, 인덱스 배열) (매 틱 같은 범위를 다시 계산하지 않도록 캐시, 인덱스 배열은 필요할 때 만듦)
+        self.span_cache = {}
+        self.drawn = [] # 마지막 draw()에서 발판을 그린 화면 영역 (매 프레임 같은 리스트를 비우고 다시 채움)
+
+        # (청크 X, 청크 Y) -> 그 청크에서 출발하는 발판의 인덱스 구간
+        self.chunks = {}
+        if len(self.x):
+            starts = np.flatnonzero(np.diff(chunk_x, prepend=-1) | np.diff(chunk_y, prepend=-1))
+            ends = np.append(starts[1:], len(self.x))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self.chunks[(int(chunk_x[start]), int(chunk_y[start]))] = (start, end)
+
+    def __len__(self):
+        return len(self.x)
+
+    def spans(self, rect, margin=1):
+        """
+        주어진 영역 주변 청크에서 출발한 발판의 인덱스 구간을 반환합니다. 이어지는 구간은 하나로 합칩니다.
+        발판은 출발 위치에서 몇 타일만 움직이므로 주변 청크만 보면 충분합니다.
+        같은 청크 범위의 결과는 캐시에서 재사용하므로 반환된 리스트를 수정하면 안 됩니다.
+        Args:
+            rect (pygame.Rect): 기준 영역 (월드 좌표)
+            margin (int): 사방으로 더 포함할 청크 수
+        Returns:
+            list: (시작, 끝) 인덱스 튜플 리스트
+        """
+        return self._cached(chunk_range(rect, margin))[0]
+
+    def near(self, rect, margin=1):
+        """
+        주어진 영역 주변 청크에서 출발한 발판의 인덱스를 반환합니다.
+        같은 청크 범위의 결과는 캐시에서 재사용하므로 반환된 배열을 수정하면 안 됩니다.
+        Args:
+            rect (pygame.Rect): 기준 영역 (월드 좌표)
+            margin (int): 사방으로 더 포함할 청크 수
+        Returns:
+            numpy.ndarray: 발판 인덱스 배열
+        """
+        key = chunk_range(rect, margin)
+        entry = self._cached(key)
+        if entry[1] is None:
+            spans = entry[0]
+            if not spans:
+                indices = np.empty(0, dtype=np.int64)
+            elif len(spans) == 1:
+                indices = np.arange(*spans[0])
+            else:
+                indices = np.concatenate([np.arange(*span) for span in spans])
+            entry = self.span_cache[key] = (spans, indices)
+        return entry[1]
+
+    def _cached(self, key):
+        """
+        청크 범위의 캐시 항목을 반환합니다. 처음 보는 범위면 인덱스 구간을 계산하여 저장합니다.
+        Args:
+            key (tuple): chunk_range()가 반환한 (왼쪽, 위, 오른쪽, 아래) 청크 좌표
+        Returns:
+            tuple: (인덱스 구간 리스트, 인덱스 배열 또는 None)
+        """
+        entry = self.span_cache.get(key)
+        if entry is not None:
+            return entry
+        left, top, right, bottom = key
+        spans = []
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                span = self.chunks.get((cx, cy))
+                if span is None:
+                    continue
+                if spans and spans[-1][1] == span[0]:
+                    spans[-1] = (spans[-1][0], span[1])
+                else:
+                    spans.append(span)
+        if len(self.span_cache) >= PLATFORM_SPAN_CACHE_SIZE:
+            self.span_cache.clear() # 큰 미로를 돌아다니며 쌓인 범위는 한꺼번에 버림
+        entry = self.span_cache[key] = (spans, None)
+        return entry
+
+    def update(self, rect=None):
+        """
+        발판을 한 틱만큼 움직이고, 이동 범위를 벗어난 발판은 방향을 바꿉니다.
+        Args:
+            rect (pygame.Rect): 기준 영역 (주어지면 주변 PLATFORM_ACTIVE_CHUNKS 청크 이내의 발판만 움직임)
+        """
+        self.previous_x[:] = self.x # 멈춰 있는 발판은 이번 틱에 움직이지 않은 것으로 기록
+        spans = self.all_spans if rect is None else self.spans(rect, PLATFORM_ACTIVE_CHUNKS)
+        self.updated = spans
+        for start, end in spans:
+            # 인덱스 구간은 배열의 연속된 부분이므로 복사 없이 뷰에서 바로 갱신합니다.
+            x = self.x[start:end]
+            speed = self.speed[start:end]
+            x += speed
+            reverse = (x < self.start_x[start:end]) | (x + PLATFORM_WIDTH > self.end_x[start:end])
+            np.negative(speed, out=speed, where=reverse)
+
+    def first_contact(self, start, rect):
+        """
+        이번 틱에 플레이어가 처음으로 닿은 발판을 찾습니다.
+        플레이어와 각 발판의 상대 이동을 따라 AABB를 스윕하여, 한 틱 동안 완전히 지나쳐 버린 경우도 찾아냅니다.
+        Args:
+            start (tuple): 이동 전 플레이어의 왼쪽 위 좌표 (픽셀)
+            rect (pygame.Rect): 이동(벽 충돌 처리) 후 플레이어 영역
+        Returns:
+            int: 가장 먼저 닿은 발판의 인덱스 (닿은 발판이 없으면 None)
+        """
+        if not self.chunks:
+            return None # 발판이 없는 레벨
+        area = rect.union(pygame.Rect(start, rect.size)) # 이번 틱에 플레이어가 지나간 영역
+        indices = self.near(area)
+        if indices.size == 0:
+            return None
+        # 넓은 단계: 이번 틱에 발판이 지나간 영역과 플레이어가 지나간 영역이 겹치는 발판만 남깁니다.
+        platform_x = self.previous_x[indices]
+        current_x = self.x[indices]
+        y = self.y[indices]
+        close = ((np.minimum(platform_x, current_x) < area.right) & (np.maximum(platform_x, current_x) + PLATFORM_WIDTH > area.left)
+                 & (y < area.bottom) & (y + PLATFORM_HEIGHT > area.top))
+        if not close.any():
+            return None
+        indices, platform_x, current_x, y = indices[close], platform_x[close], current_x[close], y[close]
+
+        start_x, start_y = start
+        # 발판을 멈춰 있다고 보고, 플레이어가 (플레이어 이동 - 발판 이동)만큼 움직인 것으로 계산합니다.
+        relative_dx = (rect.x - start_x) - (current_x - platform_x)
+        relative_dy = np.full(indices.size, rect.y - start_y)
+        entry_x, exit_x = _slab_times(start_x, rect.width, relative_dx, platform_x, PLATFORM_WIDTH)
+        entry_y, exit_y = _slab_times(start_y, rect.height, relative_dy, y, PLATFORM_HEIGHT)
+        entry = np.maximum(entry_x, entry_y)
+        exit = np.minimum(exit_x, exit_y)
+        # 경계가 맞닿기만 한 경우는 겹친 것으로 보지 않습니다. (pygame.Rect.colliderect와 같은 규칙)
+        hit = (entry < exit) & (entry < 1.0) & (exit > 0.0)
+        if not hit.any():
+            return None
+        return int(indices[np.argmin(np.where(hit, entry, np.inf))])
+
+    def moving(self, rect, margin=1):
+        """
+        주어진 영역 주변에 이번 틱에 움직인 발판이 있는지 확인합니다.
+        Args:
+            rect (pygame.Rect): 기준 영역 (월드 좌표)
+            margin (int): 사방으로 더 포함할 청크 수
+        Returns:
+            bool: 움직인 발판이 있으면 True
+        """
+        for start, end in self.spans(rect, margin):
+            if (self.x[start:end] != self.previous_x[start:end]).any():
+                return True
+        return False
+
+    def displacement(self, index):
+        """
+        발판이 이번 틱에 움직인 거리를 반환합니다.
+        Args:
+            index (int): 발판 인덱스
+        Returns:
+            int: X축 이동 거리 (픽셀)
+        """
+        return int(self.x[index] - self.previous_x[index])
+
+    def draw(self, screen, camera, alpha=1.0):
+        """
+        뷰포트에 보이는 발판을 직전 틱과 현재 틱 사이를 보간한 위치에 그립니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+            camera (Camera): 현재 카메라
+            alpha (float): 보간 비율 (1이면 현재 위치)
+        Returns:
+            list: 발판이 그려진 화면 영역의 pygame.Rect 리스트 (다음 호출 때 다시 채워지는 리스트)
+        """
+        drawn = self.drawn
+        drawn.clear()
+        indices = self.near(camera.rect)
+        if indices.size == 0:
+            return drawn
+        previous = self.previous_x[indices]
+        x = np.rint(previous + (self.x[indices] - previous) * alpha).astype(np.int64) - camera.rect.x
+        y = self.y[indices].astype(np.int64) - camera.rect.y
+        screen_width, screen_height = screen.get_size()
+        visible = (x < camera.rect.width) & (x + PLATFORM_WIDTH > 0) & (y < camera.rect.height) & (y + PLATFORM_HEIGHT > 0)
+        for px, py in zip(x[visible].tolist(), y[visible].tolist()):
+            # fill은 화면 밖으로 걸친 Rect를 잘못 잘라내므로 미리 자름 (Rect를 만들지 않고 좌표로 계산)
+            left, top = max(px, 0), max(py, 0)
+            drawn.append(screen.fill(BLUE, (left, top, min(px + PLATFORM_WIDTH, screen_width) - left,
+                                             min(py + PLATFORM_HEIGHT, screen_height) - top)))
+        return drawn
+
+
+def _slab_times(position, size, delta, box_position, box_size):
+    """
+    한 축에서 움직이는 구간 [position, position + size)가 고정된 구간과 겹치기 시작하고 끝나는 시간을 계산합니다.
+    Args:
+        position (int): 움직이는 구간의 시작 좌표
+        size (int): 움직이는 구간의 길이
+        delta (numpy.ndarray): 한 틱 동안의 이동량
+        box_position (numpy.ndarray): 고정된 구간의 시작 좌표
+        box_size (int): 고정된 구간의 길이
+    Returns:
+        tuple: (겹치기 시작 시간, 겹침이 끝나는 시간) 배열 (0~1이 이번 틱, 움직이지 않으면 ±inf)
+    """
+    delta = delta.astype(np.float64)
+    near = np.where(delta > 0, box_position - (position + size), box_position + box_size - position)
+    far = np.where(delta > 0, box_position + box_size - position, box_position - (position + size))
+    moving = delta != 0
+    safe_delta = np.where(moving, delta, 1.0)
+    # 움직이지 않는 축은 처음부터 겹쳐 있으면 항상 겹침, 아니면 한 번도 겹치지 않음으로 처리합니다.
+    overlapping = (position < box_position + box_size) & (position + size > box_position)
+    entry = np.where(moving, near / safe_delta, np.where(overlapping, -np.inf, np.inf))
+    exit = np.where(moving, far / safe_delta, np.where(overlapping, np.inf, -np.inf))
+    return entry, exit
@@ -20,57 +20,60 @@ class Player:
         self.last_dx = 0 # 마지막 X축 이동 방향 (벽 부수기 능력에 사용)
         self.last_dy = -1 # 마지막 Y축 이동 방향 (벽 부수기 능력에 사용, 기본값: 위)
 
-    def move(self, dx, dy, walls, transparent_walls, moving_platforms):
+    def move(self, dx, dy, maze):
         """
         플레이어를 이동시키고 벽 및 움직이는 발판과의 충돌을 처리합니다.
         Args:
             dx (int): X축 이동량 (-1: 왼쪽, 0: 없음, 1: 오른쪽)
             dy (int): Y축 이동량 (-1: 위, 0: 없음, 1: 아래)
-            walls (list): 일반 벽 Rect 객체 리스트
-            transparent_walls (list): 투명한 벽 Rect 객체 리스트
-            moving_platforms (pygame.sprite.Group): 움직이는 발판 Sprite 그룹
+            maze (Maze): 충돌 인덱스와 움직이는 발판을 가진 현재 미로 객체
         """
         # 이동 방향이 있을 경우 마지막 이동 방향을 업데이트합니다.
         if dx != 0 or dy != 0:
             self.last_dx = dx
             self.last_dy = dy
 
-        # 현재 페르소나에 따라 충돌을 검사할 벽 목록을 결정합니다.
-        # 모라가 아닐 경우 일반 벽과 투명한 벽 모두와 충돌 검사합니다.
-        collidable_walls = walls
-        if self.persona != PERSONA_MORA:
-            collidable_walls = walls + transparent_walls
+        start = self.rect.topleft # 이동 전 위치 (발판과의 스윕 충돌 검사에 사용)
+
+        # 충돌 검사는 미로의 충돌 인덱스에서 플레이어 아래의 타일만 확인합니다.
+        # 모라는 투명한 벽을 통과하므로 페르소나에 따라 충돌 대상이 달라집니다.
+        # 매 틱 실행되므로 벽 Rect 목록을 만들지 않고, 이동 방향에서 가장 가까운 벽의 경계에 맞춥니다.
 
         # X축 이동 및 충돌 처리
-        self.rect.x += dx * self.speed
-        for wall in collidable_walls:
-            if self.rect.colliderect(wall):
+        if dx != 0:
+            self.rect.x += dx * self.speed
+            edge = maze.blocking_edge(self.rect, self.persona, dx, 0)
+            if edge is not None:
                 if dx > 0: # 오른쪽으로 이동 중 충돌
-                    self.rect.right = wall.left
-                if dx < 0: # 왼쪽으로 이동 중 충돌
-                    self.rect.left = wall.right
+                    self.rect.right = edge
+                else: # 왼쪽으로 이동 중 충돌
+                    self.rect.left = edge
 
         # Y축 이동 및 충돌 처리
-        self.rect.y += dy * self.speed
-        for wall in collidable_walls:
-            if self.rect.colliderect(wall):
+        if dy != 0:
+            self.rect.y += dy * self.speed
+            edge = maze.blocking_edge(self.rect, self.persona, 0, dy)
+            if edge is not None:
                 if dy > 0: # 아래로 이동 중 충돌
-                    self.rect.bottom = wall.top
-                if dy < 0: # 위로 이동 중 충돌
-                    self.rect.top = wall.bottom
+                    self.rect.bottom = edge
+                else: # 위로 이동 중 충돌
+                    self.rect.top = edge
 
         # 움직이는 발판과의 충돌 처리
-        for platform in moving_platforms:
-            if self.rect.colliderect(platform):
-                # 플레이어가 발판 위에 있을 경우 발판과 함께 이동
-                self.rect.bottom = platform.rect.top # 발판 위에 플레이어 위치 고정
-                self.rect.x += platform.speed # 발판의 속도만큼 플레이어도 이동
+        # 이번 틱의 이동 경로를 따라 가장 먼저 닿은 발판 하나만 처리하므로, 빠르게 움직여도 통과하거나 떨리지 않습니다.
+        platforms = maze.platforms
+        hit = platforms.first_contact(start, self.rect)
+        if hit is not None:
+            # 플레이어가 발판 위에 있을 경우 발판과 함께 이동
+            self.rect.bottom = int(platforms.y[hit]) # 발판 위에 플레이어 위치 고정
+            self.rect.x += platforms.displacement(hit) # 발판이 이번 틱에 움직인 만큼 플레이어도 이동
 
-    def set_persona(self, persona):
+    def set_persona(self, persona, announce=True):
         """
         플레이어의 페르소나를 변경하고, 그에 따른 색상 및 속도를 설정합니다.
         Args:
             persona (str): 변경할 페르소나 (PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA 중 하나)
+            announce (bool): 변경 사실을 출력할지 여부 (되감기처럼 상태를 복원할 때는 False)
         """
         self.persona = persona
         if self.persona == PERSONA_CHIRON:
@@ -83,15 +86,20 @@ class Player:
             self.color = MORA_COLOR
             self.speed = PLAYER_SPEED
 
-        print(f"Persona changed to: {self.persona}") # 디버깅용 출력
+        if announce:
+            print(f"Persona changed to: {self.persona}") # 디버깅용 출력
 
-    def draw(self, screen):
+    def draw(self, screen, rect=None):
         """
         플레이어 캐릭터를 화면에 그립니다.
         Args:
             screen (pygame.Surface): 게임 화면 Surface 객체
+            rect (pygame.Rect): 그릴 위치 (보간된 위치를 그릴 때 사용, 없으면 현재 위치)
+        Returns:
+            pygame.Rect: 플레이어가 그려진 영역
         """
-        pygame.draw.rect(screen, self.color, self.rect) # 현재 페르소나 색상으로 플레이어 그리기
+        # 현재 페르소나 색상으로 플레이어 그리기
+        return pygame.draw.rect(screen, self.color, rect if rect is not None else self.rect)
 
     def break_wall(self, maze):
         """
@@ -103,17 +111,5 @@ class Player:
         wall_to_break_x = self.rect.centerx // TILE_SIZE + self.last_dx
         wall_to_break_y = self.rect.centery // TILE_SIZE + self.last_dy
 
-        # 부술 수 있는 벽 목록을 순회하며 해당 벽을 찾습니다.
-        for wall in maze.breakable_walls:
-            if wall.x // TILE_SIZE == wall_to_break_x and wall.y // TILE_SIZE == wall_to_break_y:
-                maze.breakable_walls.remove(wall) # 벽 목록에서 제거
-                
-                # 미로의 그리드 데이터도 업데이트하여 해당 위치를 빈 공간으로 만듭니다.
-                grid_y = wall_to_break_y
-                grid_x = wall_to_break_x
-                if 0 <= grid_y < len(maze.grid) and 0 <= grid_x < len(maze.grid[0]):
-                    row = list(maze.grid[grid_y])
-                    row[grid_x] = ' ' # 벽을 빈 공간으로 변경
-                    maze.grid[grid_y] = "".join(row)
-                break # 벽을 찾아서 부쉈으면 반복 중단
-
+        # 미로가 벽 목록, 그리드 데이터, 충돌 인덱스를 함께 갱신합니다.
+        maze.break_wall_at(wall_to_break_x, wall_to_break_y)
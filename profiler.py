@@ -0,0 +1,266 @@
+
+# profiler.py
+# 메인 루프의 각 단계(이벤트 처리, 능력, 쿨다운, 발판, 이동, 탈출 확인, 그리기, HUD, 화면 갱신 등)에
+# 걸린 시간을 perf_counter_ns로 측정하는 프레임 프로파일러를 정의하는 파일입니다.
+# 최근 프레임의 측정값은 링 버퍼에 보관하여 p50/p95/p99를 계산하고, 오버레이로 표시하거나 CSV로 저장합니다.
+# 꺼져 있을 때는 아무 일도 하지 않는 NULL_PROFILER를 사용하므로 추가 비용이 거의 없습니다.
+# AllocationProfiler는 같은 단계 구분으로 tracemalloc을 사용해 단계별 메모리 할당을 호출 위치별로 셉니다. (진단용)
+
+import gc
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from config import *
+
+# 측정 단계 이름 (mark()에 전달하는 이름, CSV 열 순서)
+PHASES = ("events", "wait", "abilities", "cooldowns", "platforms", "move", "exit",
+          "camera", "static", "hint", "sprites", "hud", "overlay", "flip")
+PERCENTILES = (50, 95, 99)
+
+class NullProfiler:
+    """
+    프로파일링이 꺼져 있을 때 사용하는 프로파일러입니다. 모든 메서드가 아무 일도 하지 않습니다.
+    """
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    def __init__(self, history=PROFILER_HISTORY):
+        """
+        프레임 프로파일러를 초기화합니다.
+        Args:
+            history (int): 링 버퍼에 보관할 최근 프레임 수
+        """
+        self.phase_index = {phase: i for i, phase in enumerate(PHASES)} # 단계 이름 -> 열 번호
+        self.samples = np.zeros((history, len(PHASES)), dtype=np.int64) # 프레임별 단계 시간 (나노초, 링 버퍼)
+        self.frames = 0 # 지금까지 기록한 프레임 수
+        self.current = [0] * len(PHASES) # 측정 중인 프레임의 단계별 누적 시간
+        self.last = 0 # 마지막 mark() 시각
+
+    def begin_frame(self):
+        """
+        새 프레임의 측정을 시작합니다.
+        """
+        self.current = [0] * len(PHASES)
+        self.last = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """
+        직전 mark() 이후 지난 시간을 지정한 단계에 더합니다. (한 프레임에 여러 번 실행된 단계는 합산)
+        Args:
+            phase (str): PHASES에 있는 단계 이름
+        """
+        now = time.perf_counter_ns()
+        self.current[self.phase_index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """
+        측정 중인 프레임을 링 버퍼에 기록합니다.
+        """
+        self.samples[self.frames % len(self.samples)] = self.current
+        self.frames += 1
+
+    def recent(self):
+        """
+        링 버퍼에 남아 있는 프레임을 오래된 순서로 반환합니다.
+        Returns:
+            numpy.ndarray: (프레임 수, 단계 수) 크기의 측정값 (나노초)
+        """
+        history = len(self.samples)
+        if self.frames <= history:
+            return self.samples[:self.frames]
+        return np.roll(self.samples, -(self.frames % history), axis=0)
+
+    def percentiles(self):
+        """
+        최근 프레임의 단계별 백분위 시간을 계산합니다. 'work'는 대기(wait)를 뺀 프레임 전체 시간입니다.
+        Returns:
+            dict: 단계 이름 -> (p50, p95, p99) 밀리초 튜플 (기록된 프레임이 없으면 빈 딕셔너리)
+        """
+        rows = self.recent()
+        if len(rows) == 0:
+            return {}
+        work = rows.sum(axis=1) - rows[:, self.phase_index["wait"]]
+        values = np.percentile(np.column_stack((rows, work)), PERCENTILES, axis=0) / 1e6
+        return {phase: tuple(values[:, i]) for i, phase in enumerate(PHASES + ("work",))}
+
+    def export_csv(self, path):
+        """
+        링 버퍼에 남아 있는 프레임별 측정값을 CSV 파일로 저장합니다.
+        Args:
+            path (str): 저장할 파일 경로
+        Returns:
+            int: 저장한 프레임 수
+        """
+        rows = self.recent()
+        frame_numbers = np.arange(self.frames - len(rows), self.frames)
+        np.savetxt(path, np.column_stack((frame_numbers, rows)), fmt="%d", delimiter=",",
+                   header=",".join(("frame",) + tuple(f"{phase}_ns" for phase in PHASES)), comments="")
+        return len(rows)
+
+
+class ProfilerOverlay:
+    def __init__(self, profiler, text_cache):
+        """
+        프로파일러 통계를 화면 우측 상단에 표시하는 오버레이를 초기화합니다.
+        Args:
+            profiler (FrameProfiler): 통계를 가져올 프로파일러
+            text_cache (TextCache): 폰트를 공유하는 캐시
+        """
+        self.profiler = profiler
+        self.font = text_cache.get_font(PROFILER_FONT_SIZE)
+        self.surface = None # 마지막으로 렌더링한 통계 표
+        self.refreshed_at = None # 통계를 마지막으로 계산한 프레임 번호
+
+    def refresh(self):
+        """
+        통계 표를 다시 렌더링합니다. 값이 매 프레임 바뀌므로 텍스트 캐시를 거치지 않습니다.
+        """
+        lines = [f"{'phase':<10}{'p50':>7}{'p95':>7}{'p99':>7} ms"]
+        for phase, (p50, p95, p99) in self.profiler.percentiles().items():
+            lines.append(f"{phase:<10}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        line_height = self.font.get_linesize()
+        texts = [self.font.render(line, True, UI_TEXT_COLOR) for line in lines]
+        self.surface = pygame.Surface((max(text.get_width() for text in texts) + 10, line_height * len(texts) + 10))
+        self.surface.fill(UI_BACKGROUND_COLOR)
+        for i, text in enumerate(texts):
+            self.surface.blit(text, (5, 5 + i * line_height))
+        self.refreshed_at = self.profiler.frames
+
+    def draw(self, screen):
+        """
+        통계 표를 그립니다. 통계는 PROFILER_REFRESH 프레임마다 다시 계산합니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+        Returns:
+            list: 오버레이가 그려진 영역의 pygame.Rect 리스트
+        """
+        if self.refreshed_at is None or self.profiler.frames - self.refreshed_at >= PROFILER_REFRESH:
+            self.refresh()
+        return [screen.blit(self.surface, self.surface.get_rect(topright=(SCREEN_WIDTH - 10, 10)))]
+
+
+class AllocationProfiler:
+    def __init__(self):
+        """
+        tracemalloc으로 메인 루프의 단계별 메모리 할당을 호출 위치별로 세는 진단용 프로파일러를 초기화합니다.
+        FrameProfiler와 같은 mark() 지점에서 그 단계 동안 할당되어 아직 살아 있는 메모리 블록을 셉니다.
+        (단계 안에서 만들었다가 바로 버린 객체는 보이지 않으며, 추적하는 동안 게임이 몇 배 느려짐)
+        """
+        self.frames = 0 # 추적한 프레임 수
+        self.sites = {} # (단계, 파일, 줄) -> [블록 수, 바이트] (추적한 모든 프레임의 합)
+        self.collections = [0, 0, 0] # 추적하는 동안 세대별 가비지 컬렉션 횟수
+        self.longest_collection = 0 # 가장 오래 걸린 가비지 컬렉션 시간 (나노초)
+        self.collection_start = 0 # 진행 중인 가비지 컬렉션의 시작 시각
+        # 스냅샷을 만드는 tracemalloc 자체와 이 파일의 할당은 세지 않습니다.
+        self.filters = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+    def start(self):
+        """
+        할당 추적을 시작합니다.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        gc.callbacks.append(self.on_collection)
+
+    def stop(self):
+        """
+        할당 추적을 멈춥니다. 지금까지 센 결과는 남아 있습니다.
+        """
+        tracemalloc.stop()
+        if self.on_collection in gc.callbacks:
+            gc.callbacks.remove(self.on_collection)
+
+    def on_collection(self, phase, info):
+        """
+        가비지 컬렉션의 횟수와 걸린 시간을 기록합니다. (gc.callbacks에 등록)
+        Args:
+            phase (str): "start" 또는 "stop"
+            info (dict): 컬렉션 정보 (generation: 세대 번호)
+        """
+        if phase == "start":
+            self.collection_start = time.perf_counter_ns()
+        else:
+            self.collections[info["generation"]] += 1
+            self.longest_collection = max(self.longest_collection, time.perf_counter_ns() - self.collection_start)
+
+    def begin_frame(self):
+        """
+        새 프레임의 추적을 시작합니다. 이전 프레임 이후의 할당 기록은 버립니다.
+        """
+        tracemalloc.clear_traces()
+
+    def mark(self, phase):
+        """
+        직전 mark() 이후 할당되어 아직 살아 있는 블록을 호출 위치별로 지정한 단계에 더합니다.
+        Args:
+            phase (str): PHASES에 있는 단계 이름
+        """
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.filters)
+        sites = self.sites
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            key = (phase, frame.filename, frame.lineno)
+            site = sites.get(key)
+            if site is None:
+                sites[key] = [stat.count, stat.size]
+            else:
+                site[0] += stat.count
+                site[1] += stat.size
+        tracemalloc.clear_traces() # 위에서 만든 스냅샷은 다음 단계에 세지 않음
+
+    def end_frame(self):
+        """
+        추적 중인 프레임을 마칩니다.
+        """
+        self.frames += 1
+
+    def per_frame(self):
+        """
+        프레임당 할당 블록 수를 반환합니다.
+        Returns:
+            float: 추적한 프레임 하나에서 할당된 평균 블록 수 (추적한 프레임이 없으면 0)
+        """
+        if self.frames == 0:
+            return 0.0
+        return sum(count for count, _ in self.sites.values()) / self.frames
+
+    def report(self, limit=30):
+        """
+        호출 위치별 프레임당 할당을 많은 순서로 정리한 보고서를 만듭니다.
+        Args:
+            limit (int): 보고서에 넣을 최대 호출 위치 수
+        Returns:
+            str: 여러 줄로 된 보고서
+        """
+        frames = max(self.frames, 1)
+        lines = [f"{self.frames} frames, {self.per_frame():.2f} blocks/frame",
+                 f"gc collections (gen0/gen1/gen2): {'/'.join(map(str, self.collections))}, "
+                 f"longest {self.longest_collection / 1e6:.2f} ms",
+                 f"{'blocks':>8}{'bytes':>10}  {'phase':<10} site"]
+        ranked = sorted(self.sites.items(), key=lambda item: item[1][0], reverse=True)
+        for (phase, filename, lineno), (count, size) in ranked[:limit]:
+            lines.append(f"{count / frames:8.2f}{size / frames:10.1f}  {phase:<10} {filename}:{lineno}")
+        return "\n".join(lines)
+
+    def export_report(self, path):
+        """
+        보고서를 텍스트 파일로 저장합니다.
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report(limit=len(self.sites)) + "\n")
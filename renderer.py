@@ -0,0 +1,131 @@
+
+# renderer.py
+# 미로의 청크별 정적 레이어 캐시를 배경으로 사용하여, 매 프레임 바뀐 영역만 다시 그리고
+# pygame.display.update(rects)로 해당 영역만 화면에 반영하는 렌더러를 정의하는 파일입니다.
+# 카메라가 움직인 프레임은 뷰포트 전체를 다시 그립니다.
+
+import pygame
+from config import *
+from profiler import NULL_PROFILER
+
+class DirtyRectRenderer:
+    def __init__(self, screen):
+        """
+        렌더러를 초기화합니다.
+        Args:
+            screen (pygame.Surface): 게임 화면 Surface 객체
+        """
+        self.screen = screen
+        self.maze = None # 마지막으로 그린 미로 객체 (바뀌면 전체 화면을 다시 그림)
+        self.camera_pos = None # 마지막으로 그린 카메라 위치 (바뀌면 전체 화면을 다시 그림)
+        self.screen_rect = screen.get_rect() # 화면 전체 영역
+        self.screen_size = screen.get_size() # 화면 (너비, 높이) (매 프레임 Rect 속성에서 새 튜플을 만들지 않도록 보관)
+        # 매 프레임 새 리스트를 만들지 않도록 아래 리스트는 비우고 다시 채우며, 이전/현재 리스트는 프레임마다 맞바꿉니다.
+        self.previous_rects = [] # 이전 프레임에 움직이는 요소가 차지했던 화면 영역
+        self.current_rects = [] # 이번 프레임에 움직이는 요소가 차지한 화면 영역
+        self.dirty_rects = [] # 이번 프레임에 정적 레이어로 복원한 화면 영역
+        self.update_rects = [] # 이번 프레임에 화면에 반영할 영역 (복원 영역 + 움직이는 요소 영역)
+        self.player_rect = pygame.Rect(0, 0, 0, 0) # 플레이어의 화면 좌표 영역 (매 프레임 갱신)
+        self.hint_path = None # 마지막으로 그린 힌트 경로
+        self.hint_rects = [] # 힌트 경로 타일의 월드 영역
+        self.full_redraw = True # 다음 프레임에 전체 화면을 다시 그려야 하는지 여부
+        self.profiler = NULL_PROFILER # 단계별 시간을 측정하는 프로파일러
+
+    def invalidate(self):
+        """
+        다음 프레임에 전체 화면을 다시 그리도록 표시합니다.
+        """
+        self.full_redraw = True
+
+    def restore(self, maze, camera, rect):
+        """
+        화면의 한 영역을 정적 레이어(배경과 벽)로 되돌립니다.
+        Args:
+            maze (Maze): 현재 미로 객체
+            camera (Camera): 현재 카메라
+            rect (pygame.Rect): 되돌릴 화면 영역
+        """
+        rect = rect.clip(self.screen_rect) # fill은 화면 밖으로 걸친 Rect를 잘못 잘라내므로 미리 자름
+        self.screen.fill(WHITE, rect) # 미로 밖 영역은 흰색
+        maze.chunks.draw(self.screen, camera, rect)
+
+    def render(self, maze, player, hint_path, draw_hud, camera, player_rect=None, alpha=1.0):
+        """
+        한 프레임을 그립니다. 정적 레이어는 바뀐 부분만 복원하고,
+        움직이는 요소(힌트, 발판, 플레이어, HUD)만 합성하여 바뀐 영역만 화면에 반영합니다.
+        Args:
+            maze (Maze): 현재 미로 객체
+            player (Player): 현재 플레이어 객체
+            hint_path (list): 표시 중인 힌트 경로 타일 좌표 리스트 (없으면 None)
+            draw_hud (callable): screen을 받아 HUD를 그리고, 그린 영역의 Rect 리스트를 반환하는 함수
+            camera (Camera): 현재 카메라 (이미 플레이어를 따라 이동한 상태)
+            player_rect (pygame.Rect): 보간된 플레이어 위치 (월드 좌표, 없으면 현재 위치)
+            alpha (float): 움직이는 발판의 보간 비율
+        """
+        screen = self.screen
+        profiler = self.profiler
+        if maze is not self.maze: # 레벨이 바뀌었으면 전체를 다시 그림
+            self.maze = maze
+            self.full_redraw = True
+        if camera.rect.topleft != self.camera_pos: # 화면이 스크롤되었으면 전체를 다시 그림
+            self.camera_pos = camera.rect.topleft
+            self.full_redraw = True
+
+        # 힌트 경로가 나타나거나 사라진 프레임에만 힌트 타일 영역 전체를 갱신합니다.
+        hint_changed_rects = ()
+        if hint_path is not self.hint_path:
+            hint_changed_rects = self.hint_rects
+            self.hint_path = hint_path
+            self.hint_rects = [pygame.Rect(pos[0] * TILE_SIZE, pos[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                               for pos in hint_path] if hint_path else []
+            hint_changed_rects = hint_changed_rects + self.hint_rects
+
+        dirty_rects = self.dirty_rects
+        dirty_rects.clear()
+        if self.full_redraw:
+            screen.fill(WHITE) # 미로 밖 영역을 흰색으로 채움
+            maze.chunks.draw(screen, camera) # 뷰포트와 겹치는 청크만 그림
+            maze.chunks.evict_far(camera) # 카메라에서 멀어진 청크는 캐시에서 제거
+            maze.pop_dirty_tiles() # 뷰포트 전체를 다시 그렸으므로 쌓인 변경 영역은 필요 없음
+        else:
+            # 이전 프레임의 움직이는 요소와 바뀐 타일 자리를 정적 레이어로 복원합니다.
+            dirty_rects.extend(self.previous_rects)
+            for rect in maze.pop_dirty_tiles():
+                dirty_rects.append(camera.apply(rect))
+            for rect in hint_changed_rects:
+                dirty_rects.append(camera.apply(rect))
+            for rect in dirty_rects:
+                self.restore(maze, camera, rect)
+        profiler.mark("static")
+
+        # 움직이는 요소를 위에서부터 순서대로 합성합니다.
+        # 힌트 타일은 매 프레임 그리므로 Rect를 만들지 않고 좌표로 화면 안쪽만 잘라 칠합니다. (fill은 화면 밖으로 걸친 Rect를 잘못 잘라냄)
+        view = camera.rect
+        screen_width, screen_height = self.screen_size
+        for rect in self.hint_rects:
+            if view.colliderect(rect):
+                left, top = max(rect.x - view.x, 0), max(rect.y - view.y, 0)
+                screen.fill(HINT_COLOR, (left, top, min(rect.right - view.x, screen_width) - left,
+                                         min(rect.bottom - view.y, screen_height) - top))
+        profiler.mark("hint")
+        current_rects = self.current_rects
+        current_rects.clear()
+        current_rects.extend(maze.draw_dynamic(screen, camera, alpha))
+        if player_rect is None:
+            player_rect = player.rect
+        self.player_rect.update(player_rect.x - view.x, player_rect.y - view.y, player_rect.width, player_rect.height)
+        current_rects.append(player.draw(screen, self.player_rect))
+        profiler.mark("sprites")
+        current_rects.extend(draw_hud(screen)) # HUD 함수가 "hud" 단계를 직접 기록
+
+        if self.full_redraw:
+            pygame.display.flip() # 전체 화면 갱신
+            self.full_redraw = False
+        else:
+            update_rects = self.update_rects
+            update_rects.clear()
+            update_rects.extend(dirty_rects)
+            update_rects.extend(current_rects)
+            pygame.display.update(update_rects) # 바뀐 영역만 화면에 반영
+        profiler.mark("flip")
+        self.previous_rects, self.current_rects = current_rects, self.previous_rects
@@ -0,0 +1,207 @@
+
+# replay.py
+# 메인 루프가 GameState.step()에 전달한 틱별 입력을 기록하고, 기록을 창 없이 최대 속도로 재생하는 파일입니다.
+# 재생이 끝나면 마지막 플레이어 위치와 레벨 인덱스가 기록 당시와 같은지 확인합니다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더 : 매직 b"PMRC", 버전(u16), 예약(u16), 시작 레벨(u32), 레벨 수(u32), 틱 수(u32), 구간 수(u32),
+#          마지막 레벨(u32), 마지막 X(i32), 마지막 Y(i32), 승리 여부(u8), 패딩 3바이트
+#   구간 : 입력이 바뀔 때마다 (반복 틱 수 u16, 입력 코드 u16) 쌍
+# 입력 코드 비트: 0-1 dx+1, 2-3 dy+1, 4 S 키, 5 H 키, 6 B 키, 7-8 전환할 페르소나 (0이면 없음)
+#
+# 실행 방법:
+#   python replay.py 기록파일 [레벨팩]   (레벨팩을 생략하면 config.py의 LEVEL_PACK_PATH 또는 levels.py 사용)
+
+import struct
+import sys
+import time
+import numpy as np
+from config import *
+from game_state import GameState, Inputs
+
+MAGIC = b"PMRC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIIiiB3x")
+RUN_DTYPE = np.dtype([("count", "<u2"), ("code", "<u2")])
+MAX_RUN = 0xFFFF
+PERSONAS = (None, PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA) # 입력 코드의 페르소나 번호 -> 페르소나
+
+
+def encode_inputs(inputs):
+    """
+    한 틱의 입력을 정수 코드로 변환합니다.
+    Args:
+        inputs (Inputs): 이번 틱의 입력
+    Returns:
+        int: 입력 코드
+    """
+    return ((inputs.dx + 1)
+            | (inputs.dy + 1) << 2
+            | bool(inputs.slow) << 4
+            | bool(inputs.hint) << 5
+            | bool(inputs.break_wall) << 6
+            | PERSONAS.index(inputs.persona) << 7)
+
+
+def decode_inputs(code, inputs):
+    """
+    입력 코드를 Inputs 객체에 풀어 넣습니다.
+    Args:
+        code (int): 입력 코드
+        inputs (Inputs): 값을 채울 입력 객체
+    """
+    inputs.dx = (code & 3) - 1
+    inputs.dy = (code >> 2 & 3) - 1
+    inputs.slow = bool(code >> 4 & 1)
+    inputs.hint = bool(code >> 5 & 1)
+    inputs.break_wall = bool(code >> 6 & 1)
+    inputs.persona = PERSONAS[code >> 7 & 3]
+
+
+class InputRecorder:
+    def __init__(self, state):
+        """
+        입력 기록기를 초기화합니다.
+        Args:
+            state (GameState): 기록을 시작하는 시점의 게임 상태
+        """
+        self.start_level = state.level_index # 기록을 시작한 레벨 인덱스
+        self.start_tick = state.tick # 기록을 시작한 틱 (되감기로 지울 입력의 위치 계산에 사용)
+        self.level_count = len(state.levels) # 재생할 때 같은 레벨 목록인지 확인하는 데 사용
+        self.codes = [] # 틱별 입력 코드
+
+    def record(self, inputs):
+        """
+        GameState.step()에 전달한 한 틱의 입력을 기록합니다.
+        Args:
+            inputs (Inputs): 이번 틱의 입력
+        """
+        self.codes.append(encode_inputs(inputs))
+
+    def rewind(self, state):
+        """
+        되감기로 게임 상태가 과거로 돌아갔을 때, 되돌린 틱의 입력을 지워 기록과 상태를 맞춥니다.
+        Args:
+            state (GameState): 되감은 뒤의 게임 상태
+        """
+        del self.codes[state.tick - self.start_tick:]
+
+    def save(self, path, state):
+        """
+        기록한 입력을 바뀐 지점만 남기는 구간 형식으로 저장합니다. 마지막 상태도 함께 저장하여 재생 결과를 확인합니다.
+        Args:
+            path (str): 저장할 파일 경로
+            state (GameState): 기록이 끝난 시점의 게임 상태
+        """
+        codes = np.array(self.codes, dtype=np.uint16)
+        if codes.size:
+            starts = np.concatenate(([0], np.flatnonzero(codes[1:] != codes[:-1]) + 1))
+            lengths = np.diff(np.append(starts, codes.size))
+            # MAX_RUN보다 긴 구간은 여러 쌍으로 나눕니다.
+            pieces = -(-lengths // MAX_RUN)
+            runs = np.empty(int(pieces.sum()), dtype=RUN_DTYPE)
+            runs["code"] = np.repeat(codes[starts], pieces)
+            counts = np.full(len(runs), MAX_RUN, dtype=np.int64)
+            counts[np.cumsum(pieces) - 1] = lengths - (pieces - 1) * MAX_RUN
+            runs["count"] = counts
+        else:
+            runs = np.empty(0, dtype=RUN_DTYPE)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, self.start_level, self.level_count, codes.size, len(runs),
+                                state.level_index, state.player.rect.x, state.player.rect.y, state.won))
+            f.write(runs.tobytes())
+
+
+class Recording:
+    def __init__(self, path):
+        """
+        기록 파일을 읽습니다.
+        Args:
+            path (str): 기록 파일 경로
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        (magic, version, _, self.start_level, self.level_count, self.ticks, run_count,
+         self.final_level, final_x, final_y, won) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an input recording (version {VERSION})")
+        self.final_pos = (final_x, final_y) # 기록이 끝났을 때 플레이어 위치 (픽셀)
+        self.won = bool(won)
+        runs = np.frombuffer(data, dtype=RUN_DTYPE, count=run_count, offset=HEADER.size)
+        self.codes = np.repeat(runs["code"], runs["count"]).tolist() # 틱별 입력 코드
+
+
+def replay(recording, levels):
+    """
+    기록된 입력을 창과 프레임 제한 없이 GameState에 다시 넣어 게임을 진행합니다.
+    Args:
+        recording (Recording): 재생할 기록
+        levels (list | LevelPack): 기록할 때 사용한 레벨 목록
+    Returns:
+        GameState: 재생이 끝난 게임 상태
+    """
+    if len(levels) != recording.level_count:
+        raise ValueError(f"recording expects {recording.level_count} levels, got {len(levels)}")
+    state = GameState(levels, recording.start_level)
+    inputs = Inputs()
+    # 같은 코드가 이어지는 동안에는 다시 해독하지 않습니다.
+    previous = None
+    for code in recording.codes:
+        if code != previous:
+            decode_inputs(code, inputs)
+            previous = code
+        state.step(inputs)
+    return state
+
+
+def verify(recording, state):
+    """
+    재생 결과가 기록 당시의 마지막 상태와 같은지 확인합니다.
+    Args:
+        recording (Recording): 재생한 기록
+        state (GameState): 재생이 끝난 게임 상태
+    Returns:
+        list: 다른 항목의 설명 문자열 리스트 (모두 같으면 빈 리스트)
+    """
+    mismatches = []
+    if state.level_index != recording.final_level:
+        mismatches.append(f"level index {state.level_index} != {recording.final_level}")
+    if state.player.rect.topleft != recording.final_pos:
+        mismatches.append(f"player position {state.player.rect.topleft} != {recording.final_pos}")
+    if state.won != recording.won:
+        mismatches.append(f"won {state.won} != {recording.won}")
+    return mismatches
+
+
+def main(argv):
+    """
+    명령행에서 기록 파일을 재생하고 결과를 확인합니다.
+    """
+    if len(argv) < 2:
+        print("usage: python replay.py RECORDING [LEVEL_PACK]")
+        return 1
+    recording = Recording(argv[1])
+    pack_path = argv[2] if len(argv) > 2 else LEVEL_PACK_PATH
+    if pack_path:
+        from levelpack import LevelPack
+        levels = LevelPack(pack_path)
+    else:
+        from levels import LEVELS
+        levels = LEVELS
+
+    start = time.perf_counter()
+    state = replay(recording, levels)
+    elapsed = time.perf_counter() - start
+    speedup = recording.ticks / SIMULATION_RATE / elapsed if elapsed > 0 else float("inf")
+    print(f"replayed {recording.ticks} ticks in {elapsed:.3f}s ({speedup:.0f}x real time)")
+
+    mismatches = verify(recording, state)
+    for mismatch in mismatches:
+        print(f"MISMATCH {mismatch}")
+    if mismatches:
+        return 1
+    print(f"OK: level {state.level_index + 1}, player at {state.player.rect.topleft}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,173 @@
+
+# rewind.py
+# 매 틱 게임 상태를 작은 정수 행으로 기록해 두었다가 과거 상태로 되감는 파일입니다.
+# 기록은 메모리 크기가 고정된 링 버퍼에 저장하고, 가장 오래된 틱부터 덮어씁니다.
+#
+# 한 틱의 기록:
+#   - 플레이어 위치, 페르소나, 마지막 이동 방향, 힌트/쿨다운 타이머, 힌트 시작 타일, 승리 여부: 정수 행 하나
+#   - 부서진 벽: 미로를 복사하지 않고 Maze.broken_walls(레벨과의 차이)의 길이만 저장
+#   - 움직이는 발판: 이번 틱에 움직인 발판의 움직이기 전 위치와 속도만 발판 풀(pool)에 저장 (되돌리기 기록)
+# 되감을 때는 최근 틱부터 발판 기록을 거꾸로 적용하고, 그 뒤에 부서진 벽만 다시 세웁니다. 미로는 새로 만들지 않습니다.
+
+import numpy as np
+from config import *
+
+# 틱 기록 행의 열 번호
+TICK, X, Y, PERSONA, LAST_DX, LAST_DY = 0, 1, 2, 3, 4, 5
+HINT_TIMER, HINT_COOLDOWN, BREAK_COOLDOWN, HINT_X, HINT_Y = 6, 7, 8, 9, 10
+WALLS, WON, POOL_START, POOL_COUNT = 11, 12, 13, 14
+COLUMNS = 15
+
+
+class RewindBuffer:
+    def __init__(self, state, capacity=REWIND_SECONDS * SIMULATION_RATE, pool_size=REWIND_PLATFORM_POOL):
+        """
+        되감기 버퍼를 만들고 현재 상태를 첫 기록으로 저장합니다.
+        Args:
+            state (GameState): 기록할 게임 상태
+            capacity (int): 기록할 최대 틱 수
+            pool_size (int): 발판 되돌리기 기록을 저장할 최대 발판 수 (가득 차면 오래된 틱부터 되감을 수 없게 됨)
+        """
+        self.rows = np.zeros((capacity, COLUMNS), dtype=np.int64) # 틱별 기록 (링 버퍼)
+        self.pool_index = np.zeros(pool_size, dtype=np.int32) # 움직인 발판의 인덱스
+        self.pool_x = np.zeros(pool_size, dtype=np.int32) # 움직이기 전 X 좌표
+        self.pool_speed = np.zeros(pool_size, dtype=np.int16) # 움직이기 전 속도
+        self.head = 0 # 다음 기록을 쓸 행
+        self.count = 0 # 저장된 기록 수
+        self.pool_head = 0 # 다음 발판 기록을 쓸 위치 (풀 크기로 나누지 않은 누적 위치)
+        self.maze = None # 기록 중인 미로 (레벨이 바뀌면 기록을 비움)
+        self.record(state)
+
+    @property
+    def nbytes(self):
+        """
+        버퍼가 차지하는 메모리 크기를 반환합니다.
+        Returns:
+            int: 바이트 수
+        """
+        return self.rows.nbytes + self.pool_index.nbytes + self.pool_x.nbytes + self.pool_speed.nbytes
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """
+        모든 기록을 지웁니다.
+        """
+        self.count = 0
+
+    def record(self, state):
+        """
+        GameState.step() 직후의 상태를 기록합니다. 레벨이 바뀌었으면 이전 레벨의 기록을 지웁니다.
+        Args:
+            state (GameState): 기록할 게임 상태
+        """
+        maze = state.maze
+        platforms = maze.platforms
+        pool_start, pool_count = self.pool_head, 0
+        if maze is self.maze and self.count and state.tick == self.rows[(self.head - 1) % len(self.rows), TICK]:
+            return # 진행되지 않은 틱 (승리 후 등)
+        if maze is not self.maze:
+            self.maze = maze
+            self.count = 0 # 첫 기록은 되돌릴 발판 기록이 필요 없음
+        else:
+            pool_count = sum(end - start for start, end in platforms.updated)
+            if pool_count:
+                pool_start = self._reserve(pool_count)
+                position = pool_start % len(self.pool_x)
+                for start, end in platforms.updated:
+                    n = end - start
+                    self.pool_index[position:position + n] = np.arange(start, end)
+                    self.pool_x[position:position + n] = platforms.previous_x[start:end]
+                    # 이번 틱의 이동량이 곧 움직이기 전의 속도입니다. (방향이 바뀌었어도 위치는 이전 속도로 움직임)
+                    np.subtract(platforms.x[start:end], platforms.previous_x[start:end], out=self.pool_speed[position:position + n],
+                                casting="unsafe")
+                    position += n
+
+        player = state.player
+        hint = state.hint_path[0] if state.hint_timer > 0 and state.hint_path else (-1, -1)
+        self.rows[self.head] = (state.tick, player.rect.x, player.rect.y, ord(player.persona), player.last_dx, player.last_dy,
+                                state.hint_timer, state.hint_cooldown_timer, state.break_wall_cooldown_timer, hint[0], hint[1],
+                                len(maze.broken_walls), state.won, pool_start, pool_count)
+        self.head = (self.head + 1) % len(self.rows)
+        self.count = min(self.count + 1, len(self.rows))
+
+    def _reserve(self, count):
+        """
+        발판 풀에서 이어진 공간을 잡고, 덮어쓰게 되는 오래된 기록을 버립니다.
+        Args:
+            count (int): 필요한 발판 수
+        Returns:
+            int: 잡은 공간의 누적 시작 위치
+        """
+        size = len(self.pool_x)
+        if count > size:
+            raise ValueError(f"rewind pool too small for {count} platforms (REWIND_PLATFORM_POOL = {size})")
+        start = self.pool_head
+        if start % size + count > size:
+            start += size - start % size # 풀 끝에 남은 공간이 모자라면 처음부터 씀
+        self.pool_head = start + count
+        # 덮어쓴 발판 기록이 필요한 틱보다 과거로는 되감을 수 없으므로 그 기록을 버립니다.
+        while self.count > 1:
+            oldest = (self.head - self.count + 1) % len(self.rows) # 가장 오래된 기록 다음 틱 (이 틱의 발판 기록이 필요)
+            if self.rows[oldest, POOL_START] < self.pool_head - size:
+                self.count -= 1
+            else:
+                break
+        return start
+
+    def rewind(self, state, ticks):
+        """
+        기록을 따라 최대 ticks틱 전 상태로 되돌립니다. 되돌린 틱의 기록은 지웁니다.
+        Args:
+            state (GameState): 되돌릴 게임 상태 (기록할 때와 같은 미로여야 함)
+            ticks (int): 되돌릴 틱 수
+        Returns:
+            int: 실제로 되돌린 틱 수 (기록이 없으면 0)
+        """
+        if state.maze is not self.maze:
+            self.clear()
+            return 0
+        ticks = min(ticks, self.count - 1)
+        if ticks <= 0:
+            return 0
+        maze = self.maze
+        platforms = maze.platforms
+        rows = len(self.rows)
+        size = len(self.pool_x)
+
+        # 최근 틱부터 거꾸로 발판의 움직이기 전 위치와 속도를 되돌립니다.
+        for step in range(1, ticks + 1):
+            row = self.rows[(self.head - step) % rows]
+            count = int(row[POOL_COUNT])
+            if count:
+                position = int(row[POOL_START]) % size
+                indices = self.pool_index[position:position + count]
+                platforms.x[indices] = self.pool_x[position:position + count]
+                platforms.speed[indices] = self.pool_speed[position:position + count]
+        self.pool_head = int(self.rows[(self.head - ticks) % rows, POOL_START]) # 되돌린 틱의 발판 기록 공간은 다시 사용
+        self.head = (self.head - ticks) % rows
+        self.count -= ticks
+        platforms.previous_x[:] = platforms.x
+        platforms.updated = []
+
+        # 마지막으로 남은 기록의 상태를 적용합니다.
+        row = self.rows[(self.head - 1) % rows].tolist()
+        while len(maze.broken_walls) > row[WALLS]:
+            maze.restore_wall_at(*maze.broken_walls[-1]) # 나중에 부순 벽부터 다시 세움
+        player = state.player
+        persona = chr(row[PERSONA])
+        if player.persona != persona:
+            player.set_persona(persona, announce=False) # 복원이므로 전환 메시지를 출력하지 않음
+        player.rect.topleft = (row[X], row[Y])
+        player.last_dx, player.last_dy = row[LAST_DX], row[LAST_DY]
+        state.tick = row[TICK]
+        state.won = bool(row[WON])
+        state.hint_timer = row[HINT_TIMER]
+        state.hint_cooldown_timer = row[HINT_COOLDOWN]
+        state.break_wall_cooldown_timer = row[BREAK_COOLDOWN]
+        state.used_hint = state.used_break_wall = False # 되돌린 상태는 능력을 새로 사용한 틱이 아님
+        # 힌트 경로는 저장하지 않고 되돌린 벽 상태의 거리장에서 다시 만듭니다.
+        state.hint_path = maze.hint_path((row[HINT_X], row[HINT_Y])) if state.hint_timer > 0 and row[HINT_X] >= 0 else None
+        state.previous_player_pos = player.rect.topleft # 되감은 위치에서는 보간하지 않음
+        return ticks
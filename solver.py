@@ -0,0 +1,217 @@
+
+# solver.py
+# 인격과 능력을 모두 고려하여 레벨의 풀이 가능 여부와 최적 풀이를 계산하는 파일입니다.
+# 상태는 (타일, 페르소나, 부서진 벽 집합, 벽 부수기 쿨다운)으로 구성되며 하나의 정수로 압축됩니다.
+# A* 탐색의 비용은 시뮬레이션 시간(틱)이므로, 찾은 풀이는 가장 빨리 탈출하는 능력 사용 순서입니다.
+#
+# 실행 방법: python solver.py  (LEVELS의 모든 레벨을 검증하고, 풀 수 없는 레벨이 있으면 종료 코드 1)
+
+import heapq
+import sys
+from config import *
+from maze import Maze, TILE_WALL, TILE_TRANSPARENT, TILE_BREAKABLE
+
+PERSONAS = (PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA) # 페르소나 번호 순서 (상태 인코딩용)
+CHIRON, ERIDA, MORA = 0, 1, 2
+
+DIRECTIONS = (("up", 0, -1), ("down", 0, 1), ("left", -1, 0), ("right", 1, 0))
+
+# 비용 단위: 1틱을 TICK_UNITS로 나눠 에리다의 1.5배 속도도 정수 비용으로 표현합니다.
+TICK_UNITS = 6
+MOVE_COST = (
+    round(TILE_SIZE * TICK_UNITS / PLAYER_SPEED),         # 카이론
+    round(TILE_SIZE * TICK_UNITS / (PLAYER_SPEED * 1.5)), # 에리다 (1.5배 속도)
+    round(TILE_SIZE * TICK_UNITS / PLAYER_SPEED),         # 모라
+)
+MIN_MOVE_COST = min(MOVE_COST)
+BREAK_COOLDOWN_COST = BREAK_WALL_COOLDOWN * TICK_UNITS
+
+
+class Solution:
+    def __init__(self, actions, cost):
+        """
+        레벨 풀이 결과를 초기화합니다.
+        Args:
+            actions (list): (동작, 인자) 튜플 리스트
+                ("move", 방향), ("persona", 페르소나 키), ("break", 방향), ("wait", 틱)
+            cost (int): 풀이에 걸리는 시간 (TICK_UNITS 단위)
+        """
+        self.actions = actions
+        self.cost = cost
+
+    @property
+    def ticks(self):
+        """
+        풀이에 걸리는 시뮬레이션 틱 수를 반환합니다.
+        """
+        return self.cost / TICK_UNITS
+
+    def ability_sequence(self):
+        """
+        이동을 제외한 능력 사용(페르소나 전환, 벽 부수기, 대기) 순서를 반환합니다.
+        Returns:
+            list: (동작, 인자) 튜플 리스트
+        """
+        return [action for action in self.actions if action[0] != "move"]
+
+    def describe(self):
+        """
+        연속된 같은 방향 이동을 묶어서 사람이 읽기 쉬운 문자열로 만듭니다.
+        Returns:
+            str: 예) "right x3, persona 2, break down, down x4"
+        """
+        parts = []
+        i = 0
+        while i < len(self.actions):
+            kind, arg = self.actions[i]
+            if kind == "move":
+                count = 1
+                while i + count < len(self.actions) and self.actions[i + count] == (kind, arg):
+                    count += 1
+                parts.append(f"{arg} x{count}")
+                i += count
+            else:
+                parts.append(f"{kind} {arg}")
+                i += 1
+        return ", ".join(parts)
+
+
+def solve(level_data, start_persona=PERSONA_CHIRON):
+    """
+    레벨을 A* 탐색으로 풀어 가장 빠른 풀이를 찾습니다.
+    - 'X'는 항상 막혀 있고, 'T'는 모라일 때만, 'B'는 에리다가 부순 뒤에만 지나갈 수 있습니다.
+    - 벽 부수기는 에리다이고 쿨다운이 끝났을 때 인접한 'B'에만 사용할 수 있습니다.
+    - 움직이는 발판('H')은 길을 막지 않으므로 빈 타일로 취급합니다.
+    휴리스틱은 (맨해튼 거리 x 가장 빠른 이동 비용)으로, 실제 비용을 넘지 않아 최적해를 보장합니다.
+    Args:
+        level_data (list | numpy.ndarray): 레벨 데이터 (Maze와 같은 형식)
+        start_persona (str): 시작 페르소나
+    Returns:
+        Solution: 최적 풀이 (풀 수 없으면 None)
+    """
+    maze = level_data if isinstance(level_data, Maze) else Maze(level_data)
+    width, height = maze.tile_width, maze.tile_height
+    if maze.start_pos is None or maze.end_pos is None:
+        return None
+    tiles = maze.tiles.ravel().tolist()
+
+    # 부술 수 있는 벽마다 비트 번호를 붙여 부서진 벽 집합을 정수 비트셋으로 표현합니다.
+    wall_bit = {}
+    for index, code in enumerate(tiles):
+        if code == TILE_BREAKABLE:
+            wall_bit[index] = len(wall_bit)
+
+    start = maze.start_pos[1] * width + maze.start_pos[0]
+    goal_x, goal_y = maze.end_pos
+    goal = goal_y * width + goal_x
+    cooldown_levels = BREAK_COOLDOWN_COST + 1
+
+    # 상태 = ((부서진 벽 비트셋 * 타일 수 + 타일) * 3 + 페르소나) * 쿨다운 단계 수 + 남은 쿨다운
+    def encode(broken, tile, persona, cooldown):
+        return ((broken * len(tiles) + tile) * 3 + persona) * cooldown_levels + cooldown
+
+    def decode(state):
+        state, cooldown = divmod(state, cooldown_levels)
+        state, persona = divmod(state, 3)
+        broken, tile = divmod(state, len(tiles))
+        return broken, tile, persona, cooldown
+
+    def heuristic(tile):
+        return (abs(tile % width - goal_x) + abs(tile // width - goal_y)) * MIN_MOVE_COST
+
+    start_state = encode(0, start, PERSONAS.index(start_persona), 0)
+    g_score = {start_state: 0}
+    came_from = {} # 상태 -> (이전 상태, 동작)
+    open_set = [(heuristic(start), 0, start_state)]
+
+    while open_set:
+        _, g, state = heapq.heappop(open_set)
+        if g > g_score[state]:
+            continue # 더 짧은 경로로 이미 처리된 상태
+        broken, tile, persona, cooldown = decode(state)
+        if tile == goal:
+            actions = []
+            while state in came_from:
+                state, action = came_from[state]
+                actions.append(action)
+            return Solution(actions[::-1], g)
+
+        x, y = tile % width, tile // width
+        successors = []
+
+        # 상하좌우 이동
+        move_cost = MOVE_COST[persona]
+        for name, dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = ny * width + nx
+            code = tiles[neighbor]
+            if code == TILE_WALL:
+                continue
+            if code == TILE_TRANSPARENT and persona != MORA:
+                continue
+            if code == TILE_BREAKABLE and not broken >> wall_bit[neighbor] & 1:
+                continue
+            successors.append((encode(broken, neighbor, persona, max(cooldown - move_cost, 0)),
+                               move_cost, ("move", name)))
+
+        # 페르소나 전환 (즉시 적용, 투명한 벽 안에서는 모라에서 다른 인격으로 바꿀 수 없음)
+        for other in range(3):
+            if other != persona and (other == MORA or tiles[tile] != TILE_TRANSPARENT):
+                successors.append((encode(broken, tile, other, cooldown), 0, ("persona", PERSONAS[other])))
+
+        # 에리다 능력: 인접한 부술 수 있는 벽 부수기 / 쿨다운이 끝날 때까지 대기
+        if persona == ERIDA:
+            for name, dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                bit = wall_bit.get(ny * width + nx)
+                if bit is None or broken >> bit & 1:
+                    continue
+                if cooldown == 0:
+                    successors.append((encode(broken | 1 << bit, tile, persona, BREAK_COOLDOWN_COST), 0, ("break", name)))
+                else:
+                    successors.append((encode(broken, tile, persona, 0), cooldown,
+                                       ("wait", -(-cooldown // TICK_UNITS))))
+                    break # 대기는 방향과 무관하므로 한 번만 추가
+
+        for next_state, cost, action in successors:
+            tentative = g + cost
+            if tentative < g_score.get(next_state, tentative + 1):
+                g_score[next_state] = tentative
+                came_from[next_state] = (state, action)
+                heapq.heappush(open_set, (tentative + heuristic(decode(next_state)[1]), tentative, next_state))
+    return None # 풀 수 없는 레벨
+
+
+def validate_levels(levels):
+    """
+    모든 레벨이 풀 수 있는지 검증합니다.
+    Args:
+        levels (list): 레벨 데이터 리스트
+    Returns:
+        list: 레벨 순서대로 Solution 리스트 (풀 수 없는 레벨은 None)
+    """
+    return [solve(level) for level in levels]
+
+
+def main():
+    """
+    LEVELS의 모든 레벨을 검증하고 결과를 출력합니다.
+    Returns:
+        int: 모든 레벨을 풀 수 있으면 0, 아니면 1
+    """
+    from levels import LEVELS
+    exit_code = 0
+    for index, solution in enumerate(validate_levels(LEVELS)):
+        if solution is None:
+            print(f"Level {index + 1}: UNSOLVABLE")
+            exit_code = 1
+        else:
+            print(f"Level {index + 1}: {solution.ticks:.0f} ticks - {solution.describe()}")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
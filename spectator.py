@@ -0,0 +1,486 @@
+
+# spectator.py
+# 게임 진행 상황을 로컬 TCP로 관전자에게 보내는 asyncio 서버와 창 없는 관전 클라이언트를 정의하는 파일입니다.
+# 서버는 별도 스레드의 이벤트 루프에서 실행되고, 메인 루프는 틱이 끝날 때 상태를 작게 복사해 넘기기만 합니다.
+# 직렬화와 전송은 모두 서버 스레드에서 처리하며, 접속한 관전자에게는 처음에 전체 상태(키프레임)를 보낸 뒤
+# 바뀐 항목만 담은 델타를 보냅니다. 서버가 밀리면 중간 상태는 건너뛰고 가장 최근 상태와의 차이만 보냅니다.
+#
+# 메시지 형식 (리틀 엔디언, 메시지마다 앞에 길이 u32):
+#   키프레임 : 종류 1(u8), 틱(u32), 레벨(u16), X(i32), Y(i32), 페르소나(u8), 힌트 표시/힌트 쿨다운/벽 부수기 쿨다운(u16 x3),
+#              발판 수(u32), 부서진 벽 수(u32), 발판 X 좌표(i32 배열), 부서진 벽 (x, y) 타일 좌표(u16 쌍 배열)
+#   델타     : 종류 2(u8), 틱(u32), 바뀐 항목 비트(u8), 이어서 바뀐 항목만 순서대로
+#              1 위치(i32 x2), 2 페르소나(u8), 4 타이머(u16 x3),
+#              8 발판(개수 u32, 인덱스 u32 배열, X 좌표 i32 배열), 16 새로 부서진 벽(개수 u32, u16 쌍 배열)
+#   레벨이 바뀌는 등 델타로 나타낼 수 없는 변화는 키프레임으로 보냅니다.
+#
+# 실행 방법:
+#   python spectator.py serve 기록파일 [포트]        (replay.py 기록을 실제 속도로 재생하며 방송)
+#   python spectator.py watch [호스트] [포트] [접속 수] (창 없는 관전 클라이언트, 접속 수로 부하 시험)
+
+import asyncio
+import socket
+import struct
+import sys
+import threading
+import time
+import numpy as np
+from config import *
+
+KEYFRAME = 1
+DELTA = 2
+LENGTH = struct.Struct("<I")
+KEYFRAME_HEADER = struct.Struct("<BIHiiBHHHII")
+DELTA_HEADER = struct.Struct("<BIB")
+POSITION = struct.Struct("<ii")
+PERSONA = struct.Struct("<B")
+TIMERS = struct.Struct("<HHH")
+COUNT = struct.Struct("<I")
+
+CHANGED_POSITION = 1
+CHANGED_PERSONA = 2
+CHANGED_TIMERS = 4
+CHANGED_PLATFORMS = 8
+CHANGED_WALLS = 16
+
+
+class Snapshot:
+    __slots__ = ("tick", "level", "x", "y", "persona", "timers", "platforms", "walls")
+
+    def __init__(self, tick, level, x, y, persona, timers, platforms, walls):
+        """
+        관전자에게 보낼 한 틱의 게임 상태를 저장합니다.
+        Args:
+            tick (int): 시뮬레이션 틱 수
+            level (int): 레벨 인덱스
+            x (int): 플레이어 X 좌표 (픽셀)
+            y (int): 플레이어 Y 좌표 (픽셀)
+            persona (int): 페르소나 문자 코드
+            timers (tuple): (힌트 표시, 힌트 쿨다운, 벽 부수기 쿨다운) 타이머 (틱)
+            platforms (numpy.ndarray): 발판 X 좌표 (int32 배열)
+            walls (tuple): 부서진 벽의 (x, y) 타일 좌표 (부순 순서)
+        """
+        self.tick = tick
+        self.level = level
+        self.x = x
+        self.y = y
+        self.persona = persona
+        self.timers = timers
+        self.platforms = platforms
+        self.walls = walls
+
+
+def capture(state):
+    """
+    게임 상태에서 관전자에게 필요한 값만 복사합니다. 메인 루프에서 호출되므로 직렬화는 하지 않습니다.
+    Args:
+        state (GameState): 현재 게임 상태
+    Returns:
+        Snapshot: 복사한 상태
+    """
+    rect = state.player.rect
+    maze = state.maze
+    return Snapshot(state.tick, state.level_index, rect.x, rect.y, ord(state.player.persona),
+                    (state.hint_timer, state.hint_cooldown_timer, state.break_wall_cooldown_timer),
+                    maze.platforms.x.copy(), tuple(maze.broken_walls))
+
+
+def encode_keyframe(snapshot):
+    """
+    전체 상태를 키프레임 메시지로 만듭니다.
+    Args:
+        snapshot (Snapshot): 보낼 상태
+    Returns:
+        bytes: 길이가 붙은 메시지
+    """
+    walls = np.array(snapshot.walls, dtype="<u2").reshape(-1, 2)
+    payload = b"".join((
+        KEYFRAME_HEADER.pack(KEYFRAME, snapshot.tick, snapshot.level, snapshot.x, snapshot.y, snapshot.persona,
+                             *snapshot.timers, len(snapshot.platforms), len(walls)),
+        snapshot.platforms.astype("<i4", copy=False).tobytes(),
+        walls.tobytes(),
+    ))
+    return LENGTH.pack(len(payload)) + payload
+
+
+def encode_delta(previous, snapshot):
+    """
+    직전에 보낸 상태와 비교하여 바뀐 항목만 담은 델타 메시지를 만듭니다.
+    Args:
+        previous (Snapshot): 관전자가 가지고 있는 상태
+        snapshot (Snapshot): 보낼 상태
+    Returns:
+        bytes: 길이가 붙은 메시지 (델타로 나타낼 수 없으면 None)
+    """
+    if (snapshot.level != previous.level or len(snapshot.platforms) != len(previous.platforms)
+            or snapshot.walls[:len(previous.walls)] != previous.walls):
+        return None # 레벨이 바뀌었거나 벽 목록이 이어지지 않으면 키프레임 필요
+    flags = 0
+    parts = [None]
+    if (snapshot.x, snapshot.y) != (previous.x, previous.y):
+        flags |= CHANGED_POSITION
+        parts.append(POSITION.pack(snapshot.x, snapshot.y))
+    if snapshot.persona != previous.persona:
+        flags |= CHANGED_PERSONA
+        parts.append(PERSONA.pack(snapshot.persona))
+    if snapshot.timers != previous.timers:
+        flags |= CHANGED_TIMERS
+        parts.append(TIMERS.pack(*snapshot.timers))
+    moved = np.flatnonzero(snapshot.platforms != previous.platforms)
+    if moved.size:
+        flags |= CHANGED_PLATFORMS
+        parts.append(COUNT.pack(moved.size))
+        parts.append(moved.astype("<u4").tobytes())
+        parts.append(snapshot.platforms[moved].astype("<i4", copy=False).tobytes())
+    if len(snapshot.walls) != len(previous.walls):
+        walls = snapshot.walls[len(previous.walls):]
+        flags |= CHANGED_WALLS
+        parts.append(COUNT.pack(len(walls)))
+        parts.append(np.array(walls, dtype="<u2").tobytes())
+    parts[0] = DELTA_HEADER.pack(DELTA, snapshot.tick, flags)
+    payload = b"".join(parts)
+    return LENGTH.pack(len(payload)) + payload
+
+
+class SpectatorServer:
+    def __init__(self, host=SPECTATOR_HOST, port=SPECTATOR_PORT, max_clients=SPECTATOR_MAX_CLIENTS,
+                 max_buffer=SPECTATOR_MAX_BUFFER):
+        """
+        관전 서버를 초기화합니다. start()를 호출해야 접속을 받기 시작합니다.
+        Args:
+            host (str): 접속을 받을 주소
+            port (int): 접속을 받을 포트 (0이면 빈 포트를 자동으로 선택)
+            max_clients (int): 동시에 접속할 수 있는 최대 관전자 수
+            max_buffer (int): 관전자별로 보내지 못하고 쌓아 둘 수 있는 최대 바이트 수 (넘으면 따라잡을 때까지 건너뜀)
+        """
+        self.host = host
+        self.port = port
+        self.max_clients = max_clients
+        self.max_buffer = max_buffer
+        self.clients = set() # 접속 중인 관전자의 StreamWriter
+        self.stale = set() # 전송이 밀려 다음에 키프레임을 받아야 하는 관전자
+        self.sent = None # 관전자들이 마지막으로 받은 상태 (델타의 기준)
+        self.keyframe = None # sent 상태의 키프레임 메시지 (필요할 때 한 번만 만듦)
+        self.pending = None # 메인 루프가 넘긴 가장 최근 상태
+        self.scheduled = False # 서버 스레드에 전송 작업이 예약되어 있는지 여부
+        self.loop = None
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """
+        별도 스레드에서 이벤트 루프를 시작하고 접속을 받을 준비가 될 때까지 기다립니다.
+        Returns:
+            SpectatorServer: 자기 자신
+        """
+        ready = threading.Event()
+        errors = []
+        self.thread = threading.Thread(target=self._run, args=(ready, errors), name="spectator", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if errors:
+            self.thread.join()
+            raise errors[0]
+        print(f"Spectator server listening on {self.host}:{self.port}")
+        return self
+
+    def _run(self, ready, errors):
+        """
+        서버 스레드의 본체입니다. 이벤트 루프를 만들고 stop()이 호출될 때까지 실행합니다.
+        """
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._serve, self.host, self.port, backlog=self.max_clients))
+        except OSError as error:
+            errors.append(error)
+            ready.set()
+            self.loop.close()
+            return
+        self.port = self.server.sockets[0].getsockname()[1]
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def publish(self, state):
+        """
+        메인 루프에서 틱이 끝난 뒤 호출합니다. 상태를 복사해 두고 전송은 서버 스레드에 맡깁니다.
+        Args:
+            state (GameState): 현재 게임 상태
+        """
+        self.pending = capture(state)
+        # 이미 전송 작업이 예약되어 있으면 그 작업이 가장 최근 상태를 보냅니다.
+        if self.clients and not self.scheduled:
+            self.scheduled = True
+            self.loop.call_soon_threadsafe(self._flush)
+
+    def _flush(self):
+        """
+        가장 최근 상태를 직렬화하여 모든 관전자에게 보냅니다. (서버 스레드에서 실행)
+        """
+        self.scheduled = False # 상태를 읽기 전에 해제해야 그 사이에 들어온 상태도 다시 예약됨
+        snapshot = self.pending
+        if snapshot is None or snapshot is self.sent:
+            return
+        message = encode_delta(self.sent, snapshot) if self.sent is not None else None
+        self.keyframe = None
+        if message is None:
+            message = self.keyframe = encode_keyframe(snapshot)
+        self.sent = snapshot
+        for writer in self.clients:
+            transport = writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.max_buffer:
+                self.stale.add(writer) # 받지 못한 델타가 생기므로 따라잡으면 키프레임부터 다시 보냄
+                continue
+            if writer in self.stale:
+                self.stale.discard(writer)
+                writer.write(self._current_keyframe())
+            else:
+                writer.write(message)
+
+    def _current_keyframe(self):
+        """
+        관전자들이 마지막으로 받은 상태의 키프레임을 반환합니다.
+        Returns:
+            bytes: 키프레임 메시지
+        """
+        if self.keyframe is None:
+            self.keyframe = encode_keyframe(self.sent)
+        return self.keyframe
+
+    async def _serve(self, reader, writer):
+        """
+        관전자 한 명의 접속을 처리합니다. 현재 상태의 키프레임을 보낸 뒤 접속이 끊길 때까지 기다립니다.
+        """
+        if len(self.clients) >= self.max_clients:
+            writer.close()
+            return
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if not self.clients and self.pending is not None and self.pending is not self.sent:
+            # 관전자가 없는 동안에는 전송하지 않았으므로 기준 상태를 최근 상태로 옮깁니다.
+            self.sent = self.pending
+            self.keyframe = None
+        if self.sent is not None:
+            writer.write(self._current_keyframe())
+        else:
+            self.stale.add(writer) # 아직 보낼 상태가 없으면 첫 상태를 키프레임으로 받음
+        self.clients.add(writer)
+        try:
+            while await reader.read(1024): # 관전자가 보내는 데이터는 무시
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            self.stale.discard(writer)
+            writer.close()
+
+    async def _shutdown(self):
+        """
+        접속을 더 받지 않고 모든 관전자의 연결을 닫습니다. (서버 스레드에서 실행)
+        """
+        self.server.close()
+        for writer in list(self.clients):
+            writer.close()
+        await self.server.wait_closed()
+
+    def stop(self):
+        """
+        서버를 종료하고 서버 스레드가 끝날 때까지 기다립니다.
+        """
+        if self.thread is None or not self.thread.is_alive():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        try:
+            future.result(timeout=1.0)
+        except (TimeoutError, asyncio.TimeoutError):
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class SpectatorView:
+    def __init__(self):
+        """
+        관전 클라이언트가 받은 메시지로 복원한 게임 상태를 초기화합니다.
+        """
+        self.tick = 0
+        self.level = 0
+        self.x = 0
+        self.y = 0
+        self.persona = None
+        self.timers = (0, 0, 0)
+        self.platforms = np.empty(0, dtype=np.int32)
+        self.walls = []
+        self.synced = False # 키프레임을 받아 상태가 완전한지 여부
+        self.messages = 0 # 지금까지 받은 메시지 수
+
+    def apply(self, payload):
+        """
+        메시지 하나를 상태에 반영합니다.
+        Args:
+            payload (bytes): 길이를 뺀 메시지 본문
+        """
+        self.messages += 1
+        kind = payload[0]
+        if kind == KEYFRAME:
+            (_, self.tick, self.level, self.x, self.y, persona, hint_timer, hint_cooldown, break_cooldown,
+             platform_count, wall_count) = KEYFRAME_HEADER.unpack_from(payload, 0)
+            self.persona = chr(persona)
+            self.timers = (hint_timer, hint_cooldown, break_cooldown)
+            offset = KEYFRAME_HEADER.size
+            self.platforms = np.frombuffer(payload, dtype="<i4", count=platform_count, offset=offset).astype(np.int32)
+            offset += platform_count * 4
+            walls = np.frombuffer(payload, dtype="<u2", count=wall_count * 2, offset=offset).reshape(-1, 2)
+            self.walls = [tuple(wall) for wall in walls.tolist()]
+            self.synced = True
+            return
+        if kind != DELTA:
+            raise ValueError(f"unknown spectator message type {kind}")
+        _, self.tick, flags = DELTA_HEADER.unpack_from(payload, 0)
+        offset = DELTA_HEADER.size
+        if flags & CHANGED_POSITION:
+            self.x, self.y = POSITION.unpack_from(payload, offset)
+            offset += POSITION.size
+        if flags & CHANGED_PERSONA:
+            self.persona = chr(PERSONA.unpack_from(payload, offset)[0])
+            offset += PERSONA.size
+        if flags & CHANGED_TIMERS:
+            self.timers = TIMERS.unpack_from(payload, offset)
+            offset += TIMERS.size
+        if flags & CHANGED_PLATFORMS:
+            (count,) = COUNT.unpack_from(payload, offset)
+            offset += COUNT.size
+            indices = np.frombuffer(payload, dtype="<u4", count=count, offset=offset)
+            offset += count * 4
+            self.platforms[indices] = np.frombuffer(payload, dtype="<i4", count=count, offset=offset)
+            offset += count * 4
+        if flags & CHANGED_WALLS:
+            (count,) = COUNT.unpack_from(payload, offset)
+            offset += COUNT.size
+            walls = np.frombuffer(payload, dtype="<u2", count=count * 2, offset=offset).reshape(-1, 2)
+            self.walls.extend(tuple(wall) for wall in walls.tolist())
+
+
+async def watch(host, port, view, stop=None):
+    """
+    관전 서버에 접속하여 연결이 끊기거나 stop이 설정될 때까지 받은 메시지를 상태에 반영합니다.
+    Args:
+        host (str): 서버 주소
+        port (int): 서버 포트
+        view (SpectatorView): 상태를 복원할 객체
+        stop (asyncio.Event): 설정되면 접속을 끊음 (없으면 서버가 끊을 때까지)
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    receive = asyncio.ensure_future(_receive(reader, view))
+    try:
+        if stop is None:
+            await receive
+        else:
+            stopped = asyncio.ensure_future(stop.wait())
+            await asyncio.wait((receive, stopped), return_when=asyncio.FIRST_COMPLETED)
+            stopped.cancel()
+    finally:
+        receive.cancel()
+        writer.close()
+
+
+async def _receive(reader, view):
+    """
+    길이가 붙은 메시지를 차례로 읽어 상태에 반영합니다.
+    """
+    try:
+        while True:
+            (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+            view.apply(await reader.readexactly(length))
+    except asyncio.IncompleteReadError:
+        pass # 서버가 연결을 닫음
+
+
+async def _watch_many(host, port, clients, seconds):
+    """
+    여러 관전 클라이언트를 동시에 접속시키고 1초마다 첫 번째 클라이언트의 상태와 전체 수신량을 출력합니다.
+    """
+    views = [SpectatorView() for _ in range(clients)]
+    stop = asyncio.Event()
+    tasks = [asyncio.ensure_future(watch(host, port, view, stop)) for view in views]
+    start = time.perf_counter()
+    previous = 0
+    while not all(task.done() for task in tasks):
+        await asyncio.sleep(1.0)
+        received = sum(view.messages for view in views)
+        view = views[0]
+        print(f"tick {view.tick:7d}  level {view.level + 1}  player ({view.x}, {view.y})  persona {view.persona}"
+              f"  walls {len(view.walls)}  synced {sum(v.synced for v in views)}/{clients}  {received - previous} msg/s")
+        previous = received
+        if seconds is not None and time.perf_counter() - start >= seconds:
+            stop.set()
+            break
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def serve_recording(path, port):
+    """
+    기록 파일을 창 없이 실제 속도로 재생하면서 관전 서버로 방송합니다.
+    Args:
+        path (str): replay.py 기록 파일 경로
+        port (int): 접속을 받을 포트
+    """
+    from replay import Recording, decode_inputs
+    from game_state import GameState, Inputs
+    recording = Recording(path)
+    if LEVEL_PACK_PATH:
+        from levelpack import LevelPack
+        levels = LevelPack(LEVEL_PACK_PATH)
+    else:
+        from levels import LEVELS
+        levels = LEVELS
+    state = GameState(levels, recording.start_level)
+    inputs = Inputs()
+    server = SpectatorServer(port=port).start()
+    tick_time = 1.0 / SIMULATION_RATE
+    next_tick = time.perf_counter()
+    try:
+        for code in recording.codes:
+            decode_inputs(code, inputs)
+            state.step(inputs)
+            server.publish(state)
+            next_tick += tick_time
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        server.stop()
+
+
+def main(argv):
+    """
+    명령행에서 기록을 방송하거나 관전 클라이언트를 실행합니다.
+    """
+    if len(argv) >= 3 and argv[1] == "serve":
+        serve_recording(argv[2], int(argv[3]) if len(argv) > 3 else SPECTATOR_PORT or 0)
+        return 0
+    if len(argv) >= 2 and argv[1] == "watch":
+        host = argv[2] if len(argv) > 2 else SPECTATOR_HOST
+        port = int(argv[3]) if len(argv) > 3 else SPECTATOR_PORT
+        clients = int(argv[4]) if len(argv) > 4 else 1
+        if port is None:
+            print("no port given and SPECTATOR_PORT is not set")
+            return 1
+        try:
+            asyncio.run(_watch_many(host, port, clients, None))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    print("usage: python spectator.py serve RECORDING [PORT]\n"
+          "       python spectator.py watch [HOST] [PORT] [CLIENTS]")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,331 @@
+
+# telemetry.py
+# 플레이어가 어디서 막히는지 찾기 위해 세션별 플레이 기록을 남기고, 많은 세션의 기록을 모아 분석하는 파일입니다.
+#
+# 기록 (게임 중):
+#   TelemetrySampler가 매 틱 플레이어 중심의 타일 좌표, 페르소나, 레벨을 확인하고,
+#   바뀌었을 때와 능력(힌트, 벽 부수기)을 사용했을 때만 이벤트 하나를 버퍼에 추가합니다.
+#   바뀐 것이 없는 틱은 정수 비교 몇 번으로 끝나며, 버퍼가 차면 한 번에 파일에 씁니다.
+#
+# 분석 (오프라인):
+#   세션 파일을 하나씩 읽어 이벤트 사이의 틱 수를 그 타일에 머문 시간으로 보고 레벨별 히트맵에 더합니다.
+#   모든 세션을 메모리에 올리지 않으며, 히트맵은 레벨의 미로 위에 그려 PNG로 저장합니다.
+#   - 체류 시간: 타일에 머문 전체 시간
+#   - 정체 시간: 탈출구까지의 거리(미로의 거리장)가 TELEMETRY_STALL_SECONDS 동안 줄지 않은 뒤에 머문 시간
+#     (이 게임에는 죽음이 없으므로, 죽지 않고 진전 없이 헤매는 곳이 막히는 곳입니다)
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더   : 매직 b"PMTL", 버전(u16), 예약(u16), 레벨 수(u32)
+#   이벤트 : 틱(u32), 레벨(u32), 종류(u8), 페르소나(u8), 예약(u16), 타일 X(u16), 타일 Y(u16)
+#   틱은 기록을 시작한 뒤 진행한 틱 수입니다. (되감기로 돌아간 틱도 플레이한 시간으로 셈)
+#
+# 실행 방법:
+#   python telemetry.py 세션폴더 [출력폴더] [레벨팩]   (레벨팩을 생략하면 config.py의 LEVEL_PACK_PATH 또는 levels.py 사용)
+
+import os
+import struct
+import sys
+import time
+from array import array
+import numpy as np
+import pygame
+from config import *
+from maze import Maze, TILE_PALETTE
+
+MAGIC = b"PMTL"
+VERSION = 2 # 버전 1은 레벨 인덱스를 16비트로 저장했음
+HEADER = struct.Struct("<4sHHI")
+EVENT_DTYPE = np.dtype([("tick", "<u4"), ("level", "<u4"), ("kind", "u1"), ("persona", "u1"), ("reserved", "<u2"),
+                        ("x", "<u2"), ("y", "<u2")])
+SESSION_SUFFIX = ".pmtl"
+
+# 이벤트 종류
+LEVEL, MOVE, PERSONA, HINT, BREAK, END = 0, 1, 2, 3, 4, 5
+ACTIONS = (PERSONA, HINT, BREAK) # 타일별로 횟수를 세는 이벤트 종류
+
+
+class TelemetrySampler:
+    def __init__(self, path, state, flush_events=TELEMETRY_FLUSH_EVENTS):
+        """
+        세션 기록 파일을 만들고 현재 상태를 첫 이벤트로 기록합니다.
+        Args:
+            path (str): 저장할 세션 파일 경로
+            state (GameState): 기록할 게임 상태
+            flush_events (int): 이만큼 이벤트가 쌓이면 파일에 씀
+        """
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, len(state.levels)))
+        # 이벤트 하나를 32비트 정수 4개로 저장합니다. (틱, 레벨, 종류 | 페르소나 << 8, X | Y << 16)
+        # 레벨 팩에는 레벨이 얼마든지 들어갈 수 있으므로 레벨 인덱스는 32비트 전체를 씁니다.
+        self.events = array("I")
+        self.flush_words = flush_events * 4
+        self.ticks = 0 # 기록을 시작한 뒤 진행한 틱 수
+        self.level = None # 마지막 이벤트의 레벨 인덱스
+        self.persona = None # 마지막 이벤트의 페르소나
+        self.tile = None # 마지막 이벤트의 타일 (X | Y << 16)
+        rect = state.player.rect
+        self._changed(state, rect.centerx // TILE_SIZE | rect.centery // TILE_SIZE << 16)
+
+    def sample(self, state):
+        """
+        GameState.step() 직후에 호출하여 이번 틱의 상태를 확인합니다. 바뀐 것이 없으면 아무것도 기록하지 않습니다.
+        Args:
+            state (GameState): 기록할 게임 상태
+        """
+        self.ticks += 1
+        rect = state.player.rect
+        tile = rect.centerx // TILE_SIZE | rect.centery // TILE_SIZE << 16
+        if (tile == self.tile and state.level_index == self.level and state.player.persona == self.persona
+                and not state.used_hint and not state.used_break_wall):
+            return
+        self._changed(state, tile)
+
+    def _changed(self, state, tile):
+        """
+        바뀐 상태와 사용한 능력을 이벤트로 추가합니다.
+        Args:
+            state (GameState): 기록할 게임 상태
+            tile (int): 플레이어 중심의 타일 (X | Y << 16)
+        """
+        level = state.level_index
+        persona = state.player.persona
+        if level != self.level:
+            kind = LEVEL
+        elif persona != self.persona:
+            kind = PERSONA
+        elif tile != self.tile:
+            kind = MOVE
+        else:
+            kind = None # 능력만 사용한 틱
+        self.level, self.persona, self.tile = level, persona, tile
+        if kind is not None:
+            self._append(kind)
+        if state.used_hint:
+            self._append(HINT)
+        if state.used_break_wall:
+            self._append(BREAK)
+        if len(self.events) >= self.flush_words:
+            self.flush()
+
+    def _append(self, kind):
+        """
+        마지막 상태로 이벤트 하나를 버퍼에 추가합니다.
+        Args:
+            kind (int): 이벤트 종류
+        """
+        self.events.extend((self.ticks, self.level, kind | ord(self.persona) << 8, self.tile))
+
+    def flush(self):
+        """
+        버퍼에 쌓인 이벤트를 파일에 씁니다.
+        """
+        if self.events:
+            self.file.write(np.frombuffer(self.events, dtype=np.uint32).astype("<u4").tobytes())
+            del self.events[:]
+
+    def close(self):
+        """
+        마지막 이벤트(기록 종료 시점)를 추가하고 파일을 닫습니다.
+        """
+        self._append(END)
+        self.flush()
+        self.file.close()
+
+
+def read_events(path):
+    """
+    세션 파일의 이벤트를 읽습니다.
+    Args:
+        path (str): 세션 파일 경로
+    Returns:
+        tuple: (레벨 수, EVENT_DTYPE 구조화 배열)
+    """
+    with open(path, "rb") as f:
+        magic, version, _, level_count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a telemetry session (version {VERSION})")
+        data = f.read()
+    # 게임이 비정상 종료되어 마지막 이벤트가 잘린 파일은 온전한 이벤트까지만 사용합니다.
+    count = len(data) // EVENT_DTYPE.itemsize
+    return level_count, np.frombuffer(data, dtype=EVENT_DTYPE, count=count)
+
+
+class TelemetryAnalysis:
+    def __init__(self, levels, stall_seconds=TELEMETRY_STALL_SECONDS):
+        """
+        레벨별 히트맵 누적기를 초기화합니다. 히트맵은 세션에 처음 나온 레벨부터 만들어집니다.
+        Args:
+            levels (list | LevelPack): 세션을 기록할 때 사용한 레벨 목록
+            stall_seconds (float): 탈출구까지의 거리가 이 시간 동안 줄지 않으면 정체로 봄
+        """
+        self.levels = levels
+        self.stall_ticks = int(stall_seconds * SIMULATION_RATE)
+        self.sessions = 0 # 누적한 세션 수
+        self.mazes = {} # 레벨 인덱스 -> Maze (히트맵 좌표와 거리장에 사용)
+        self.dwell = {} # 레벨 인덱스 -> 타일별 체류 틱 수 (세로, 가로)
+        self.stall = {} # 레벨 인덱스 -> 타일별 정체 틱 수 (세로, 가로)
+        self.actions = {} # 레벨 인덱스 -> 타일별 (페르소나 전환, 힌트, 벽 부수기) 횟수 (3, 세로, 가로)
+        self.visits = {} # 레벨 인덱스 -> 그 레벨을 플레이한 세션 수
+
+    def _level(self, level):
+        """
+        레벨의 미로와 누적 배열을 반환합니다. 처음 나온 레벨이면 만듭니다.
+        """
+        maze = self.mazes.get(level)
+        if maze is None:
+            maze = self.mazes[level] = Maze(self.levels[level])
+            shape = (maze.tile_height, maze.tile_width)
+            self.dwell[level] = np.zeros(shape, dtype=np.int64)
+            self.stall[level] = np.zeros(shape, dtype=np.int64)
+            self.actions[level] = np.zeros((len(ACTIONS),) + shape, dtype=np.int64)
+            self.visits[level] = 0
+        return maze
+
+    def add_session(self, path):
+        """
+        세션 파일 하나의 이벤트를 레벨별 히트맵에 더합니다.
+        Args:
+            path (str): 세션 파일 경로
+        """
+        level_count, events = read_events(path)
+        if level_count != len(self.levels):
+            raise ValueError(f"{path} expects {level_count} levels, got {len(self.levels)}")
+        self.sessions += 1
+        if not len(events):
+            return
+        ticks = events["tick"].astype(np.int64)
+        # 다음 이벤트까지의 틱 수가 이 이벤트의 타일에 머문 시간입니다. (마지막 이벤트는 0)
+        ends = np.append(ticks[1:], ticks[-1])
+        levels = events["level"]
+        # 레벨은 한 세션에서 바뀌기만 하므로 레벨이 바뀌는 지점에서 나눕니다.
+        bounds = np.concatenate(([0], np.flatnonzero(levels[1:] != levels[:-1]) + 1, [len(events)]))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            level = int(levels[start])
+            maze = self._level(level)
+            self.visits[level] += 1
+            x = events["x"][start:end].astype(np.int64)
+            y = events["y"][start:end].astype(np.int64)
+            inside = (x < maze.tile_width) & (y < maze.tile_height)
+            tile = y * maze.tile_width + x
+            size = maze.tile_width * maze.tile_height
+            begin, finish = ticks[start:end], ends[start:end]
+            self.dwell[level] += np.bincount(tile[inside], weights=(finish - begin)[inside],
+                                             minlength=size).astype(np.int64).reshape(maze.tile_height, maze.tile_width)
+
+            # 지금까지 가장 가까웠던 탈출구까지의 거리가 마지막으로 줄어든 틱에서 stall_ticks가 지난 뒤의 시간만 정체로 셉니다.
+            # (부서진 벽처럼 거리장에 없는 타일은 거리를 줄이지 않은 것으로 봄)
+            distance = np.where(inside, maze.distance_field[np.minimum(y, maze.tile_height - 1),
+                                                            np.minimum(x, maze.tile_width - 1)], -1).astype(np.int64)
+            distance[distance < 0] = np.iinfo(np.int64).max
+            best = np.minimum.accumulate(distance)
+            improved = np.ones(len(best), dtype=bool)
+            improved[1:] = best[1:] < best[:-1]
+            since = np.maximum.accumulate(np.where(improved, begin, 0))
+            stalled = np.clip(finish - np.maximum(begin, since + self.stall_ticks), 0, None)
+            self.stall[level] += np.bincount(tile[inside], weights=stalled[inside],
+                                             minlength=size).astype(np.int64).reshape(maze.tile_height, maze.tile_width)
+
+            kinds = events["kind"][start:end]
+            for index, kind in enumerate(ACTIONS):
+                chosen = inside & (kinds == kind)
+                self.actions[level][index] += np.bincount(tile[chosen], minlength=size).reshape(maze.tile_height, maze.tile_width)
+
+    def add_directory(self, directory):
+        """
+        폴더 안의 모든 세션 파일을 차례로 더합니다.
+        Args:
+            directory (str): 세션 파일이 있는 폴더
+        Returns:
+            int: 더한 세션 수
+        """
+        names = sorted(name for name in os.listdir(directory) if name.endswith(SESSION_SUFFIX))
+        for name in names:
+            self.add_session(os.path.join(directory, name))
+        return len(names)
+
+    def hotspots(self, level, count=5):
+        """
+        정체 시간이 가장 긴 타일을 반환합니다.
+        Args:
+            level (int): 레벨 인덱스
+            count (int): 반환할 타일 수
+        Returns:
+            list: (x, y, 정체 초) 튜플 리스트 (긴 순서)
+        """
+        stall = self.stall[level]
+        order = np.argsort(stall, axis=None)[::-1][:count]
+        return [(int(tile % stall.shape[1]), int(tile // stall.shape[1]), stall.flat[tile] / SIMULATION_RATE)
+                for tile in order if stall.flat[tile] > 0]
+
+
+def render_heatmap(maze, values, path, color=RED):
+    """
+    레벨의 미로 위에 타일별 값을 색으로 겹쳐 그려 이미지 파일로 저장합니다.
+    값은 log(1 + 값)을 가장 큰 값으로 나눈 비율만큼 color와 섞습니다. (적은 값도 보이도록)
+    Args:
+        maze (Maze): 히트맵을 그릴 미로
+        values (numpy.ndarray): (세로, 가로) 크기의 타일별 값
+        path (str): 저장할 이미지 경로 (확장자로 형식 결정)
+        color (tuple): 가장 큰 값의 색상 (RGB)
+    """
+    heat = np.log1p(values.astype(np.float64))
+    peak = heat.max()
+    if peak > 0:
+        heat /= peak
+    weight = heat[..., None] * TELEMETRY_HEAT_OPACITY
+    colors = TILE_PALETTE[maze.tiles] * (1.0 - weight) + np.array(color, dtype=np.float64) * weight
+    surface = pygame.surfarray.make_surface(colors.astype(np.uint8).transpose(1, 0, 2)) # surfarray는 (가로, 세로) 순서
+    scale = max(1, TELEMETRY_HEATMAP_SIZE // max(maze.tile_width, maze.tile_height)) # 타일 하나의 픽셀 수
+    surface = pygame.transform.scale(surface, (maze.tile_width * scale, maze.tile_height * scale))
+    pygame.image.save(surface, path)
+
+
+def session_path(directory):
+    """
+    새 세션 파일 경로를 만듭니다. (같은 폴더에 여러 게임이 동시에 기록해도 겹치지 않도록 프로세스 번호 포함)
+    Args:
+        directory (str): 세션 파일을 저장할 폴더 (없으면 만듦)
+    Returns:
+        str: 세션 파일 경로
+    """
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"session_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}{SESSION_SUFFIX}")
+
+
+def main(argv):
+    """
+    명령행에서 세션 폴더를 분석하여 레벨별 히트맵 이미지와 요약을 출력합니다.
+    """
+    if len(argv) < 2:
+        print("usage: python telemetry.py SESSION_DIR [OUTPUT_DIR] [LEVEL_PACK]")
+        return 1
+    output = argv[2] if len(argv) > 2 else "heatmaps"
+    pack_path = argv[3] if len(argv) > 3 else LEVEL_PACK_PATH
+    if pack_path:
+        from levelpack import LevelPack
+        levels = LevelPack(pack_path)
+    else:
+        from levels import LEVELS
+        levels = LEVELS
+
+    analysis = TelemetryAnalysis(levels)
+    analysis.add_directory(argv[1])
+    print(f"{analysis.sessions} sessions")
+    os.makedirs(output, exist_ok=True)
+    for level in sorted(analysis.mazes):
+        maze = analysis.mazes[level]
+        render_heatmap(maze, analysis.dwell[level], os.path.join(output, f"level{level + 1}_dwell.png"))
+        render_heatmap(maze, analysis.stall[level], os.path.join(output, f"level{level + 1}_stall.png"))
+        switches, hints, breaks = analysis.actions[level].sum(axis=(1, 2))
+        print(f"level {level + 1}: {analysis.visits[level]} sessions, "
+              f"{analysis.dwell[level].sum() / SIMULATION_RATE:.0f}s played, "
+              f"{analysis.stall[level].sum() / SIMULATION_RATE:.0f}s stalled, "
+              f"{switches} persona switches, {hints} hints, {breaks} walls broken")
+        for x, y, seconds in analysis.hotspots(level):
+            print(f"  stalled at ({x}, {y}): {seconds:.0f}s")
+    print(f"heatmaps written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,47 @@
+
+# test_collision.py
+# 플레이어와 미로 타일 사이의 충돌 규칙을 검사하는 테스트 파일입니다.
+# 부술 수 있는 벽(B)은 부서지기 전까지 모든 페르소나를 막고, 에리다가 부순 뒤에는 지나갈 수 있는지 확인합니다.
+#
+# 실행 방법: python -m pytest
+
+from config import *
+from maze import Maze
+from player import Player
+
+# 시작 위치 오른쪽에 부술 수 있는 벽, 투명한 벽, 탈출구가 차례로 있는 복도
+CORRIDOR = [
+    "XXXXXXXXX",
+    "XP B T EX",
+    "XXXXXXXXX",
+]
+
+
+def walk_right(player, maze, ticks=80):
+    """
+    플레이어를 오른쪽으로 여러 틱 동안 이동시키고, 멈춘 위치의 오른쪽 끝(픽셀)을 반환합니다.
+    """
+    for _ in range(ticks):
+        player.move(1, 0, maze)
+    return player.rect.right
+
+
+def test_breakable_wall_blocks_every_persona():
+    for persona in (PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA):
+        maze = Maze(CORRIDOR)
+        player = Player(*maze.start_pos)
+        player.set_persona(persona)
+        assert walk_right(player, maze) == 3 * TILE_SIZE # 모라도 투명한 벽과 달리 통과하지 못함
+
+
+def test_erida_breaks_wall():
+    maze = Maze(CORRIDOR)
+    player = Player(*maze.start_pos)
+    player.set_persona(PERSONA_ERIDA)
+    walk_right(player, maze)
+    player.break_wall(maze) # 마지막으로 이동한 방향(오른쪽)의 벽을 부숨
+    assert maze.grid[1][3] == " "
+    assert walk_right(player, maze) == 5 * TILE_SIZE # 부서진 벽을 지나 투명한 벽 앞에서 멈춤
+
+    player.set_persona(PERSONA_MORA)
+    assert walk_right(player, maze) == 8 * TILE_SIZE # 모라는 투명한 벽을 지나 탈출구까지 이동
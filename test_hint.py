@@ -0,0 +1,82 @@
+
+# test_hint.py
+# 카이론의 힌트에 쓰이는 탈출구까지의 거리장(Maze.distance_field, Maze.hint_path)을 검사하는 테스트 파일입니다.
+# 부서지지 않은 벽(B)을 비용을 더해 지나가는지, 벽을 부수고 되돌릴 때 부분 갱신한 거리장이 새로 계산한 거리장과 같은지 확인합니다.
+#
+# 실행 방법: python -m pytest
+
+import random
+import numpy as np
+from config import *
+from maze import Maze, TILE_WALL, TILE_BREAKABLE
+from game_state import GameState, Inputs
+from generator import generate_tiles
+
+# 부술 수 있는 벽을 지나는 짧은 길과, 한 줄 아래로 돌아가는 긴 길이 있는 레벨
+SHORTCUT = [
+    "XXXXXXX",
+    "XP B EX",
+    "X     X",
+    "XXXXXXX",
+]
+
+
+def check_hint(maze, path):
+    """
+    힌트 경로가 한 칸씩 이어지고 일반 벽을 지나지 않으며 탈출구에서 끝나는지 확인하고, 경로의 힌트 비용을 반환합니다.
+    """
+    assert path[-1] == maze.end_pos
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        assert abs(ax - bx) + abs(ay - by) == 1
+        assert maze.tiles[by, bx] != TILE_WALL
+    return sum(int(maze.hint_cost[y, x]) for x, y in path[1:])
+
+
+def test_hint_passes_unbroken_walls():
+    # 탈출구가 부술 수 있는 벽 너머에만 있는 생성 미로에서도 시작 위치부터 힌트가 있어야 합니다.
+    for seed in range(20):
+        maze = Maze(generate_tiles(41, 31, seed=seed, feature_density=0.3))
+        path = maze.hint_path(maze.start_pos)
+        assert path is not None and path[0] == maze.start_pos
+        assert check_hint(maze, path) == maze.distance_field[maze.start_pos[1], maze.start_pos[0]]
+
+
+def test_hint_weighs_breakable_walls():
+    maze = Maze(SHORTCUT)
+    path = maze.hint_path(maze.start_pos)
+    assert (3, 1) not in path # 벽을 부수는 것보다 한 줄 아래로 돌아가는 편이 쌈
+    assert check_hint(maze, path) == 6
+
+    assert maze.break_wall_at(3, 1)
+    path = maze.hint_path(maze.start_pos)
+    assert (3, 1) in path and check_hint(maze, path) == 4
+    assert maze.restore_wall_at(3, 1)
+    assert np.array_equal(maze.distance_field, maze._build_distance_field())
+
+
+def test_incremental_updates_match_rebuild():
+    for seed in range(3):
+        maze = Maze(generate_tiles(41, 31, seed=seed, feature_density=0.3))
+        walls = [(int(x), int(y)) for y, x in np.argwhere(maze.tiles == TILE_BREAKABLE)]
+        assert walls
+        rng = random.Random(seed)
+        rng.shuffle(walls)
+        for x, y in walls:
+            assert maze.break_wall_at(x, y)
+            assert np.array_equal(maze.distance_field, maze._build_distance_field())
+        rng.shuffle(walls)
+        for x, y in walls:
+            assert maze.restore_wall_at(x, y)
+            assert np.array_equal(maze.distance_field, maze._build_distance_field())
+
+
+def test_hint_without_path_keeps_cooldown():
+    inputs = Inputs()
+    inputs.hint = True
+    state = GameState([["XXXXXX", "XP XEX", "XXXXXX"]]) # 일반 벽으로 탈출구와 막힌 시작 위치
+    state.step(inputs)
+    assert state.hint_timer == 0 and state.hint_cooldown_timer == 0 and not state.used_hint
+
+    state = GameState([SHORTCUT])
+    state.step(inputs)
+    assert state.visible_hint() is not None and state.hint_cooldown_timer > 0 and state.used_hint
@@ -0,0 +1,54 @@
+
+# test_levelpack.py
+# 레벨 팩(levelpack.py)의 인코딩/해독과 파일 저장/읽기가 원래 타일을 그대로 되돌려 주는지 검사하는 테스트 파일입니다.
+#
+# 실행 방법: python -m pytest
+
+import numpy as np
+from maze import level_to_tiles
+from levelpack import write_pack, LevelPack, LevelPreloader, encode_rle, decode_rle, encode_packed, decode_packed
+from generator import generate_tiles
+from levels import LEVELS
+
+
+def sample_levels():
+    """
+    기본 레벨, 여러 크기의 생성 레벨, 한 구간 최대 길이(MAX_RUN)보다 긴 빈 구간이 있는 레벨을 타일 배열로 반환합니다.
+    """
+    levels = [level_to_tiles(level) for level in LEVELS]
+    levels += [generate_tiles(width, height, seed=seed) for seed, (width, height) in enumerate(((5, 5), (37, 21), (300, 260)))]
+    empty = np.full((300, 300), ord(" "), dtype=np.uint8)
+    empty[0, 0], empty[-1, -1] = ord("P"), ord("E")
+    levels.append(empty)
+    return levels
+
+
+def test_encodings_round_trip():
+    for tiles in sample_levels():
+        height, width = tiles.shape
+        assert np.array_equal(decode_rle(encode_rle(tiles), width, height), tiles)
+        packed = encode_packed(tiles)
+        if packed is not None:
+            assert np.array_equal(decode_packed(packed, width, height), tiles)
+
+
+def test_pack_round_trip(tmp_path):
+    levels = sample_levels()
+    path = str(tmp_path / "levels.pmlp")
+    assert write_pack(path, iter(levels)) == len(levels)
+    with LevelPack(path) as pack:
+        assert len(pack) == len(levels)
+        for index in range(len(levels) - 1, -1, -1): # 순서와 관계없이 한 레벨씩 해독
+            assert np.array_equal(pack[index], levels[index])
+        assert np.array_equal(pack[-1], levels[-1])
+
+
+def test_preloader_builds_same_maze(tmp_path):
+    path = str(tmp_path / "levels.pmlp")
+    write_pack(path, LEVELS)
+    with LevelPack(path) as pack:
+        preloader = LevelPreloader(pack)
+        preloader.preload(1)
+        maze = preloader.get(1)
+        preloader.shutdown()
+        assert np.array_equal(maze.tiles, level_to_tiles(LEVELS[1]))
@@ -0,0 +1,102 @@
+
+# test_pathfinder.py
+# 계층적 경로 탐색(pathfinder.py)과 Maze.find_path를 검사하는 테스트 파일입니다.
+# 계층 없는 A*(Maze.find_path_flat)를 기준으로 경로의 유효성과 힌트 비용(Maze.hint_cost의 합)을 비교합니다.
+#
+# 실행 방법: python -m pytest
+
+import random
+from config import *
+from maze import Maze, TILE_WALL
+from pathfinder import HierarchicalPathfinder
+from generator import generate_tiles
+from levels import LEVELS
+
+MAX_DETOUR = 1.5 # 계층적 경로의 비용이 최소 비용의 이 배수를 넘지 않아야 함 (출입구를 구간마다 하나만 두므로 최소보다 클 수 있음)
+
+
+def check_path(maze, path, start, end):
+    """
+    경로가 시작점에서 끝점까지 한 칸씩 이어지고 일반 벽(X)을 지나지 않는지 확인하고, 경로의 힌트 비용을 반환합니다.
+    """
+    assert path[0] == start and path[-1] == end
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        assert abs(ax - bx) + abs(ay - by) == 1
+        assert maze.tiles[by, bx] != TILE_WALL
+    return sum(int(maze.hint_cost[y, x]) for x, y in path[1:])
+
+
+def corridor_level(width, height, gate):
+    """
+    가운데 세로 벽에 gate 타일 하나만 뚫린 레벨을 만듭니다. (왼쪽 위에서 시작, 오른쪽 아래가 탈출구)
+    """
+    rows = []
+    for y in range(height):
+        row = [" "] * width
+        row[width // 2] = gate if y == height // 2 else "X"
+        rows.append(row)
+    rows[0][0] = "P"
+    rows[-1][-1] = "E"
+    return ["".join(row) for row in rows]
+
+
+def test_small_levels_use_flat_search():
+    for level in LEVELS:
+        maze = Maze(level)
+        assert maze.find_path(maze.start_pos, maze.end_pos) == maze.find_path_flat(maze.start_pos, maze.end_pos)
+        assert maze.pathfinder is None
+
+
+def test_large_maze_builds_graph_lazily():
+    maze = Maze(generate_tiles(64, 64, seed=0))
+    assert maze.pathfinder is None # 레벨을 불러올 때는 만들지 않음
+    path = maze.find_path(maze.start_pos, maze.end_pos)
+    pathfinder = maze.pathfinder
+    assert pathfinder is not None and path is not None
+    assert 0 < len(pathfinder.graphs) <= pathfinder.clusters_x * pathfinder.clusters_y
+
+
+def test_close_to_flat_search():
+    for seed in range(5):
+        maze = Maze(generate_tiles(72, 48, seed=seed, feature_density=0.3))
+        rng = random.Random(seed)
+        open_tiles = [(x, y) for y in range(maze.tile_height) for x in range(maze.tile_width)
+                      if maze.tiles[y, x] != TILE_WALL]
+        for _ in range(10):
+            start, end = rng.choice(open_tiles), rng.choice((rng.choice(open_tiles), maze.end_pos))
+            flat = maze.find_path_flat(start, end)
+            # 같은 끝점으로 두 번째 찾을 때는 미리 계산한 추상 비용을 따라가므로 두 방식 모두 확인합니다.
+            for path in (maze.find_path(start, end), maze.find_path(start, end)):
+                assert (path is None) == (flat is None)
+                if path is not None:
+                    best = check_path(maze, flat, start, end)
+                    assert best <= check_path(maze, path, start, end) <= best * MAX_DETOUR
+
+
+def test_breakable_wall_is_open():
+    maze = Maze(corridor_level(48, 40, "B"))
+    start, end = maze.start_pos, maze.end_pos
+    path = maze.find_path(start, end)
+    assert path is not None and (24, 20) in path # 부술 수 있는 벽을 지나는 길이 유일한 경로
+    cost = check_path(maze, path, start, end)
+    assert cost == check_path(maze, maze.find_path_flat(start, end), start, end)
+
+    # 벽을 부수면 그 벽이 있는 클러스터만 다시 만들어지고 비용이 줄어듭니다.
+    pathfinder = maze.pathfinder
+    built = set(pathfinder.graphs)
+    assert maze.break_wall_at(24, 20)
+    assert built - set(pathfinder.graphs) == {(1, 1)}
+    path = maze.find_path(start, end)
+    assert check_path(maze, path, start, end) == cost - (HINT_BREAKABLE_COST - 1)
+    assert maze.restore_wall_at(24, 20)
+    assert check_path(maze, maze.find_path(start, end), start, end) == cost
+
+
+def test_directed_costs():
+    # 비용이 다른 타일 사이의 간선은 방향에 따라 비용이 다르므로, 어느 방향으로 찾아도 최소 비용과 같아야 합니다.
+    maze = Maze(corridor_level(48, 40, "B"))
+    pathfinder = HierarchicalPathfinder(maze.hint_cost)
+    pathfinder.build(maze.start_pos)
+    for start, end in ((maze.end_pos, maze.start_pos), (maze.start_pos, maze.end_pos)):
+        path = pathfinder.find_path(start, end)
+        assert check_path(maze, path, start, end) == check_path(maze, maze.find_path_flat(start, end), start, end)
@@ -0,0 +1,83 @@
+
+# test_replay.py
+# 입력 기록과 재생(replay.py)을 검사하는 테스트 파일입니다.
+# 무작위 입력으로 게임을 진행하며 기록한 뒤, 저장한 파일을 창 없이 재생하여 마지막 상태가 같은지 확인합니다.
+#
+# 실행 방법: python -m pytest
+
+import random
+from config import *
+from game_state import GameState, Inputs
+from replay import InputRecorder, Recording, replay, verify, encode_inputs, decode_inputs
+from rewind import RewindBuffer
+from generator import generate_tiles
+from levels import LEVELS
+
+
+def random_inputs(rng, inputs):
+    """
+    가끔 방향을 바꾸고 능력 키를 누르는 무작위 입력을 만듭니다.
+    """
+    if rng.random() < 0.08:
+        inputs.dx, inputs.dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1), (0, 0), (1, 1)))
+    inputs.slow = rng.random() < 0.05
+    roll = rng.random()
+    if roll < 0.01:
+        inputs.persona = rng.choice((PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA))
+    elif roll < 0.02:
+        inputs.hint = True
+    elif roll < 0.03:
+        inputs.break_wall = True
+
+
+def record_session(path, levels, ticks, seed, rewind_every=None):
+    """
+    무작위 입력으로 게임을 진행하며 기록하고 파일로 저장합니다. rewind_every를 주면 그 간격마다 조금씩 되감습니다.
+    Returns:
+        GameState: 기록이 끝난 게임 상태
+    """
+    rng = random.Random(seed)
+    state = GameState(levels)
+    recorder = InputRecorder(state)
+    buffer = RewindBuffer(state)
+    inputs = Inputs()
+    for tick in range(ticks):
+        random_inputs(rng, inputs)
+        state.step(inputs)
+        buffer.record(state)
+        recorder.record(inputs)
+        inputs.clear_actions()
+        if rewind_every and tick % rewind_every == rewind_every - 1 and buffer.rewind(state, rng.randint(1, 30)):
+            recorder.rewind(state)
+    recorder.save(path, state)
+    return state
+
+
+def test_input_codes_round_trip():
+    inputs, decoded = Inputs(), Inputs()
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for persona in (None, PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_MORA):
+                inputs.dx, inputs.dy, inputs.persona = dx, dy, persona
+                inputs.slow, inputs.hint, inputs.break_wall = dx > 0, dy > 0, persona is None
+                decode_inputs(encode_inputs(inputs), decoded)
+                assert vars(decoded) == vars(inputs)
+
+
+def test_replay_matches_recording(tmp_path):
+    for seed, levels in enumerate((LEVELS, [generate_tiles(40, 30, seed=3, feature_density=0.3)])):
+        path = str(tmp_path / f"session{seed}.pmrc")
+        state = record_session(path, levels, 4000, seed)
+        recording = Recording(path)
+        assert recording.ticks == 4000
+        replayed = replay(recording, levels)
+        assert verify(recording, replayed) == []
+        assert replayed.tick == state.tick
+
+
+def test_replay_after_rewind(tmp_path):
+    path = str(tmp_path / "rewound.pmrc")
+    state = record_session(path, LEVELS, 4000, 7, rewind_every=250)
+    recording = Recording(path)
+    assert recording.ticks == state.tick # 되돌린 틱의 입력은 기록에서 지워짐
+    assert verify(recording, replay(recording, LEVELS)) == []
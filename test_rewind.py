@@ -0,0 +1,107 @@
+
+# test_rewind.py
+# 되감기(rewind.py)를 검사하는 테스트 파일입니다.
+# 매 틱의 상태를 따로 저장해 두고, 되감은 뒤의 상태가 그 틱에 저장한 상태와 같은지 확인합니다.
+#
+# 실행 방법: python -m pytest
+
+import random
+import numpy as np
+from config import *
+from game_state import GameState, Inputs
+from rewind import RewindBuffer
+from levels import LEVELS
+
+
+def wall_field():
+    """
+    부술 수 있는 벽이 흩어져 있고 움직이는 발판이 지나가는 넓은 방 레벨을 만듭니다.
+    """
+    rows = ["X" * 24]
+    for y in range(1, 17):
+        row = [" "] * 24
+        row[0] = row[-1] = "X"
+        for x in range(1, 23):
+            if x % 4 == 2 and y % 3 == 2:
+                row[x] = "B"
+        if y in (4, 13):
+            row[3] = "H"
+        rows.append("".join(row))
+    rows.append("X" * 24)
+    rows[1] = "XP" + rows[1][2:]
+    rows[16] = rows[16][:-2] + "EX"
+    return rows
+
+
+def snapshot(state):
+    """
+    되감기로 복원되어야 하는 게임 상태를 비교할 수 있는 값으로 모읍니다.
+    """
+    player, maze = state.player, state.maze
+    return (state.tick, state.won, state.level_index, player.rect.topleft, player.persona, player.color, player.speed,
+            player.last_dx, player.last_dy, state.hint_timer, state.hint_cooldown_timer, state.break_wall_cooldown_timer,
+            tuple(maze.broken_walls), maze.tiles.tobytes(), maze.platforms.x.tobytes(), maze.platforms.speed.tobytes(),
+            maze.distance_field.tobytes())
+
+
+def play(level, seed, ticks):
+    """
+    무작위 입력으로 게임을 진행하며 되감기 버퍼에 기록합니다. 에리다로 자주 벽을 부수도록 입력을 고릅니다.
+    Returns:
+        tuple: (게임 상태, 되감기 버퍼, 틱별 입력 리스트, 틱별 상태 딕셔너리)
+    """
+    rng = random.Random(seed)
+    state = GameState([level])
+    buffer = RewindBuffer(state)
+    history = []
+    snapshots = {state.tick: snapshot(state)}
+    dx, dy = 0, 0
+    for tick in range(ticks):
+        inputs = Inputs()
+        if tick == 0:
+            inputs.persona = PERSONA_ERIDA
+        if rng.random() < 0.1:
+            dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+        inputs.dx, inputs.dy = dx, dy
+        roll = rng.random()
+        if roll < 0.02:
+            inputs.persona = rng.choice((PERSONA_CHIRON, PERSONA_ERIDA, PERSONA_ERIDA, PERSONA_MORA))
+        elif roll < 0.2:
+            inputs.break_wall = True
+        elif roll < 0.22:
+            inputs.hint = True
+        state.step(inputs)
+        buffer.record(state)
+        history.append(inputs)
+        snapshots[state.tick] = snapshot(state)
+    return state, buffer, history, snapshots
+
+
+def test_rewind_restores_recorded_ticks():
+    state, buffer, _, snapshots = play(wall_field(), 3, 2400)
+    assert state.maze.broken_walls # 벽을 부수고 되돌리는 경우도 검사
+    assert len(state.maze.platforms)
+    rng = random.Random(2)
+    while len(buffer) > 1:
+        assert buffer.rewind(state, rng.randint(1, 40)) > 0
+        assert snapshot(state) == snapshots[state.tick]
+    assert np.array_equal(state.maze.distance_field, state.maze._build_distance_field())
+
+
+def test_replaying_after_rewind_is_deterministic():
+    level = LEVELS[1] # 움직이는 발판이 있는 레벨
+    state, buffer, history, snapshots = play(level, 3, 900)
+    assert buffer.rewind(state, 500) == 500
+    start = state.tick
+    assert snapshot(state) == snapshots[start]
+    for inputs in history[start:]:
+        state.step(inputs)
+        buffer.record(state)
+        assert snapshot(state) == snapshots[state.tick]
+
+
+def test_level_change_clears_history():
+    state, buffer, _, _ = play(LEVELS[0], 5, 10)
+    state.load_level(0) # 새 미로
+    assert buffer.rewind(state, 5) == 0
+    assert len(buffer) == 0
@@ -0,0 +1,78 @@
+
+# test_solver.py
+# 레벨 풀이기(solver.py)를 검사하는 테스트 파일입니다.
+# 찾은 풀이를 미로의 통과 가능 마스크와 벽 부수기(Maze.break_wall_at)로 한 동작씩 실행하여 탈출구에 도착하는지 확인합니다.
+#
+# 실행 방법: python -m pytest
+
+from config import *
+from maze import Maze
+from solver import solve, validate_levels, DIRECTIONS
+from generator import generate_tiles
+from levels import LEVELS
+
+STEPS = {name: (dx, dy) for name, dx, dy in DIRECTIONS} # 방향 이름 -> 타일 이동량
+
+
+def run_solution(level, solution):
+    """
+    풀이의 동작을 타일 단위로 실행합니다. 이동은 현재 페르소나의 통과 가능 마스크를 따르고, 벽 부수기는 에리다만 할 수 있습니다.
+    Returns:
+        bool: 모든 동작이 규칙에 맞고 마지막 동작 뒤에 탈출구에 도착했는지 여부
+    """
+    maze = Maze(level)
+    (x, y), persona = maze.start_pos, PERSONA_CHIRON
+    for kind, argument in solution.actions:
+        assert (x, y) != maze.end_pos, "reached the exit before the solution ended"
+        if kind == "persona":
+            persona = argument
+        elif kind == "move":
+            dx, dy = STEPS[argument]
+            x, y = x + dx, y + dy
+            if not maze.walkable[persona][y, x]:
+                return False
+        elif kind == "break":
+            dx, dy = STEPS[argument]
+            if persona != PERSONA_ERIDA or not maze.break_wall_at(x + dx, y + dy):
+                return False
+    return (x, y) == maze.end_pos
+
+
+def gated_level(gate):
+    """
+    가운데 세로 벽의 한 칸만 gate 타일인 작은 레벨을 만듭니다.
+    """
+    rows = ["X" * 9]
+    for y in range(1, 6):
+        rows.append("X" + ("P" if y == 1 else " ") + "  " + (gate if y == 3 else "X") + "  " + ("E" if y == 5 else " ") + "X")
+    rows.append("X" * 9)
+    return rows
+
+
+def test_builtin_levels_are_solvable():
+    for level, solution in zip(LEVELS, validate_levels(LEVELS)):
+        assert solution is not None
+        assert run_solution(level, solution)
+
+
+def test_generated_levels_are_solvable():
+    for seed in range(5):
+        level = generate_tiles(24, 18, seed=seed, feature_density=0.2)
+        solution = solve(level)
+        assert solution is not None
+        assert run_solution(level, solution)
+
+
+def test_abilities_are_required():
+    solution = solve(gated_level("B"))
+    assert ("persona", PERSONA_ERIDA) in solution.ability_sequence()
+    assert any(kind == "break" for kind, _ in solution.actions)
+    assert run_solution(gated_level("B"), solution)
+
+    solution = solve(gated_level("T"))
+    assert ("persona", PERSONA_MORA) in solution.ability_sequence()
+    assert run_solution(gated_level("T"), solution)
+
+
+def test_unsolvable_level():
+    assert solve(gated_level("X")) is None